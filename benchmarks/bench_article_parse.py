@@ -0,0 +1,115 @@
+"""
+Image lookup throughput and event-loop lag with each article parse executor.
+
+Resolves images for many rows at high concurrency against the local stand-in
+upstream, whose large article pages make BeautifulSoup parsing the dominant
+cost. For each executor ("inline" parses on the loop, as before; "thread" and
+"process" use a bounded pool) it reports lookups per second and the loop lag
+measured by the Profiler's lag timer.
+
+Usage:
+    python -m benchmarks.bench_article_parse [--animals 300] [--concurrency 50]
+                                             [--executors inline,thread,process] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from src.core.models import ScrapingConfig
+from src.core.scraper import AnimalScraper
+from src.utils.profiling import Profiler
+from tests.fake_upstream import FakeUpstream
+
+EXECUTORS = ("inline", "thread", "process")
+
+
+async def _measure(scraper: AnimalScraper, triples, profile_dir: Path) -> Dict[str, float]:
+    # Only the lag timer matters here; sample rarely so the sampler costs nothing
+    profiler = Profiler(profile_dir, sample_interval=1.0, lag_interval=0.01, slow_callback_duration=10.0)
+    await profiler.start()
+    start = time.perf_counter()
+    records = await scraper._create_animal_entries(triples)
+    seconds = time.perf_counter() - start
+    await profiler.stop()
+
+    assert sum(1 for record in records if record.image_url) == len(triples), "lookups failed"
+    lag = Profiler._lag_summary(profiler.lag)
+    return {
+        "seconds": seconds,
+        "lookups_per_second": len(triples) / seconds,
+        "loop_lag_p50": lag["p50"],
+        "loop_lag_p99": lag["p99"],
+        "loop_lag_max": lag["max"],
+    }
+
+
+def run(
+    animals: int = 300,
+    concurrency: int = 50,
+    executors: List[str] = list(EXECUTORS),
+    workers: int = 4,
+    article_paragraphs: int = 400,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Time ``_create_animal_entries`` with each parse executor.
+
+    Returns:
+        Dict of executor to seconds, lookups per second and loop lag (p50, p99, max)
+    """
+    rows = [(f"Animal {i}", f"adjective{i}") for i in range(animals)]
+    results = {}
+    with FakeUpstream(rows, article_paragraphs=article_paragraphs) as upstream, \
+            tempfile.TemporaryDirectory() as work_dir:
+        triples = [
+            (name, adjective, [f"{upstream.base_url}/wiki/{name.replace(' ', '_')}"]) for name, adjective in rows
+        ]
+        for executor in executors:
+            config = ScrapingConfig(
+                base_url=upstream.list_url,
+                image_dir=Path(work_dir) / "images",
+                max_concurrent_downloads=concurrency,
+                article_parse_executor=executor,
+                article_parse_workers=workers,
+            )
+            results[executor] = asyncio.run(_measure(AnimalScraper(config), triples, Path(work_dir) / executor))
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--animals", type=int, default=300, help="Rows to resolve")
+    arg_parser.add_argument("--concurrency", type=int, default=50, help="Concurrent lookups (max_concurrent_downloads)")
+    arg_parser.add_argument("--executors", default=",".join(EXECUTORS), help="Comma-separated executors to compare")
+    arg_parser.add_argument("--workers", type=int, default=4, help="Parse pool size")
+    arg_parser.add_argument("--article-paragraphs", type=int, default=400, help="Filler paragraphs per article")
+    arg_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = arg_parser.parse_args()
+
+    executors = [executor for executor in args.executors.split(",") if executor]
+    unknown = set(executors) - set(EXECUTORS)
+    if unknown:
+        arg_parser.error(f"unknown executors: {', '.join(sorted(unknown))}")
+
+    results = run(args.animals, args.concurrency, executors, args.workers, args.article_paragraphs)
+    if args.json:
+        print(json.dumps({"animals": args.animals, "concurrency": args.concurrency, "results": results}, indent=2))
+        return
+
+    def ms(value) -> str:
+        return "-" if value is None else f"{value * 1000:.1f}"
+
+    print(f"{'executor':>9} {'seconds':>8} {'lookups/s':>10} {'lag p50 ms':>11} {'lag p99 ms':>11} {'lag max ms':>11}")
+    for executor, data in results.items():
+        print(
+            f"{executor:>9} {data['seconds']:>8.2f} {data['lookups_per_second']:>10.1f} "
+            f"{ms(data['loop_lag_p50']):>11} {ms(data['loop_lag_p99']):>11} {ms(data['loop_lag_max']):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Cold-start import benchmark based on ``python -X importtime``.
+
+Imports each entry module in a fresh interpreter, records the cumulative
+import time reported for it and which heavy dependencies it pulled in, and
+compares the results with a stored baseline like ``benchmarks.run``.
+
+Usage:
+    python -m benchmarks.bench_import [--repeat 5] [--update-baseline]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.run import compare
+
+BENCHMARK_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARK_DIR.parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "import_baseline.json"
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "import_latest.json"
+
+MODULES = [
+    "src.initialization.main",
+    "src.core.parser",
+    "src.core.models",
+    "src.core.scraper",
+    "src.services.report_generator",
+]
+HEAVY_DEPENDENCIES = ["aiohttp", "requests", "bs4", "pydantic", "yaml"]
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure(module: str) -> Tuple[float, List[str]]:
+    """
+    Import ``module`` in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative import time in seconds, heavy dependencies loaded)
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, cwd=PROJECT_ROOT,
+    )
+    cumulative_us = None
+    loaded = set()
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(match.group(2))
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry for {module}")
+    return cumulative_us / 1e6, [dep for dep in HEAVY_DEPENDENCIES if dep in loaded]
+
+
+def run(modules: List[str], repeat: int = 5) -> Dict:
+    """Best-of-``repeat`` import time per module, in the ``benchmarks.run`` result layout."""
+    results = {}
+    for module in modules:
+        timings = [measure(module) for _ in range(repeat)]
+        seconds = min(seconds for seconds, _ in timings)
+        results[module] = {"seconds": seconds, "heavy_dependencies": timings[0][1]}
+        print(f"{module:<32} {seconds * 1000:8.1f} ms  loads: {', '.join(timings[0][1]) or '-'}")
+    return {"python": sys.version.split()[0], "results": {"import": results}}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--modules", default=",".join(MODULES), help="Comma-separated modules to import")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module; the fastest is kept")
+    arg_parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    arg_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare with")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before flagging (fraction)")
+    arg_parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    args = arg_parser.parse_args(argv)
+
+    results = run([module for module in args.modules.split(",") if module], args.repeat)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if not regressions:
+        print("No regressions against baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Benchmark construction and update cost of AnimalEntry versus AnimalRecord.
+
+Usage:
+    python -m benchmarks.bench_models [--count 100000]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict
+
+from src.core.models import AnimalEntry, AnimalRecord, validate_records
+
+
+IMAGE_URL = "https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Cat.jpg/220px-Cat.jpg"
+
+
+def _measure(func: Callable[[], object]) -> float:
+    """Run ``func`` once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(count: int = 100_000) -> Dict[str, float]:
+    """
+    Measure construction, update and boundary validation cost.
+
+    Args:
+        count: Number of entries to build.
+
+    Returns:
+        Dict[str, float]: Seconds per ``count`` entries for each measured operation.
+    """
+    names = [f"Animal {i}" for i in range(count)]
+    entries = []
+    records = []
+
+    results = {
+        "entry_construct": _measure(lambda: entries.extend(
+            AnimalEntry(animal_name=name, collateral_adjective="feline", image_url=IMAGE_URL)
+            for name in names
+        )),
+        "record_construct": _measure(lambda: records.extend(
+            AnimalRecord(name, "feline", IMAGE_URL) for name in names
+        )),
+    }
+
+    def update_entries():
+        for entry in entries:
+            entry.local_image_path = "/tmp/animal_images/cat.jpg"
+
+    def update_records():
+        for record in records:
+            record.local_image_path = "/tmp/animal_images/cat.jpg"
+
+    results["entry_update"] = _measure(update_entries)
+    results["record_update"] = _measure(update_records)
+    results["record_validate_boundary"] = _measure(lambda: validate_records(records))
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--count", type=int, default=100_000, help="Entries per measurement")
+    arg_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = arg_parser.parse_args()
+
+    results = run(args.count)
+    if args.json:
+        print(json.dumps({"count": args.count, "seconds": results}, indent=2))
+        return
+
+    print(f"Cost per {args.count} entries:")
+    for name, seconds in results.items():
+        print(f"  {name:<26} {seconds * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Scaling benchmark for the multi-process sharded mode (1..N worker processes).
+
+Runs image lookup and download against the local stand-in upstream with large
+article pages, so that BeautifulSoup parsing dominates.
+
+Usage:
+    python -m benchmarks.bench_sharding [--animals 400] [--max-workers N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from src.core.models import ScrapingConfig
+from src.core.scraper import AnimalScraper
+from tests.fake_upstream import FakeUpstream
+
+
+async def _collect(config: ScrapingConfig) -> int:
+    return len(await AnimalScraper(config).collect_records())
+
+
+def run(animals: int = 400, max_workers: int = 0, article_paragraphs: int = 400) -> Dict[int, float]:
+    """
+    Time ``collect_records`` for each worker count from 1 to ``max_workers``.
+
+    Args:
+        animals: Number of rows on the stand-in list page
+        max_workers: Highest worker count to try (defaults to the CPU count)
+        article_paragraphs: Filler paragraphs per article, controlling parse cost
+
+    Returns:
+        Dict[int, float]: Seconds per run, keyed by worker count
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    rows = [(f"Animal {i}", f"adjective{i}") for i in range(animals)]
+    results = {}
+    with FakeUpstream(rows, article_paragraphs=article_paragraphs) as upstream:
+        for workers in range(1, max_workers + 1):
+            with tempfile.TemporaryDirectory() as image_dir:
+                config = ScrapingConfig(
+                    base_url=upstream.list_url,
+                    image_dir=Path(image_dir),
+                    worker_processes=workers,
+                    max_concurrent_downloads=50,
+                )
+                start = time.perf_counter()
+                count = asyncio.run(_collect(config))
+                results[workers] = time.perf_counter() - start
+                assert count == animals, f"expected {animals} records, got {count}"
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--animals", type=int, default=400, help="Rows on the list page")
+    arg_parser.add_argument("--max-workers", type=int, default=0, help="Highest worker count (default: CPU count)")
+    arg_parser.add_argument("--article-paragraphs", type=int, default=400, help="Filler paragraphs per article")
+    arg_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = arg_parser.parse_args()
+
+    results = run(args.animals, args.max_workers, args.article_paragraphs)
+    if args.json:
+        print(json.dumps({"animals": args.animals, "seconds": results}, indent=2))
+        return
+
+    baseline = results[1]
+    print(f"{'workers':>8} {'seconds':>10} {'rows/s':>10} {'speedup':>8}")
+    for workers, seconds in results.items():
+        print(f"{workers:>8} {seconds:>10.2f} {args.animals / seconds:>10.1f} {baseline / seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Bytes fetched and parse time of the wikitext source versus the rendered HTML.
+
+Builds the same list page in both formats from the synthetic corpus, checks
+that both parsers return identical triples, and reports the page size (raw and
+gzip-compressed, as it would travel over HTTP) and the best-of-N parse time of
+``parse_wikipedia_page`` and ``parse_wikitext``.
+
+Usage:
+    python -m benchmarks.bench_wikitext [--rows 100,1000,5000] [--repeat 5]
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.corpus import list_page_html, list_page_wikitext, rows_for
+from src.core.parser import AnimalDataParser
+
+
+def _best_time(parse: Callable[[str], list], page: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(page)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(row_counts: List[int] = [100, 1000, 5000], repeat: int = 5) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare both formats for each row count.
+
+    Returns:
+        Dict of row count to {"html": ..., "wikitext": ...}, each with bytes,
+        gzip_bytes and parse_seconds
+    """
+    # The per-table log lines would dominate small runs
+    logging.getLogger("src").setLevel(logging.ERROR)
+    parser = AnimalDataParser()
+    results = {}
+    for count in row_counts:
+        rows = rows_for(count)
+        pages = {"html": list_page_html(rows), "wikitext": list_page_wikitext(rows)}
+        parsers = {"html": parser.parse_wikipedia_page, "wikitext": parser.parse_wikitext}
+        if parsers["html"](pages["html"]) != parsers["wikitext"](pages["wikitext"]):
+            raise AssertionError(f"wikitext and HTML triples differ at {count} rows")
+        results[str(count)] = {
+            page_format: {
+                "bytes": len(page.encode("utf-8")),
+                "gzip_bytes": len(gzip.compress(page.encode("utf-8"))),
+                "parse_seconds": _best_time(parsers[page_format], page, repeat),
+            }
+            for page_format, page in pages.items()
+        }
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--rows", default="100,1000,5000", help="Comma-separated row counts")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Parses per format; the fastest is reported")
+    arg_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = arg_parser.parse_args()
+
+    results = run([int(count) for count in args.rows.split(",") if count], args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'rows':>6} {'format':>9} {'bytes':>10} {'gzip bytes':>11} {'parse ms':>9}")
+    for count, formats in results.items():
+        for page_format, data in formats.items():
+            print(
+                f"{count:>6} {page_format:>9} {data['bytes']:>10} {data['gzip_bytes']:>11} "
+                f"{data['parse_seconds'] * 1000:>9.1f}"
+            )
+        html, wikitext = formats["html"], formats["wikitext"]
+        print(
+            f"{'':>6} {'ratio':>9} {html['bytes'] / wikitext['bytes']:>9.1f}x {html['gzip_bytes'] / wikitext['gzip_bytes']:>10.1f}x "
+            f"{html['parse_seconds'] / wikitext['parse_seconds']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
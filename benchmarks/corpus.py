@@ -0,0 +1,214 @@
+"""
+Synthetic corpus in the shape of Wikipedia's "List of animal names".
+
+Builds list pages with any number of rows (the real rows below, then numbered
+synthetic ones), as rendered HTML or as the wikitext source of the same page,
+and article pages with an infobox image, for the benchmark suite and the local
+stand-in upstream.
+
+Usage:
+    python -m benchmarks.corpus   # regenerate benchmarks/fixtures/
+"""
+
+import html
+from pathlib import Path
+from typing import List, Tuple
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+LIST_PAGE_FIXTURE = FIXTURES_DIR / "list_of_animal_names.html"
+LIST_WIKITEXT_FIXTURE = FIXTURES_DIR / "list_of_animal_names.wikitext"
+
+# (animal, young, female, male, collective noun, collateral adjective(s))
+ROWS: List[Tuple[str, str, str, str, str, str]] = [
+    ("Aardvark", "cub", "sow", "boar", "", "orycteropodian"),
+    ("Albatross", "chick", "", "", "rookery", "diomedeine"),
+    ("Ant", "antling", "queen", "drone", "colony", "formic, myrmecine"),
+    ("Antelope", "calf", "cow", "bull", "herd", "bubaline"),
+    ("Ape", "infant", "", "", "shrewdness", "simian"),
+    ("Ass", "foal", "jenny", "jack", "pace", "asinine"),
+    ("Badger", "kit", "sow", "boar", "cete", "meline"),
+    ("Bat", "pup", "", "", "colony", "chiropteran"),
+    ("Bear", "cub", "sow", "boar", "sleuth", "ursine"),
+    ("Beaver", "kit", "", "", "colony", "castorine, fibrine"),
+    ("Bee", "larva", "queen", "drone", "swarm", "apian"),
+    ("Bird", "chick", "hen", "cock", "flock", "avian"),
+    ("Bison", "calf", "cow", "bull", "herd", "bisontine"),
+    ("Boar", "squeaker", "sow", "boar", "sounder", "aprine"),
+    ("Buffalo", "calf", "cow", "bull", "herd", "bubaline"),
+    ("Butterfly", "caterpillar", "", "", "kaleidoscope", "lepidopteran"),
+    ("Camel", "calf", "cow", "bull", "caravan", "cameline"),
+    ("Cat", "kitten", "queen", "tom", "clowder", "feline"),
+    ("Cattle", "calf", "cow", "bull", "herd", "bovine, taurine"),
+    ("Chicken", "chick", "hen", "rooster", "brood", "galline, gallinaceous"),
+    ("Crab", "zoea", "jenny", "jimmy", "cast", "cancrine"),
+    ("Crane", "chick", "", "", "sedge", "gruine"),
+    ("Crow", "chick", "", "", "murder", "corvine"),
+    ("Deer", "fawn", "doe", "buck", "herd", "cervine"),
+    ("Dog", "puppy", "bitch", "dog", "pack", "canine"),
+    ("Dolphin", "calf", "cow", "bull", "pod", "delphine"),
+    ("Donkey", "foal", "jenny", "jack", "drove", "asinine"),
+    ("Dove", "squab", "", "", "dule", "columbine"),
+    ("Duck", "duckling", "duck", "drake", "paddling", "anatine"),
+    ("Eagle", "eaglet", "", "", "convocation", "aquiline"),
+    ("Eel", "elver", "", "", "swarm", "anguilline"),
+    ("Elephant", "calf", "cow", "bull", "herd", "elephantine"),
+    ("Elk", "calf", "cow", "bull", "gang", "alcine"),
+    ("Falcon", "eyas", "falcon", "tercel", "cast", "falconine"),
+    ("Ferret", "kit", "jill", "hob", "business", "musteline"),
+    ("Fish", "fry", "", "", "school", "piscine"),
+    ("Fox", "kit", "vixen", "tod", "skulk", "vulpine"),
+    ("Frog", "tadpole", "", "", "army", "anurine, ranine"),
+    ("Giraffe", "calf", "cow", "bull", "tower", "camelopardine"),
+    ("Goat", "kid", "nanny", "billy", "trip", "caprine, hircine"),
+    ("Goose", "gosling", "goose", "gander", "gaggle", "anserine"),
+    ("Hare", "leveret", "jill", "jack", "drove", "leporine"),
+    ("Hawk", "eyas", "", "tiercel", "kettle", "accipitrine"),
+    ("Hedgehog", "hoglet", "sow", "boar", "array", "erinaceous"),
+    ("Horse", "foal", "mare", "stallion", "herd", "equine, caballine"),
+    ("Hyena", "cub", "", "", "clan", "hyaenine"),
+    ("Kangaroo", "joey", "doe", "buck", "mob", "macropodine"),
+    ("Lion", "cub", "lioness", "lion", "pride", "leonine"),
+    ("Lobster", "", "hen", "cock", "", "homarine"),
+    ("Mole", "pup", "sow", "boar", "labour", "talpine"),
+    ("Monkey", "infant", "", "", "troop", "simian"),
+    ("Mouse", "pup", "doe", "buck", "mischief", "murine"),
+    ("Otter", "pup", "", "", "romp", "lutrine"),
+    ("Owl", "owlet", "", "", "parliament", "strigine"),
+    ("Ox", "calf", "", "ox", "team", "bovine"),
+    ("Parrot", "chick", "hen", "cock", "pandemonium", "psittacine"),
+    ("Peafowl", "peachick", "peahen", "peacock", "ostentation", "pavonine"),
+    ("Pig", "piglet", "sow", "boar", "drift", "porcine, suilline"),
+    ("Pigeon", "squab", "hen", "cock", "flock", "columbine, peristeronic"),
+    ("Rabbit", "kit", "doe", "buck", "colony", "leporine, cunicular"),
+    ("Rat", "pup", "doe", "buck", "mischief", "murine"),
+    ("Raven", "chick", "", "", "unkindness", "corvine"),
+    ("Seal", "pup", "cow", "bull", "pod", "phocine"),
+    ("Shark", "pup", "", "", "shiver", "selachian"),
+    ("Sheep", "lamb", "ewe", "ram", "flock", "ovine"),
+    ("Snake", "snakelet", "", "", "nest", "anguine, ophidian, serpentine"),
+    ("Sparrow", "chick", "hen", "cock", "host", "passerine"),
+    ("Swan", "cygnet", "pen", "cob", "bevy", "cygnine"),
+    ("Tiger", "cub", "tigress", "tiger", "ambush", "tigrine"),
+    ("Toad", "tadpole", "", "", "knot", "bufonine"),
+    ("Turkey", "poult", "hen", "tom", "rafter", "meleagrine"),
+    ("Turtle", "hatchling", "", "", "bale", "chelonian, testudinal"),
+    ("Wasp", "larva", "queen", "drone", "nest", "vespine"),
+    ("Weasel", "kit", "jill", "hob", "boogle", "musteline"),
+    ("Whale", "calf", "cow", "bull", "pod", "cetacean, cetaceous"),
+    ("Wolf", "pup", "she-wolf", "dog", "pack", "lupine"),
+    ("Zebra", "foal", "mare", "stallion", "dazzle", "hippotigrine"),
+]
+
+_HEADER = (
+    "<tr><th>Animal</th><th>Young</th><th>Female</th><th>Male</th>"
+    "<th>Collective noun</th><th>Collateral adjective</th></tr>"
+)
+
+
+def rows_for(count: int) -> List[Tuple[str, str, str, str, str, str]]:
+    """Return ``count`` rows: the real rows first, then numbered synthetic ones."""
+    rows = ROWS[:count]
+    for index in range(count - len(rows)):
+        base = ROWS[index % len(ROWS)]
+        rows.append((f"{base[0]} {index}",) + base[1:5] + (f"{base[5].split(',')[0]}{index}",))
+    return rows
+
+
+def _row_html(row: Tuple[str, str, str, str, str, str], index: int) -> str:
+    animal, young, female, male, collective, adjectives = row
+    title = animal.replace(" ", "_")
+    cells = [
+        f'<td><a href="/wiki/{html.escape(title)}" title="{html.escape(animal)}">{html.escape(animal)}</a>'
+        f'<sup id="cite_ref-{index}" class="reference"><a href="#cite_note-{index}">[{index}]</a></sup></td>',
+        f"<td>{young}</td>",
+        f"<td>{female}</td>",
+        f"<td>{male}</td>",
+        f'<td><a href="/wiki/Collective_noun" title="Collective noun">{collective}</a></td>' if collective else "<td></td>",
+        f"<td>{adjectives}</td>",
+    ]
+    return "<tr>" + "".join(cells) + "</tr>"
+
+
+def list_page_html(rows: List[Tuple[str, str, str, str, str, str]], rows_per_table: int = 500) -> str:
+    """
+    Render rows as a Wikipedia-style page: navigation chrome, then one sortable
+    wikitable per ``rows_per_table`` rows.
+    """
+    tables = []
+    for start in range(0, len(rows), rows_per_table):
+        body = "".join(_row_html(row, start + i + 1) for i, row in enumerate(rows[start:start + rows_per_table]))
+        tables.append(f'<table class="wikitable sortable"><tbody>{_HEADER}{body}</tbody></table>')
+    navigation = "".join(
+        f'<li><a href="/wiki/Special:Page_{i}" title="Page {i}">Navigation link {i}</a></li>' for i in range(200)
+    )
+    return (
+        '<!DOCTYPE html><html class="client-nojs" lang="en" dir="ltr"><head><meta charset="UTF-8">'
+        "<title>List of animal names - Wikipedia</title></head><body>"
+        f'<div id="mw-navigation"><ul>{navigation}</ul></div>'
+        '<div id="content" class="mw-body"><h1 id="firstHeading">List of animal names</h1>'
+        '<div class="mw-parser-output"><p>In the English language, many animals have different names '
+        "depending on whether they are male, female, young, domesticated, or in groups.</p>"
+        '<table class="wikitable"><tr><th>Term</th><th>Meaning</th></tr>'
+        "<tr><td>Young</td><td>Name for juveniles</td></tr></table>"
+        + "".join(tables)
+        + "</div></div></body></html>"
+    )
+
+
+def _row_wikitext(row: Tuple[str, str, str, str, str, str], index: int) -> str:
+    animal, young, female, male, collective, adjectives = row
+    cells = [
+        f'[[{animal}]]<ref name="r{index}">{{{{cite web |title={animal} |url=https://example.org/{index}}}}}</ref>',
+        young,
+        female,
+        male,
+        f"[[Collective noun|{collective}]]" if collective else "",
+        adjectives,
+    ]
+    return "|-\n| " + " || ".join(cells)
+
+
+def list_page_wikitext(rows: List[Tuple[str, str, str, str, str, str]], rows_per_table: int = 500) -> str:
+    """Render rows as the wikitext source of ``list_page_html(rows, rows_per_table)``."""
+    header = "! Animal !! Young !! Female !! Male !! Collective noun !! Collateral adjective"
+    tables = []
+    for start in range(0, len(rows), rows_per_table):
+        body = "\n".join(_row_wikitext(row, start + i + 1) for i, row in enumerate(rows[start:start + rows_per_table]))
+        tables.append(f'{{| class="wikitable sortable"\n|-\n{header}\n{body}\n|}}\n')
+    return (
+        "{{Short description|Animal names by sex, age and group}}\n"
+        "In the English language, many animals have different names "
+        "depending on whether they are male, female, young, domesticated, or in groups.\n\n"
+        '{| class="wikitable"\n! Term !! Meaning\n|-\n| Young || Name for juveniles\n|}\n\n'
+        + "\n".join(tables)
+        + "\n== References ==\n{{Reflist}}\n"
+    )
+
+
+def article_html(title: str, image_url: str, paragraphs: int = 40) -> str:
+    """Render an article page with an infobox image and ``paragraphs`` of body text."""
+    body = (
+        '<p>The <b>{0}</b> is an <a href="/wiki/Animal" title="Animal">animal</a> described in '
+        '<a href="/wiki/Zoology" title="Zoology">zoology</a> literature.<sup class="reference">'
+        '<a href="#cite_note-1">[1]</a></sup></p>'
+    ).format(html.escape(title.replace("_", " "))) * paragraphs
+    return (
+        f"<!DOCTYPE html><html><head><title>{html.escape(title)} - Wikipedia</title></head><body>"
+        '<div class="mw-parser-output"><table class="infobox biota"><tbody>'
+        f'<tr><td><a href="/wiki/File:{html.escape(title)}.jpg" class="image">'
+        f'<img src="{html.escape(image_url)}" width="220" height="165"></a></td></tr>'
+        "</tbody></table>"
+        f"{body}</div></body></html>"
+    )
+
+
+def main():
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    LIST_PAGE_FIXTURE.write_text(list_page_html(ROWS), encoding="utf-8")
+    print(f"Wrote {LIST_PAGE_FIXTURE}")
+    LIST_WIKITEXT_FIXTURE.write_text(list_page_wikitext(ROWS), encoding="utf-8")
+    print(f"Wrote {LIST_WIKITEXT_FIXTURE}")
+
+
+if __name__ == "__main__":
+    main()
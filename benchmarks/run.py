@@ -0,0 +1,225 @@
+"""
+Offline benchmark suite for the parser, image resolution, downloader and report generator.
+
+Every benchmark runs against generated pages (benchmarks/corpus.py) and the
+local stand-in upstream (tests/fake_upstream.py), so no network is needed.
+Results are written as JSON and compared with a stored baseline; any
+benchmark slower than the baseline by more than the tolerance is reported as
+a regression and the process exits with status 1.
+
+Usage:
+    python -m benchmarks.run [--sizes 1000,10000,100000] [--only parse,report]
+                             [--latency 0.0] [--error-rate 0.0]
+                             [--output benchmarks/results/latest.json]
+                             [--baseline benchmarks/baseline.json] [--tolerance 0.25]
+                             [--update-baseline]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import list_page_html, rows_for
+from src.core.models import AnimalRecord, ScrapingConfig, validate_records
+from src.core.parser import AnimalDataParser
+from src.core.scraper import AnimalScraper
+from src.services.report_generator import HTMLReportGenerator
+from tests.fake_upstream import FakeUpstream
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "latest.json"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+class BenchmarkContext:
+    """Shared state for one suite run: a scratch directory and the stand-in upstream."""
+
+    def __init__(self, work_dir: Path, upstream: FakeUpstream):
+        self.work_dir = work_dir
+        self.upstream = upstream
+
+    def config(self, name: str) -> ScrapingConfig:
+        return ScrapingConfig(
+            base_url=self.upstream.list_url,
+            image_dir=self.work_dir / name / "images",
+            output_file=self.work_dir / name / "report.html",
+            max_concurrent_downloads=50,
+        )
+
+    def article_url(self, animal: str) -> str:
+        return f"{self.upstream.base_url}/wiki/{animal.replace(' ', '_')}"
+
+    def image_url(self, animal: str) -> str:
+        return f"{self.upstream.base_url}/images/{animal.replace(' ', '_')}.jpg"
+
+
+def bench_parse(context: BenchmarkContext, size: int) -> float:
+    html_content = list_page_html(rows_for(size))
+    parser = AnimalDataParser()
+    start = time.perf_counter()
+    triples = parser.parse_wikipedia_page(html_content)
+    elapsed = time.perf_counter() - start
+    assert len(triples) >= size, f"parsed {len(triples)} triples from {size} rows"
+    return elapsed
+
+
+def bench_resolve(context: BenchmarkContext, size: int) -> float:
+    triples = [(row[0], row[5], [context.article_url(row[0])]) for row in rows_for(size)]
+    scraper = AnimalScraper(context.config(f"resolve-{size}"))
+    start = time.perf_counter()
+    asyncio.run(scraper._create_animal_entries(triples))
+    return time.perf_counter() - start
+
+
+def bench_download(context: BenchmarkContext, size: int) -> float:
+    records = [AnimalRecord(row[0], row[5], context.image_url(row[0])) for row in rows_for(size)]
+    scraper = AnimalScraper(context.config(f"download-{size}"))
+    start = time.perf_counter()
+    asyncio.run(scraper._download_images(records))
+    return time.perf_counter() - start
+
+
+def bench_report(context: BenchmarkContext, size: int) -> float:
+    config = context.config(f"report-{size}")
+    image = config.image_dir / "animal.jpg"
+    image.write_bytes(b"\xff\xd8\xff\xe0")
+    entries = validate_records(
+        AnimalRecord(row[0], row[5], context.image_url(row[0]), str(image)) for row in rows_for(size)
+    )
+    generator = HTMLReportGenerator(config)
+    start = time.perf_counter()
+    generator.generate_report(entries, 1.0)
+    return time.perf_counter() - start
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkContext, int], float]] = {
+    "parse": bench_parse,
+    "resolve": bench_resolve,
+    "download": bench_download,
+    "report": bench_report,
+}
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=BENCHMARK_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    names: List[str],
+    sizes: List[int],
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    repeat: int = 1,
+) -> Dict:
+    """
+    Run the selected benchmarks at every size.
+
+    Returns:
+        Dict with run metadata and, per benchmark and size, the best time of
+        ``repeat`` runs in seconds plus the derived per-entry cost.
+    """
+    animals = [(row[0], row[5]) for row in rows_for(max(sizes))]
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as work_dir, \
+            FakeUpstream(animals, latency=latency, error_rate=error_rate) as upstream:
+        context = BenchmarkContext(Path(work_dir), upstream)
+        for name in names:
+            results[name] = {}
+            for size in sizes:
+                seconds = min(BENCHMARKS[name](context, size) for _ in range(repeat))
+                results[name][str(size)] = {
+                    "seconds": seconds,
+                    "us_per_entry": seconds / size * 1e6,
+                    "entries_per_second": size / seconds if seconds else float("inf"),
+                }
+                print(f"{name:<10} {size:>8} {seconds:>10.3f}s {seconds / size * 1e6:>10.1f} us/entry", flush=True)
+    return {
+        "timestamp": time.time(),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "parameters": {"latency": latency, "error_rate": error_rate, "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Compare a run with a baseline.
+
+    Returns:
+        One message per benchmark/size that is slower than the baseline by more
+        than ``tolerance`` (a fraction, e.g. 0.25 for 25%).
+    """
+    regressions = []
+    for name, by_size in results["results"].items():
+        for size, current in by_size.items():
+            reference = baseline.get("results", {}).get(name, {}).get(size)
+            if not reference:
+                continue
+            ratio = current["seconds"] / reference["seconds"] if reference["seconds"] else 1.0
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{name} @ {size}: {current['seconds']:.3f}s vs baseline "
+                    f"{reference['seconds']:.3f}s ({(ratio - 1) * 100:+.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated entry counts")
+    arg_parser.add_argument("--only", default=",".join(BENCHMARKS), help="Comma-separated benchmarks to run")
+    arg_parser.add_argument("--latency", type=float, default=0.0, help="Stand-in upstream latency in seconds")
+    arg_parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of upstream requests that fail")
+    arg_parser.add_argument("--repeat", type=int, default=1, help="Runs per benchmark; the fastest is kept")
+    arg_parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    arg_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare with")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before flagging (fraction)")
+    arg_parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    args = arg_parser.parse_args(argv)
+
+    names = [name for name in args.only.split(",") if name]
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        arg_parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    results = run_suite(names, sizes, args.latency, args.error_rate, args.repeat)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if not regressions:
+        print("No regressions against baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from src.core.models import AnimalRecord
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Pipeline stages in execution order; each checkpoint holds the output of one stage
+STAGES = ("fetch", "parse", "lookup", "download")
+
+FORMAT_VERSION = 2
+
+
+class CheckpointError(Exception):
+    """Raised when a checkpoint is missing or was written for a different run."""
+
+
+def _encode(stage: str, data: Any) -> Any:
+    if stage == "fetch":
+        return data
+    if stage == "parse":
+        return [[name, adjective, links] for name, adjective, links in data]
+    # Records as positional rows in AnimalRecord argument order
+    return [
+        [record.animal_name, record.collateral_adjective, record.image_url, record.local_image_path, record.incomplete]
+        for record in data
+    ]
+
+
+def _decode(stage: str, data: Any) -> Any:
+    if stage == "fetch":
+        return data
+    if stage == "parse":
+        return [(name, adjective, links) for name, adjective, links in data]
+    return [AnimalRecord(*row) for row in data]
+
+
+class CheckpointStore:
+    """
+    Gzip-compressed JSON checkpoints of each pipeline stage's output.
+
+    One file per stage (``<stage>.json.gz``) holds the fetched HTML of every
+    source, the merged triples, or the records after image lookup / download.
+    Each file records the sources it was produced from, so a checkpoint
+    directory cannot silently be resumed against different pages. Files are written to a temporary name and
+    renamed, so an interrupted run never leaves a truncated checkpoint.
+    """
+
+    def __init__(self, directory: Path, source: str):
+        """
+        Args:
+            directory: Directory holding the checkpoint files
+            source: Identifier of the scraped sources (``ScrapingConfig.source_id()``)
+        """
+        self.directory = Path(directory)
+        self.source = source
+
+    def path(self, stage: str) -> Path:
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage {stage!r}; expected one of {', '.join(STAGES)}")
+        return self.directory / f"{stage}.json.gz"
+
+    def has(self, stage: str) -> bool:
+        return self.path(stage).exists()
+
+    def save(self, stage: str, data: Any) -> Path:
+        """
+        Write the output of ``stage`` and drop the checkpoints of later stages,
+        which were derived from the previous output.
+        """
+        path = self.path(stage)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {"version": FORMAT_VERSION, "stage": stage, "source": self.source, "data": _encode(stage, data)}
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+        for later in STAGES[STAGES.index(stage) + 1:]:
+            self.path(later).unlink(missing_ok=True)
+        logger.info(f"Checkpoint written: {path}")
+        return path
+
+    def load(self, stage: str) -> Any:
+        """
+        Read the output of ``stage``.
+
+        Raises:
+            CheckpointError: If the checkpoint is missing, unreadable or belongs to another source.
+        """
+        path = self.path(stage)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            raise CheckpointError(f"No checkpoint for stage '{stage}' in {self.directory}") from None
+        except (OSError, ValueError) as e:
+            raise CheckpointError(f"Unreadable checkpoint {path}: {e}") from e
+
+        if payload.get("version") != FORMAT_VERSION:
+            raise CheckpointError(f"Checkpoint {path} has unsupported version {payload.get('version')!r}")
+        if payload.get("source") != self.source:
+            raise CheckpointError(
+                f"Checkpoint {path} was written for {payload.get('source')}, not {self.source}"
+            )
+        return _decode(stage, payload["data"])
+
+    def last_completed(self) -> Optional[str]:
+        """The latest stage whose checkpoint exists, with all earlier ones present too."""
+        last = None
+        for stage in STAGES:
+            if not self.has(stage):
+                break
+            last = stage
+        return last
@@ -1,7 +1,12 @@
 import tempfile
-from pydantic import BaseModel, Field, HttpUrl, validator
-from typing import Optional
+from pydantic import BaseModel, Field, HttpUrl, ValidationError, parse_obj_as, validator
+from typing import Any, Dict, Iterable, List, Literal, Optional, Union
 from pathlib import Path
+from urllib.parse import urlparse
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 # Pydantic Models for Data Validation
@@ -14,12 +19,15 @@ class AnimalEntry(BaseModel):
         collateral_adjective (str): Collateral adjective related to the animal.
         image_url (Optional[HttpUrl]): URL to the animal's image.
         local_image_path (Optional[str]): Local filesystem path to the downloaded image.
+        incomplete (bool): The run's deadline expired before this entry's image
+            lookup or download finished.
     """
     
     animal_name: str = Field(..., min_length=1, description="Name of the animal")
     collateral_adjective: str = Field(..., min_length=1, description="Collateral adjective")
     image_url: Optional[HttpUrl] = Field(None, description="URL to animal image")
     local_image_path: Optional[str] = Field(None, description="Local path to downloaded image")
+    incomplete: bool = Field(False, description="Unfinished when the deadline expired")
     
     @validator('animal_name', 'collateral_adjective')
     def validate_non_empty_strings(cls, v):
@@ -44,6 +52,147 @@ class AnimalEntry(BaseModel):
         validate_assignment = True
         str_strip_whitespace = True
 
+    @property
+    def has_image(self) -> bool:
+        """Whether an image URL was resolved for this entry."""
+        return self.image_url is not None
+
+
+class AnimalRecord:
+    """
+    Lightweight, unvalidated entry used inside the scraping pipeline.
+
+    Creating and updating an ``AnimalEntry`` runs pydantic validation every time
+    (including ``HttpUrl`` parsing and, with ``validate_assignment``, on each field
+    update). Records carry the same fields in ``__slots__`` and are only converted
+    to ``AnimalEntry`` at the API and export boundaries through ``validate_records``.
+
+    A missing image is always represented by ``image_url = None``. ``incomplete``
+    marks records whose lookup or download was still pending at the deadline.
+    """
+
+    __slots__ = ("animal_name", "collateral_adjective", "image_url", "local_image_path", "incomplete")
+
+    def __init__(
+        self,
+        animal_name: str,
+        collateral_adjective: str,
+        image_url: Optional[str] = None,
+        local_image_path: Optional[str] = None,
+        incomplete: bool = False,
+    ):
+        self.animal_name = animal_name
+        self.collateral_adjective = collateral_adjective
+        self.image_url = image_url
+        self.local_image_path = local_image_path
+        self.incomplete = incomplete
+
+    @property
+    def has_image(self) -> bool:
+        """Whether an image URL was resolved for this record."""
+        return self.image_url is not None
+
+    @classmethod
+    def from_entry(cls, entry: AnimalEntry) -> "AnimalRecord":
+        """Build a record from an already validated ``AnimalEntry``."""
+        return cls(
+            entry.animal_name,
+            entry.collateral_adjective,
+            str(entry.image_url) if entry.image_url is not None else None,
+            entry.local_image_path,
+            entry.incomplete,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record fields as a plain dictionary."""
+        return {
+            "animal_name": self.animal_name,
+            "collateral_adjective": self.collateral_adjective,
+            "image_url": self.image_url,
+            "local_image_path": self.local_image_path,
+            "incomplete": self.incomplete,
+        }
+
+    def to_entry(self) -> AnimalEntry:
+        """
+        Validate the record and convert it to an ``AnimalEntry``.
+
+        Raises:
+            ValidationError: If any field fails validation.
+        """
+        return AnimalEntry(**self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AnimalRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"AnimalRecord(animal_name={self.animal_name!r}, "
+            f"collateral_adjective={self.collateral_adjective!r}, "
+            f"image_url={self.image_url!r}, local_image_path={self.local_image_path!r}, "
+            f"incomplete={self.incomplete!r})"
+        )
+
+
+def _validate_one(record: AnimalRecord) -> Optional[AnimalEntry]:
+    """Validate a single failing record, keeping the entry without its image if only the URL is invalid."""
+    try:
+        return record.to_entry()
+    except ValidationError as e:
+        if record.image_url is None:
+            logger.warning(f"Dropping invalid entry {record.animal_name!r}: {e}")
+            return None
+    try:
+        entry = AnimalEntry(
+            animal_name=record.animal_name,
+            collateral_adjective=record.collateral_adjective,
+            local_image_path=record.local_image_path,
+            incomplete=record.incomplete,
+        )
+    except ValidationError as inner:
+        logger.warning(f"Dropping invalid entry {record.animal_name!r}: {inner}")
+        return None
+    logger.warning(f"Dropping invalid image URL for {record.animal_name!r}: {record.image_url}")
+    return entry
+
+
+def validate_records(records: Iterable[Union[AnimalRecord, AnimalEntry]]) -> List[AnimalEntry]:
+    """
+    Validate pipeline records in bulk and convert them to ``AnimalEntry`` objects.
+
+    All records are validated by a single ``parse_obj_as(List[AnimalEntry], ...)``
+    call. Only when that fails are the rejected records (taken from the error
+    locations) validated one by one: records that fail validation are logged and
+    dropped; an invalid image URL only drops the image, not the whole entry.
+
+    Args:
+        records: Records (or already validated entries) to convert.
+
+    Returns:
+        List[AnimalEntry]: Validated entries, in input order.
+    """
+    records = list(records)
+    pending = [index for index, record in enumerate(records) if not isinstance(record, AnimalEntry)]
+    if not pending:
+        return records
+
+    entries: List[Optional[AnimalEntry]] = list(records)
+    try:
+        validated = parse_obj_as(List[AnimalEntry], [records[index].to_dict() for index in pending])
+    except ValidationError as e:
+        # Error locations are ("__root__", position in the list, field)
+        failed = {pending[error["loc"][1]] for error in e.errors()}
+        valid = [index for index in pending if index not in failed]
+        validated = parse_obj_as(List[AnimalEntry], [records[index].to_dict() for index in valid])
+        for index in failed:
+            entries[index] = _validate_one(records[index])
+        pending = valid
+    for index, entry in zip(pending, validated):
+        entries[index] = entry
+    return [entry for entry in entries if entry is not None]
+
 
 def get_default_tmp_dir() -> Path:
     """
@@ -56,6 +205,77 @@ def get_default_tmp_dir() -> Path:
     return Path(tempfile.gettempdir()) / "animal_images"
 
 
+class SourceConfig(BaseModel):
+    """
+    One list page to parse: either a URL or a saved dump, with its own
+    header rules.
+    
+    Attributes:
+        url (Optional[HttpUrl]): Page to fetch.
+        path (Optional[Path]): Saved HTML (or wikitext) file to read instead of fetching.
+        format (str): "html" for the rendered page, or "wikitext" for its source;
+            wikitext is fetched with ``action=raw`` and is much smaller to download and parse.
+        site_url (Optional[str]): Origin that '/wiki/' links are resolved against;
+            defaults to the origin of ``url``, or English Wikipedia for files.
+        collateral_keywords (Optional[List[str]]): Header keywords of the adjective
+            column; defaults to ``collateral_keywords`` in settings.yaml.
+        trivial_name_keywords (Optional[List[str]]): Header keywords of the animal
+            name column; defaults to ``trivial_name_keywords`` in settings.yaml.
+    """
+    
+    url: Optional[HttpUrl] = Field(default=None, description="List page URL")
+    path: Optional[Path] = Field(default=None, description="Saved HTML dump")
+    format: Literal["html", "wikitext"] = Field(default="html", description="Rendered HTML or wikitext source")
+    site_url: Optional[str] = Field(default=None, description="Origin for resolving article links")
+    collateral_keywords: Optional[List[str]] = Field(default=None, description="Adjective column header keywords")
+    trivial_name_keywords: Optional[List[str]] = Field(default=None, description="Name column header keywords")
+    
+    @validator('path', always=True)
+    def check_one_location(cls, v, values):
+        """
+        Validator to ensure exactly one of 'url' and 'path' is given.
+        
+        Args:
+            v (Optional[Path]): The dump path.
+            values (dict): Previously validated fields.
+            
+        Returns:
+            Optional[Path]: The dump path.
+        """
+        if (values.get('url') is None) == (v is None):
+            raise ValueError("a source needs exactly one of 'url' or 'path'")
+        return v
+    
+    @property
+    def label(self) -> str:
+        """The URL or file path identifying this source."""
+        return self.fetch_url if self.url is not None else str(self.path)
+    
+    @property
+    def fetch_url(self) -> Optional[str]:
+        """
+        The URL to download: ``url`` itself, or for wikitext the ``action=raw``
+        URL of its '/wiki/' page.
+        """
+        if self.url is None:
+            return None
+        if self.format == "html":
+            return str(self.url)
+        from src.core.wikitext import raw_url
+        
+        return raw_url(str(self.url))
+    
+    @property
+    def origin(self) -> str:
+        """Scheme and host that relative links of this source are resolved against."""
+        if self.site_url:
+            return self.site_url
+        if self.url is not None:
+            parsed_url = urlparse(str(self.url))
+            return f"{parsed_url.scheme}://{parsed_url.netloc}"
+        return "https://en.wikipedia.org"
+
+
 class ScrapingConfig(BaseModel):
     """
     Configuration model for the scraping operation.
@@ -66,6 +286,31 @@ class ScrapingConfig(BaseModel):
         output_file (Path): Path for the output HTML report file.
         max_concurrent_downloads (int): Maximum number of concurrent image downloads allowed.
         request_timeout (int): Timeout in seconds for HTTP requests.
+        worker_processes (int): Worker processes for image lookups and downloads;
+            values above 1 enable the sharded multi-process mode.
+        metrics_file (Optional[Path]): Base path for the '.metrics.json' and
+            '.metrics.prom' snapshots; defaults to the output report path.
+        checkpoint_dir (Optional[Path]): Directory for per-stage checkpoints; when set,
+            every stage's output is saved there and a run can be resumed.
+        http_mode (str): "live" to use the network, "record" to also store every
+            response in ``http_archive``, or "replay" to serve all responses from it.
+        http_archive (Optional[Path]): Archive file for the record and replay modes.
+        snapshot_file (Optional[Path]): Snapshot of the previous run's rows; when set,
+            only added or changed rows are looked up and downloaded.
+        source_format (str): "html" or "wikitext"; how ``base_url`` is fetched and
+            parsed when ``sources`` is empty.
+        sources (List[SourceConfig]): List pages and HTML dumps to parse and merge;
+            when empty, ``base_url`` is the only source.
+        parse_processes (Optional[int]): Processes for parsing several sources in
+            parallel; defaults to one per source, up to the CPU count.
+        article_parse_executor (str): Where article pages are parsed during image
+            lookups: "thread" or "process" pools keep the event loop free for I/O;
+            "inline" parses on the loop.
+        article_parse_workers (int): Size of the article parse pool.
+        hedge_percentile (Optional[float]): Latency percentile of recent lookups or
+            downloads after which a slow request is sent a second time; disabled when unset.
+        deadline_seconds (Optional[float]): Time limit for a run; when it expires,
+            outstanding work is cancelled and a report of the finished entries is written.
     """
     
     base_url: HttpUrl = Field(
@@ -92,6 +337,67 @@ class ScrapingConfig(BaseModel):
         le=120,
         description="Request timeout in seconds"
     )
+    worker_processes: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Worker processes for sharded image lookups and downloads"
+    )
+    metrics_file: Optional[Path] = Field(
+        default=None,
+        description="Base path for metrics snapshots (defaults to output_file)"
+    )
+    checkpoint_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for stage checkpoints (disabled when unset)"
+    )
+    http_mode: Literal["live", "record", "replay"] = Field(
+        default="live",
+        description="Use the network, record responses to http_archive, or replay them from it"
+    )
+    http_archive: Optional[Path] = Field(
+        default=None,
+        description="HTTP archive file for the record and replay modes"
+    )
+    snapshot_file: Optional[Path] = Field(
+        default=None,
+        description="Row snapshot for incremental (diff) runs (disabled when unset)"
+    )
+    source_format: Literal["html", "wikitext"] = Field(
+        default="html",
+        description="Fetch and parse base_url as rendered HTML or as wikitext"
+    )
+    sources: List[SourceConfig] = Field(
+        default_factory=list,
+        description="Sources to parse and merge (defaults to base_url alone)"
+    )
+    parse_processes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Processes for parsing multiple sources"
+    )
+    article_parse_executor: Literal["thread", "process", "inline"] = Field(
+        default="thread",
+        description="Pool that article pages are parsed in during image lookups"
+    )
+    article_parse_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Article parse pool size"
+    )
+    hedge_percentile: Optional[float] = Field(
+        default=None,
+        gt=0,
+        lt=100,
+        description="Latency percentile after which requests are hedged (disabled when unset)"
+    )
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="End-to-end time limit for a run (disabled when unset)"
+    )
     
     @validator('image_dir', 'output_file')
     def convert_to_path(cls, v):
@@ -106,6 +412,34 @@ class ScrapingConfig(BaseModel):
         """
         return Path(v) if not isinstance(v, Path) else v
     
+    @validator('http_archive', always=True)
+    def check_http_archive(cls, v, values):
+        """
+        Validator to ensure the record and replay modes have an archive, and that
+        recording is not split across worker processes.
+        
+        Args:
+            v (Optional[Path]): The archive path.
+            values (dict): Previously validated fields.
+            
+        Returns:
+            Optional[Path]: The archive path.
+        """
+        mode = values.get('http_mode', 'live')
+        if mode != 'live' and v is None:
+            raise ValueError(f"http_mode '{mode}' requires http_archive")
+        if mode == 'record' and values.get('worker_processes', 1) > 1:
+            raise ValueError("http_mode 'record' requires worker_processes=1")
+        return v
+    
+    def resolved_sources(self) -> List[SourceConfig]:
+        """The configured sources, or ``base_url`` as the only source."""
+        return self.sources or [SourceConfig(url=self.base_url, format=self.source_format)]
+    
+    def source_id(self) -> str:
+        """Identifies what is scraped; used to match checkpoints, snapshots and shared results."""
+        return " ".join(source.label for source in self.resolved_sources())
+    
     def __init__(self, **data):
         """
         Initializes the ScrapingConfig instance and ensures the image directory exists.
@@ -1,16 +1,35 @@
-from bs4 import BeautifulSoup, Tag
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import re
 import logging
 from src.utils.decorators import timing_decorator
-from src.utils.config_loader import load_config
+from src.utils.config_loader import get_config
 from src.utils.config_loader import clean_text_with_config
+from src.utils.metrics import BYTE_BUCKETS, REGISTRY
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+    from src.core.models import SourceConfig
 
 
 logger = logging.getLogger(__name__)
-config = load_config()
-COLLATERAL_KEYWORDS = config["collateral_keywords"]
-TRIVIAL_NAME_KEYWORDS = config["trivial_name_keywords"]
+
+_CONFIG_CONSTANTS = {
+    "COLLATERAL_KEYWORDS": "collateral_keywords",
+    "TRIVIAL_NAME_KEYWORDS": "trivial_name_keywords",
+}
+
+
+def __getattr__(name: str):
+    """Resolve the header keyword constants from settings.yaml on first access."""
+    if name in _CONFIG_CONSTANTS:
+        return get_config()[_CONFIG_CONSTANTS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+PAGE_BYTES = REGISTRY.histogram("parser_page_bytes", "Size of parsed list pages", buckets=BYTE_BUCKETS)
+TABLES_PARSED = REGISTRY.counter("parser_tables_total", "Tables with a collateral adjective column")
+TABLES_SKIPPED = REGISTRY.counter("parser_tables_skipped_total", "Tables without a collateral adjective column")
+TRIPLES_EXTRACTED = REGISTRY.counter("parser_triples_total", "Animal-adjective-link triples extracted")
 
 class AnimalDataParser:
     """
@@ -18,6 +37,29 @@ class AnimalDataParser:
     the Wikipedia page HTML content of animal names.
     """
 
+    def __init__(
+        self,
+        site_url: str = "https://en.wikipedia.org",
+        collateral_keywords: Optional[List[str]] = None,
+        trivial_name_keywords: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            site_url (str): Scheme and host that relative '/wiki/' links are resolved against.
+            collateral_keywords (Optional[List[str]]): Header keywords of the adjective column
+                (defaults to settings.yaml).
+            trivial_name_keywords (Optional[List[str]]): Header keywords of the animal name column
+                (defaults to settings.yaml).
+        """
+        self.site_url = site_url.rstrip('/')
+        self.collateral_keywords = collateral_keywords
+        self.trivial_name_keywords = trivial_name_keywords
+
+    @classmethod
+    def for_source(cls, source: "SourceConfig") -> "AnimalDataParser":
+        """Create a parser with the link origin and column rules of ``source``."""
+        return cls(source.origin, source.collateral_keywords, source.trivial_name_keywords)
+
     @timing_decorator
     def parse_wikipedia_page(self, html_content: str) -> List[Tuple[str, str, List[str]]]:
         """
@@ -33,6 +75,11 @@ class AnimalDataParser:
                 - collateral_adjective (str)
                 - links (List[str]): List of Wikipedia URLs related to the animal.
         """
+        from bs4 import BeautifulSoup
+
+        PAGE_BYTES.observe(len(html_content))
+        collateral_keywords = self.collateral_keywords or get_config()["collateral_keywords"]
+        trivial_name_keywords = self.trivial_name_keywords or get_config()["trivial_name_keywords"]
         soup = BeautifulSoup(html_content, 'html.parser')
         animal_data = []
 
@@ -44,20 +91,11 @@ class AnimalDataParser:
             if not rows:
                 continue
 
-            header_cells = rows[0].find_all(['th', 'td'])
-            collateral_idx = -1
-            trivial_name_idx = 1  # Animal name usually in column 1
-
-            for idx, cell in enumerate(header_cells):
-                header_text = cell.get_text(strip=True).lower()
-                if any(keyword in header_text for keyword in COLLATERAL_KEYWORDS):
-                    collateral_idx = idx
-                if any(keyword in header_text for keyword in TRIVIAL_NAME_KEYWORDS):
-                    trivial_name_idx = idx
-
-            if collateral_idx == -1:
-                logger.warning(f"Table {i}: No 'Collateral adjective' column found.")
+            header_texts = [cell.get_text(strip=True).lower() for cell in rows[0].find_all(['th', 'td'])]
+            columns = self._find_columns(i, header_texts, collateral_keywords, trivial_name_keywords)
+            if columns is None:
                 continue
+            collateral_idx, trivial_name_idx = columns
 
             for row in rows[1:]:
                 cells = row.find_all(['td', 'th'])
@@ -69,22 +107,112 @@ class AnimalDataParser:
                     continue
 
                 links = self._extract_links_from_cell(cells[trivial_name_idx])
+                for adj in self._split_adjectives(self._extract_text_from_cell(cells[collateral_idx])):
+                    animal_data.append((animal_name, adj, links))
+
+        TRIPLES_EXTRACTED.inc(len(animal_data))
+        logger.info(f"Extracted {len(animal_data)} animal-adjective-link triples")
+        return animal_data
+
+    @timing_decorator
+    def parse_wikitext(self, wikitext: str) -> List[Tuple[str, str, List[str]]]:
+        """
+        Extracts the same (animal_name, collateral_adjective, list_of_links) tuples
+        as ``parse_wikipedia_page`` from the raw wikitext of the page (``action=raw``).
+
+        Links are the targets of ``[[...]]`` links in the name cell, resolved
+        against ``site_url``.
 
-                collateral_cell = cells[collateral_idx]
-                adjectives = [
-                    adj.strip()
-                    for adj in re.split(r"[,\s]+", self._extract_text_from_cell(collateral_cell))
-                    if adj.strip()
-                ]
+        Args:
+            wikitext (str): Raw wikitext of the Wikipedia page.
 
-                for adj in adjectives:
+        Returns:
+            List[Tuple[str, str, List[str]]]: Same tuples as ``parse_wikipedia_page``.
+        """
+        from src.core import wikitext as markup
+
+        PAGE_BYTES.observe(len(wikitext))
+        collateral_keywords = self.collateral_keywords or get_config()["collateral_keywords"]
+        trivial_name_keywords = self.trivial_name_keywords or get_config()["trivial_name_keywords"]
+        animal_data = []
+
+        tables = [
+            rows for attributes, rows in markup.iter_tables(wikitext)
+            if "wikitable" in markup.table_classes(attributes)
+        ]
+        logger.info(f"Found {len(tables)} tables")
+
+        for i, rows in enumerate(tables):
+            if not rows:
+                continue
+
+            header_texts = [" ".join(markup.cell_text(cell).split()).lower() for _, cell in rows[0]]
+            columns = self._find_columns(i, header_texts, collateral_keywords, trivial_name_keywords)
+            if columns is None:
+                continue
+            collateral_idx, trivial_name_idx = columns
+
+            for row in rows[1:]:
+                if len(row) <= max(collateral_idx, trivial_name_idx):
+                    continue
+
+                name_cell = row[trivial_name_idx][1]
+                animal_name = clean_text_with_config(markup.cell_text(name_cell))
+                if not animal_name:
+                    continue
+
+                links = markup.cell_links(name_cell, self.site_url)
+                adjective_text = clean_text_with_config(markup.cell_text(row[collateral_idx][1]))
+                for adj in self._split_adjectives(adjective_text):
                     animal_data.append((animal_name, adj, links))
 
+        TRIPLES_EXTRACTED.inc(len(animal_data))
         logger.info(f"Extracted {len(animal_data)} animal-adjective-link triples")
         return animal_data
 
+    def parse(self, content: str, page_format: str = "html") -> List[Tuple[str, str, List[str]]]:
+        """Parse a list page in ``page_format`` ("html" or "wikitext")."""
+        if page_format == "wikitext":
+            return self.parse_wikitext(content)
+        return self.parse_wikipedia_page(content)
+
+    @staticmethod
+    def _find_columns(
+        table_index: int,
+        header_texts: List[str],
+        collateral_keywords: List[str],
+        trivial_name_keywords: List[str],
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Locates the adjective and animal name columns from the lowercased header texts.
+
+        Returns:
+            Optional[Tuple[int, int]]: (collateral_idx, trivial_name_idx), or None if the
+                table has no collateral adjective column.
+        """
+        collateral_idx = -1
+        trivial_name_idx = 1  # Animal name usually in column 1
+
+        for idx, header_text in enumerate(header_texts):
+            if any(keyword in header_text for keyword in collateral_keywords):
+                collateral_idx = idx
+            if any(keyword in header_text for keyword in trivial_name_keywords):
+                trivial_name_idx = idx
+
+        if collateral_idx == -1:
+            logger.warning(f"Table {table_index}: No 'Collateral adjective' column found.")
+            TABLES_SKIPPED.inc()
+            return None
+        TABLES_PARSED.inc()
+        return collateral_idx, trivial_name_idx
+
+    @staticmethod
+    def _split_adjectives(text: str) -> List[str]:
+        """Splits the cleaned text of an adjective cell into single adjectives."""
+        return [adj.strip() for adj in re.split(r"[,\s]+", text) if adj.strip()]
+
 
-    def _extract_text_from_cell(self, cell: Tag) -> str:
+    def _extract_text_from_cell(self, cell: "Tag") -> str:
         """
         Cleans and extracts text content from a table cell, using configured regex-based cleanup.
 
@@ -98,9 +226,9 @@ class AnimalDataParser:
         return clean_text_with_config(text)
 
 
-    def _extract_links_from_cell(self, cell: Tag) -> List[str]:
+    def _extract_links_from_cell(self, cell: "Tag") -> List[str]:
         """
-        Extracts full Wikipedia URLs from anchor tags within a table cell.
+        Extracts full article URLs (resolved against ``site_url``) from anchor tags within a table cell.
 
         Args:
             cell (Tag): BeautifulSoup Tag object representing a table cell.
@@ -112,5 +240,5 @@ class AnimalDataParser:
         for a_tag in cell.find_all('a', href=True):
             href = a_tag['href']
             if href.startswith('/wiki/'):
-                links.append('https://en.wikipedia.org' + href)
+                links.append(self.site_url + href)
         return links
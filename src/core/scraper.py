@@ -1,69 +1,144 @@
-import aiohttp
 import time
-import requests
 import asyncio
-from typing import List, Optional, Tuple
-from src.core.models import AnimalEntry, ScrapingConfig
-from src.core.parser import AnimalDataParser
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from src.core.checkpoint import STAGES, CheckpointStore
+from src.core.models import AnimalEntry, AnimalRecord, ScrapingConfig, SourceConfig, validate_records
+from src.core.sharding import run_sharded
+from src.core.sources import parse_sources
+from src.core.snapshot import RowDiff, Snapshot, record_diff_metrics, row_hashes
 from pathlib import Path
 
 from src.services.image_downloader import ImageDownloader
-from src.services.image_finder import WikipediaImageFinder
+from src.services.image_finder import WikipediaImageFinder, create_parse_executor, executor_scope
+from src.services.transport import HttpTransport
 from src.services.report_generator import HTMLReportGenerator
 
 from src.utils.decorators import timing_decorator, retry_decorator
+from src.utils.hedging import Hedger
 
 from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    import aiohttp
+    from src.utils.profiling import Profiler
 
 logger = get_logger(__name__)
 
+DEADLINE_EXPIRED = REGISTRY.counter("deadline_expired_total", "Runs cut short by the deadline")
+UNFINISHED_ENTRIES = REGISTRY.gauge("unfinished_entries", "Entries left unfinished by the last deadline")
+
+ProgressCallback = Callable[[str, int, int], None]
+
+# The blocking fallback lookup cannot be cancelled, so it gets a short timeout of its own
+FALLBACK_LOOKUP_TIMEOUT = 5.0
+# Time the parent gives sharded workers beyond the deadline to return their partial shards
+SHARD_GRACE_SECONDS = 2.0
+
+
+class _NoLimit:
+    """Async context manager used when no shared request limiter is configured."""
+    
+    async def __aenter__(self):
+        return None
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def try_acquire(self) -> bool:
+        return True
+    
+    def release(self):
+        pass
+
+
 class AnimalScraper:
-    """Main scraper class that orchestrates the entire operation."""
+    """
+    Main scraper class that orchestrates the entire operation.
+    
+    Each public run method (``scrape_and_generate_report``, ``collect_records``,
+    ``iter_entries`` and ``run_stage``) closes the HTTP transport when it
+    finishes, so no archive file, mapping or session outlives the run; the
+    next run reopens them.
+    """
     
-    def __init__(self, config: Optional[ScrapingConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ScrapingConfig] = None,
+        request_limiter=None,
+        progress_callback: Optional[ProgressCallback] = None,
+        profiler: Optional["Profiler"] = None,
+    ):
+        """
+        Args:
+            config: Scraping configuration (defaults to ScrapingConfig())
+            request_limiter: Optional async context manager (e.g. a semaphore shared
+                between scrapers) entered around every outbound request
+            progress_callback: Optional callable receiving (stage, done, total)
+            profiler: Optional Profiler that attributes samples to pipeline stages
+        """
         self.config = config or ScrapingConfig()
-        self.parser = AnimalDataParser()
-        self.image_finder = WikipediaImageFinder()
-        self.image_downloader = ImageDownloader(self.config)
+        self.request_limiter = request_limiter or _NoLimit()
+        self.progress_callback = progress_callback
+        self.profiler = profiler
+        
+        parsed_url = urlparse(str(self.config.base_url))
+        site_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        self.transport = HttpTransport.from_config(self.config)
+        # Concurrency slots of the running lookup and download stages ("lookup" /
+        # "download"); hedged requests must find a free one here and in the limiter
+        self._stage_slots: Dict[str, asyncio.Semaphore] = {}
+        self.hedger = (
+            Hedger(self.config.hedge_percentile, slots=self._hedge_slots)
+            if self.config.hedge_percentile is not None else None
+        )
+        self.image_finder = WikipediaImageFinder(site_url=site_url, transport=self.transport, hedger=self.hedger)
+        self.image_downloader = ImageDownloader(self.config, self.hedger)
         self.report_generator = HTMLReportGenerator(self.config)
         
+        # Diff mode state: the parsed rows of this run and their diff against the snapshot
+        self._triples: Optional[List[Tuple[str, str, List[str]]]] = None
+        self.last_diff: Optional[RowDiff] = None
+        self._reused: Dict[str, List[AnimalRecord]] = {}
+        
+        # Deadline state: the lookup or download stage in progress and its records so far
+        self._partial: Optional[Tuple[str, List[Optional[AnimalRecord]]]] = None
+        self._deadline: Optional[asyncio.Timeout] = None
+        
         # Ensure the image directory exists
         self.config.image_dir.mkdir(parents=True, exist_ok=True)
     
     @timing_decorator
-    async def scrape_and_generate_report(self) -> Tuple[List[AnimalEntry], Path, float]:
+    async def scrape_and_generate_report(
+        self, resume: bool = False, stream: bool = False
+    ) -> Tuple[List[AnimalEntry], Path, float]:
         """
         Main method to scrape data and generate report.
         
+        Args:
+            resume: Continue after the last stage checkpointed in ``config.checkpoint_dir``
+            stream: Build the report by consuming ``iter_entries`` instead of running
+                the batch stages
+        
         Returns:
             Tuple of (animal_entries, report_path, execution_time)
         """
         start_time = time.time()
         
         try:
-            # Step 1: Fetch and parse Wikipedia page
-            logger.info("Fetching Wikipedia page...")
-            html_content = self._fetch_wikipedia_page()
-            
-            # Step 2: Extract animal-adjective pairs
-            logger.info("Parsing animal data...")
-            animal_adjective_pairs = self.parser.parse_wikipedia_page(html_content)
-            
-            if not animal_adjective_pairs:
-                raise ValueError("No animal-adjective pairs found on the page")
-            
-            # Step 3: Create AnimalEntry objects and find images
-            logger.info("Creating animal entries and finding images...")
-            animal_entries = await self._create_animal_entries(animal_adjective_pairs)
-            
-            # Step 4: Download images
-            logger.info("Downloading images...")
-            animal_entries = await self._download_images(animal_entries)
-            
-            # Step 5: Generate HTML report
+            if stream:
+                animal_entries = self._in_page_order([entry async for entry in self.iter_entries(resume=resume)])
+            else:
+                records = await self.collect_records(resume=resume)
+                
+                # Step 5: Validate once at the API boundary and generate HTML report
+                animal_entries = validate_records(records)
             execution_time = time.time() - start_time
             logger.info("Generating HTML report...")
-            report_path = self.report_generator.generate_report(animal_entries, execution_time)
+            with self._stage("report"):
+                report_path = self.report_generator.generate_report(animal_entries, execution_time)
             
             logger.info(f"Scraping completed successfully in {execution_time:.2f} seconds")
             logger.info(f"Found {len(animal_entries)} animal entries")
@@ -75,12 +150,440 @@ class AnimalScraper:
             execution_time = time.time() - start_time
             logger.error(f"Scraping failed after {execution_time:.2f} seconds: {str(e)}")
             raise
+        
+        finally:
+            self.transport.close()
+            self._write_metrics()
+    
+    async def collect_records(self, resume: bool = False) -> List[AnimalRecord]:
+        """
+        Run the fetch, parse, image lookup and download stages without rendering a report.
+        
+        With ``config.checkpoint_dir`` set, each stage's output is checkpointed as it
+        completes; ``resume`` loads the latest checkpoint and runs only the stages after it.
+        
+        With ``config.deadline_seconds`` set, outstanding lookups and downloads are
+        cancelled when the deadline expires and the records finished so far are
+        returned; records whose work was cut short have ``incomplete`` set.
+        
+        Args:
+            resume: Continue after the last checkpointed stage instead of starting over
+        
+        Returns:
+            List of AnimalRecord objects with image URLs and local paths filled in
+        
+        Raises:
+            TimeoutError: If the deadline expires before the list pages are parsed
+        """
+        checkpoints = self._checkpoint_store()
+        data, remaining = self._resume_point(checkpoints, resume, STAGES)
+        
+        self._partial = None
+        deadline = asyncio.timeout(self.config.deadline_seconds)
+        try:
+            async with deadline:
+                self._deadline = deadline
+                for stage in remaining:
+                    data = await self._run_stage(stage, data, checkpoints)
+                    if stage == "lookup" and self.config.worker_processes > 1:
+                        # Sharded workers download as part of the lookup stage
+                        break
+                return data
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            return self._partial_results()
+        finally:
+            self._deadline = None
+            self.transport.close()
+    
+    async def iter_entries(self, resume: bool = False, buffer_size: Optional[int] = None) -> AsyncIterator[AnimalEntry]:
+        """
+        Yield each entry as soon as its image lookup and download are done.
+        
+        The list pages are fetched and parsed first, checkpointed and resumable as
+        in ``collect_records``. In diff mode, rows reused from the snapshot come
+        first. The other rows are processed by ``config.max_concurrent_downloads``
+        workers and yielded in completion order, not page order.
+        
+        At most ``buffer_size`` finished entries wait for the consumer. While the
+        buffer is full the workers start no new rows, so a slow consumer slows the
+        scrape down instead of piling up entries. Leaving the loop early (``break``,
+        cancellation or ``aclose()``) cancels the outstanding lookups and downloads.
+        
+        The stream always runs in this process and does not checkpoint the lookup
+        and download stages; ``worker_processes`` and ``deadline_seconds`` do not
+        apply (wrap the loop in ``asyncio.timeout`` for a deadline).
+        
+        Args:
+            resume: Skip the fetch and parse stages if they are checkpointed
+            buffer_size: Finished entries held for the consumer (default: max_concurrent_downloads)
+        
+        Yields:
+            Validated AnimalEntry objects
+        """
+        try:
+            checkpoints = self._checkpoint_store()
+            data, remaining = self._resume_point(checkpoints, resume, STAGES[:2])
+            for stage in remaining:
+                data = await self._run_stage(stage, data, checkpoints)
+            self._triples = data
+            pending, reused = self._diff_against_snapshot(data)
+            
+            queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size or self.config.max_concurrent_downloads)
+            producer = asyncio.create_task(self._produce_entries(pending, reused, queue))
+            records = []
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    records.append(item)
+                    for entry in validate_records([item]):
+                        yield entry
+            finally:
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+            
+            self._save_snapshot(self._merge_reused(data, records, reused), checkpoints)
+        finally:
+            self.transport.close()
+    
+    async def _produce_entries(
+        self,
+        triples: List[Tuple[str, str, List[str]]],
+        reused: Dict[str, List[AnimalRecord]],
+        queue: asyncio.Queue,
+    ):
+        """
+        Look up and download rows in a fixed pool of workers, putting each finished
+        record on ``queue``, then None. A failure is put on the queue instead.
+        """
+        # Reused records only need a download if their image file is gone
+        work = iter([
+            *((None, record) for records in reused.values() for record in records),
+            *((triple, None) for triple in triples),
+        ])
+        done = 0
+        total = len(triples) + sum(map(len, reused.values()))
+        self._report_progress("entries", done, total)
+        
+        # One slot per worker; they only run short when hedged requests hold some
+        lookup_slots = self._stage_slots["lookup"] = asyncio.Semaphore(self.config.max_concurrent_downloads)
+        download_slots = self._stage_slots["download"] = asyncio.Semaphore(self.config.max_concurrent_downloads)
+        
+        async def worker(session, download_session, parse_executor):
+            nonlocal done
+            for triple, record in work:
+                if record is None:
+                    animal_name, adjective, links = triple
+                    record = AnimalRecord(animal_name, adjective if adjective.strip() else "N/A", None)
+                    try:
+                        async with lookup_slots:
+                            record.image_url = await self._lookup_image(session, parse_executor, animal_name, links)
+                    except Exception as e:
+                        logger.warning("Error creating entry for %s: %s", animal_name, e)
+                        record = None
+                if record is not None and not (record.local_image_path and Path(record.local_image_path).exists()):
+                    async with download_slots, self.request_limiter:
+                        await self.image_downloader.download_image(download_session, record)
+                done += 1
+                self._report_progress("entries", done, total)
+                if record is not None:
+                    # Blocks while the consumer is behind: backpressure
+                    await queue.put(record)
+        
+        try:
+            parse_executor = create_parse_executor(self.config.article_parse_executor, self.config.article_parse_workers)
+            with executor_scope(parse_executor):
+                async with self.transport.client_session(
+                    self.config.request_timeout,
+                    limit_per_host=self.config.max_concurrent_downloads,
+                    headers={'User-Agent': 'AnimalScraper/1.0'},
+                ) as session, self.transport.client_session(
+                    self.config.request_timeout, limit_per_host=5
+                ) as download_session:
+                    # A failing worker cancels the others before the sessions close
+                    async with asyncio.TaskGroup() as workers:
+                        for _ in range(min(self.config.max_concurrent_downloads, total) or 1):
+                            workers.create_task(worker(session, download_session, parse_executor))
+        except ExceptionGroup as group:
+            await queue.put(group.exceptions[0])
+            return
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+    
+    async def run_stage(self, stage: str):
+        """
+        Run a single stage on the checkpointed output of the stage before it and
+        checkpoint the result.
+        
+        Args:
+            stage: One of ``checkpoint.STAGES``
+        
+        Returns:
+            The stage output (HTML, parsed triples, or records)
+        """
+        checkpoints = self._checkpoint_store()
+        if checkpoints is None:
+            raise ValueError("Running a single stage requires checkpoint_dir to be set")
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage {stage!r}; expected one of {', '.join(STAGES)}")
+        index = STAGES.index(stage)
+        data = checkpoints.load(STAGES[index - 1]) if index else None
+        try:
+            return await self._run_stage(stage, data, checkpoints)
+        finally:
+            self.transport.close()
+    
+    def _in_page_order(self, entries: List[AnimalEntry]) -> List[AnimalEntry]:
+        """Sort streamed entries (completion order) into the order of the parsed rows."""
+        position = {}
+        for index, (animal_name, adjective, _) in enumerate(self._triples or ()):
+            position.setdefault((animal_name, adjective if adjective.strip() else "N/A"), index)
+        return sorted(
+            entries, key=lambda entry: position.get((entry.animal_name, entry.collateral_adjective), len(position))
+        )
+    
+    @staticmethod
+    def _resume_point(checkpoints: Optional[CheckpointStore], resume: bool, stages: Tuple[str, ...]):
+        """
+        The checkpointed data to start from and the ``stages`` still to run.
+        
+        Checkpoints of stages after the last of ``stages`` are not used.
+        
+        Returns:
+            Tuple of (data or None, remaining stages)
+        """
+        if not resume:
+            return None, stages
+        if checkpoints is None:
+            raise ValueError("Resuming requires checkpoint_dir to be set")
+        last = checkpoints.last_completed()
+        if last is None:
+            return None, stages
+        if last not in stages:
+            last = stages[-1]
+        logger.info(f"Resuming after checkpointed stage '{last}'")
+        return checkpoints.load(last), stages[stages.index(last) + 1:]
+    
+    def _checkpoint_store(self) -> Optional[CheckpointStore]:
+        if self.config.checkpoint_dir is None:
+            return None
+        return CheckpointStore(self.config.checkpoint_dir, self.config.source_id())
+    
+    async def _run_stage(self, stage: str, data, checkpoints: Optional[CheckpointStore]):
+        """Run one pipeline stage on the previous stage's output and checkpoint the result."""
+        try:
+            return await self._execute_stage(stage, data, checkpoints)
+        finally:
+            # In record mode, make the responses recorded so far replayable
+            self.transport.flush()
+    
+    async def _execute_stage(self, stage: str, data, checkpoints: Optional[CheckpointStore]):
+        if stage == "fetch":
+            # Step 1: Fetch the list pages (or read saved dumps), one per source
+            sources = self.config.resolved_sources()
+            logger.info(f"Fetching {len(sources)} list page(s)...")
+            with self._stage("fetch"):
+                result = await self._fetch_sources(sources)
+        
+        elif stage == "parse":
+            # Step 2: Extract animal-adjective pairs from every source and merge them
+            logger.info("Parsing animal data...")
+            self._report_progress("parse", 0, 1)
+            with self._stage("parse"):
+                result = await parse_sources(self.config.resolved_sources(), data, self.config.parse_processes)
+            self._report_progress("parse", 1, 1)
+            
+            if not result:
+                raise ValueError("No animal-adjective pairs found on the page")
+        
+        elif stage == "lookup" and self.config.worker_processes > 1:
+            # Steps 3 and 4 run per shard in worker processes
+            self._triples = data
+            pending, reused = self._diff_against_snapshot(data)
+            logger.info(f"Finding and downloading images in {self.config.worker_processes} worker processes...")
+            time_budget = None
+            if self._deadline is not None and self._deadline.when() is not None:
+                # Workers enforce the remaining time themselves and return partial shards
+                time_budget = self._deadline.when() - asyncio.get_running_loop().time()
+                self._deadline.reschedule(None)
+            with self._stage("sharded"):
+                try:
+                    # Bounds the workers in case blocking work keeps one past its own deadline
+                    async with asyncio.timeout(None if time_budget is None else time_budget + SHARD_GRACE_SECONDS):
+                        records = await run_sharded(self.config, pending, self._report_progress, time_budget) if pending else []
+                except TimeoutError:
+                    logger.warning("Sharded workers did not return within %ss of the deadline", SHARD_GRACE_SECONDS)
+                    records = [
+                        AnimalRecord(animal_name, adjective if adjective.strip() else "N/A", None, incomplete=True)
+                        for animal_name, adjective, _ in pending
+                    ]
+            result = self._merge_reused(data, records, reused)
+            if time_budget is not None and any(record.incomplete for record in result):
+                # Partial shards are neither checkpointed nor snapshotted
+                self._log_deadline("sharded", result)
+                return result
+            if checkpoints is not None:
+                checkpoints.save("lookup", result)
+                checkpoints.save("download", result)
+            self._save_snapshot(result, checkpoints)
+            return result
+        
+        elif stage == "lookup":
+            # Step 3: Create AnimalRecord objects and find images
+            self._triples = data
+            pending, reused = self._diff_against_snapshot(data)
+            self._reused = reused
+            logger.info("Creating animal entries and finding images...")
+            with self._stage("lookup"):
+                records = await self._create_animal_entries(pending)
+            result = self._merge_reused(data, records, reused)
+        
+        elif stage == "download":
+            # Step 4: Download images
+            logger.info("Downloading images...")
+            with self._stage("download"):
+                result = await self._download_images(data)
+            self._save_snapshot(result, checkpoints)
+        
+        else:
+            raise ValueError(f"Unknown stage {stage!r}; expected one of {', '.join(STAGES)}")
+        
+        if checkpoints is not None:
+            checkpoints.save(stage, result)
+        return result
+    
+    def _partial_results(self) -> List[AnimalRecord]:
+        """Records of the interrupted stage, with unfinished work marked ``incomplete``."""
+        if self._partial is None:
+            raise TimeoutError(
+                f"Deadline of {self.config.deadline_seconds}s expired before the list pages were parsed"
+            )
+        stage, records = self._partial
+        records = [record for record in records if record is not None]
+        if stage == "lookup":
+            # The download stage never started
+            for record in records:
+                if record.has_image:
+                    record.incomplete = True
+            if self._triples is not None:
+                records = self._merge_reused(self._triples, records, self._reused)
+        self._log_deadline(stage, records)
+        return records
+    
+    def _log_deadline(self, stage: str, records: List[AnimalRecord]):
+        unfinished = sum(1 for record in records if record.incomplete)
+        DEADLINE_EXPIRED.inc()
+        UNFINISHED_ENTRIES.set(unfinished)
+        logger.warning(
+            "Deadline of %ss expired during %s; continuing with %d entries, %d unfinished",
+            self.config.deadline_seconds, stage, len(records), unfinished,
+        )
+    
+    def _diff_against_snapshot(self, triples: List[Tuple[str, str, List[str]]]):
+        """
+        Split parsed triples into those needing image lookups and the records of
+        unchanged rows reused from the previous snapshot (diff mode only).
+        
+        Returns:
+            Tuple of (triples to look up, reused records by animal name)
+        """
+        if self.config.snapshot_file is None:
+            return triples, {}
+        
+        hashes = row_hashes(triples)
+        snapshot = Snapshot.load(self.config.snapshot_file, self.config.source_id())
+        if snapshot is None:
+            self.last_diff = RowDiff(list(hashes), [], [], [])
+            reused = {}
+        else:
+            self.last_diff = snapshot.diff(hashes)
+            reused = {animal_name: snapshot.records(animal_name) for animal_name in self.last_diff.unchanged}
+        record_diff_metrics(self.last_diff)
+        logger.info(
+            "Rows since the last snapshot: %(added)d added, %(removed)d removed, "
+            "%(changed)d changed, %(unchanged)d unchanged",
+            self.last_diff.counts(),
+        )
+        return [triple for triple in triples if triple[0] not in reused], reused
+    
+    @staticmethod
+    def _merge_reused(triples, records: List[AnimalRecord], reused) -> List[AnimalRecord]:
+        """Combine fresh and reused records in page order."""
+        if not reused:
+            return records
+        fresh = {}
+        for record in records:
+            fresh.setdefault(record.animal_name, []).append(record)
+        merged = []
+        for animal_name in dict.fromkeys(triple[0] for triple in triples):
+            merged.extend(reused.get(animal_name) or fresh.get(animal_name, []))
+        return merged
+    
+    def _save_snapshot(self, records: List[AnimalRecord], checkpoints: Optional[CheckpointStore]):
+        """Store the row hashes and records of this run for the next diff (diff mode only)."""
+        if self.config.snapshot_file is None:
+            return
+        triples = self._triples
+        if triples is None and checkpoints is not None and checkpoints.has("parse"):
+            triples = checkpoints.load("parse")
+        if triples is None:
+            logger.warning("Snapshot not updated: the parsed rows of this run are not available")
+            return
+        Snapshot.from_run(triples, records).save(self.config.snapshot_file, self.config.source_id())
+    
+    @contextmanager
+    def _stage(self, name: str):
+        """Record the wall time of a pipeline stage and tag profiler samples with it."""
+        with REGISTRY.histogram("stage_duration_seconds", "Pipeline stage duration", {"stage": name}).time():
+            if self.profiler is None:
+                yield
+            else:
+                with self.profiler.stage(name):
+                    yield
+    
+    def _write_metrics(self):
+        """Write JSON and Prometheus metrics snapshots for this run."""
+        try:
+            json_path, prom_path = REGISTRY.write(self.config.metrics_file or self.config.output_file)
+            logger.info(f"Metrics written to {json_path} and {prom_path}")
+        except OSError as e:
+            logger.warning(f"Could not write metrics snapshot: {str(e)}")
+    
+    def _report_progress(self, stage: str, done: int, total: int):
+        """Forward stage progress to the configured callback, if any."""
+        if self.progress_callback is not None:
+            self.progress_callback(stage, done, total)
+    
+    async def _fetch_sources(self, sources: List[SourceConfig]) -> List[str]:
+        """Fetch or read the HTML of every source concurrently, in source order."""
+        done = 0
+        self._report_progress("fetch", done, len(sources))
+        
+        async def fetch(source: SourceConfig) -> str:
+            nonlocal done
+            if source.path is not None:
+                page = await asyncio.to_thread(source.path.read_text, encoding="utf-8")
+            else:
+                async with self.request_limiter:
+                    page = await asyncio.to_thread(self._fetch_page, source.fetch_url)
+            done += 1
+            self._report_progress("fetch", done, len(sources))
+            return page
+        
+        return list(await asyncio.gather(*(fetch(source) for source in sources)))
     
     @retry_decorator(max_retries=3, delay=2.0)
-    def _fetch_wikipedia_page(self) -> str:
-        """Fetch the Wikipedia page content."""
-        response = requests.get(
-            str(self.config.base_url),
+    def _fetch_page(self, url: str) -> str:
+        """Fetch a list page."""
+        response = self.transport.requests_session().get(
+            url,
             timeout=self.config.request_timeout,
             headers={'User-Agent': 'AnimalScraper/1.0 (Educational Purpose)'}
         )
@@ -88,83 +591,127 @@ class AnimalScraper:
         return response.text
     
     @timing_decorator
-    async def _create_animal_entries(self, data_list: List[Tuple[str, str, List[str]]]) -> List[AnimalEntry]:
-        timeout = aiohttp.ClientTimeout(total=self.config.request_timeout)
-        connector = aiohttp.TCPConnector(limit_per_host=self.config.max_concurrent_downloads)
+    async def _create_animal_entries(self, data_list: List[Tuple[str, str, List[str]]]) -> List[AnimalRecord]:
+        """Resolve an image URL for every parsed triple and build pipeline records."""
+        semaphore = self._stage_slots["lookup"] = asyncio.Semaphore(self.config.max_concurrent_downloads)
+        done = 0
+        total = len(data_list)
+        self._report_progress("lookup", done, total)
 
-        semaphore = asyncio.Semaphore(self.config.max_concurrent_downloads)
+        # Placeholders, filled in as lookups finish, so a deadline can report what is done
+        records: List[Optional[AnimalRecord]] = [
+            AnimalRecord(animal_name, adjective if adjective.strip() else "N/A", None, incomplete=True)
+            for animal_name, adjective, _ in data_list
+        ]
+        self._partial = ("lookup", records)
 
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers={'User-Agent': 'AnimalScraper/1.0'}) as session:
+        # Article pages are parsed in a bounded pool; the loop only does the I/O
+        parse_executor = create_parse_executor(self.config.article_parse_executor, self.config.article_parse_workers)
+        
+        with executor_scope(parse_executor):
+            async with self.transport.client_session(
+                self.config.request_timeout,
+                limit_per_host=self.config.max_concurrent_downloads,
+                headers={'User-Agent': 'AnimalScraper/1.0'},
+            ) as session:
 
-            async def create_entry(animal_name, adjective, links):
-                async with semaphore:
-                    try:
-                        image_url = None
+                async def create_entry(index, animal_name, links):
+                    nonlocal done
+                    async with semaphore:
+                        try:
+                            image_url = await self._lookup_image(session, parse_executor, animal_name, links)
+                            records[index].image_url = image_url
+                            records[index].incomplete = False
+                        except Exception as e:
+                            logger.warning("Error creating entry for %s: %s", animal_name, e)
+                            records[index] = None
+                        finally:
+                            done += 1
+                            self._report_progress("lookup", done, total)
 
-                        if links:
-                            image_url = await self.image_finder.find_image_from_url_async(links[0], session)
+                tasks = [
+                    create_entry(index, animal_name, links)
+                    for index, (animal_name, _, links) in enumerate(data_list)
+                ]
 
-                        if not image_url:
-                            image_url = self.image_finder.find_animal_image(animal_name)
+                await asyncio.gather(*tasks)
 
-                        return AnimalEntry(
-                            animal_name=animal_name,
-                            collateral_adjective=adjective if adjective.strip() else "N/A",
-                            image_url=image_url if image_url else "N/A"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Error creating entry for {animal_name}: {str(e)}")
-                        return None
+                return [record for record in records if record is not None]
 
-            tasks = [create_entry(animal_name, adjective, links) for animal_name, adjective, links in data_list]
+    def _hedge_slots(self, kind: str) -> List:
+        """Limiters a hedged request of ``kind`` must take a free slot of."""
+        stage_slots = self._stage_slots.get(kind)
+        return [self.request_limiter] if stage_slots is None else [stage_slots, self.request_limiter]
+    
+    async def _lookup_image(
+        self,
+        session: "aiohttp.ClientSession",
+        parse_executor,
+        animal_name: str,
+        links: List[str],
+    ) -> Optional[str]:
+        """Find the image URL of one row: its first article, then a search by name."""
+        image_url = None
 
-            entries = await asyncio.gather(*tasks)
+        if links:
+            # The limiter covers the request only; the page is parsed after it is released
+            image_url = await self.image_finder.find_image_from_url_async(
+                links[0], session, parse_executor, self.request_limiter
+            )
 
-            return [e for e in entries if e is not None]
+        if not image_url:
+            # The fallback uses blocking requests; keep it off the event loop. The
+            # thread outlives a cancelled lookup, so its timeout ends at the deadline
+            timeout = FALLBACK_LOOKUP_TIMEOUT
+            if self._deadline is not None and self._deadline.when() is not None:
+                timeout = max(0.1, min(timeout, self._deadline.when() - asyncio.get_running_loop().time()))
+            async with self.request_limiter:
+                image_url = await asyncio.to_thread(self.image_finder.find_animal_image, animal_name, timeout)
+
+        return image_url or None
 
     @timing_decorator
-    async def _download_images(self, animal_entries: List[AnimalEntry]) -> List[AnimalEntry]:
-        """Download images for all animal entries."""
-        # Filter entries that have image URLs
-        entries_with_images = [entry for entry in animal_entries if entry.image_url]
+    async def _download_images(self, records: List[AnimalRecord]) -> List[AnimalRecord]:
+        """Download images for all records, updating them in place."""
+        # Filter records that have image URLs, skipping images already on disk
+        # (e.g. records reused from a snapshot)
+        records_with_images = [
+            record for record in records
+            if record.has_image and not (record.local_image_path and Path(record.local_image_path).exists())
+        ]
         
-        if not entries_with_images:
+        if not records_with_images:
             logger.info("No images to download")
-            return animal_entries
+            return records
         
         # Create semaphore to limit concurrent downloads
-        semaphore = asyncio.Semaphore(self.config.max_concurrent_downloads)
+        semaphore = self._stage_slots["download"] = asyncio.Semaphore(self.config.max_concurrent_downloads)
+        done = 0
+        total = len(records_with_images)
+        self._report_progress("download", done, total)
+        
+        # Flags cleared as downloads finish, so a deadline can report what is left
+        for record in records_with_images:
+            record.incomplete = True
+        self._partial = ("download", records)
         
-        async def download_with_semaphore(session: aiohttp.ClientSession, entry: AnimalEntry) -> AnimalEntry:
-            async with semaphore:
-                return await self.image_downloader.download_image(session, entry)
+        async def download_with_semaphore(session: "aiohttp.ClientSession", record: AnimalRecord) -> AnimalRecord:
+            nonlocal done
+            async with semaphore, self.request_limiter:
+                try:
+                    return await self.image_downloader.download_image(session, record)
+                finally:
+                    if not asyncio.current_task().cancelling():
+                        record.incomplete = False
+                    done += 1
+                    self._report_progress("download", done, total)
         
         # Download images concurrently with limited concurrency
-        connector = aiohttp.TCPConnector(limit_per_host=5)
-        timeout = aiohttp.ClientTimeout(total=self.config.request_timeout)
+        async with self.transport.client_session(self.config.request_timeout, limit_per_host=5) as session:
+            tasks = [download_with_semaphore(session, record) for record in records_with_images]
+            await asyncio.gather(*tasks, return_exceptions=True)
         
-        async with aiohttp.ClientSession(
-            connector=connector, 
-            timeout=timeout,
-            headers={'User-Agent': 'AnimalScraper/1.0 (Educational Purpose)'}
-        ) as session:
-            tasks = [download_with_semaphore(session, entry) for entry in entries_with_images]
-            updated_entries = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Replace entries with updated versions, handling exceptions
-        entry_map = {}
-        for i, result in enumerate(updated_entries):
-            if not isinstance(result, Exception):
-                key = entries_with_images[i].animal_name + entries_with_images[i].collateral_adjective
-                entry_map[key] = result
-        
-        # Update the original list of animal entries
-        for i, entry in enumerate(animal_entries):
-            key = entry.animal_name + entry.collateral_adjective
-            if key in entry_map:
-                animal_entries[i] = entry_map[key]
-        
-        images_downloaded = sum(1 for entry in animal_entries if entry.local_image_path)
+        images_downloaded = sum(1 for record in records if record.local_image_path)
         logger.info(f"Successfully downloaded {images_downloaded} images")
         
-        return animal_entries
+        return records
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from src.core.models import AnimalRecord, ScrapingConfig
+from src.services.image_finder import executor_scope
+from src.utils.logger import configure_logging, get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Set in each worker process by _init_worker
+_worker_limiter: Optional["ProcessLimiter"] = None
+
+
+class ProcessLimiter:
+    """
+    Async context manager over a multiprocessing semaphore.
+
+    Lets every worker's event loop draw from one concurrency budget shared by
+    all processes. Acquisition polls with a short backoff instead of blocking,
+    so the worker loop keeps running other tasks while it waits.
+    """
+
+    def __init__(self, semaphore, max_poll_interval: float = 0.05):
+        self._semaphore = semaphore
+        self._max_poll_interval = max_poll_interval
+
+    async def __aenter__(self):
+        delay = 0.001
+        while not self._semaphore.acquire(block=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_poll_interval)
+        return None
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+        return False
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting; False if none is free."""
+        return self._semaphore.acquire(block=False)
+
+    def release(self):
+        self._semaphore.release()
+
+
+def split_shards(items: Sequence[T], shard_count: int) -> List[List[T]]:
+    """
+    Split ``items`` into at most ``shard_count`` contiguous, near-equal shards.
+
+    Concatenating the shards yields ``items`` in their original order.
+    """
+    shard_count = max(1, min(shard_count, len(items)))
+    size, extra = divmod(len(items), shard_count)
+    shards, start = [], 0
+    for index in range(shard_count):
+        end = start + size + (1 if index < extra else 0)
+        shards.append(list(items[start:end]))
+        start = end
+    return shards
+
+
+def _init_worker(semaphore, log_level: int):
+    """Process pool initializer: set up logging and install the shared concurrency budget."""
+    global _worker_limiter
+    configure_logging(logging.getLevelName(log_level), background=False)
+    _worker_limiter = ProcessLimiter(semaphore)
+
+
+def _process_shard(
+    config: ScrapingConfig,
+    triples: List[Tuple[str, str, List[str]]],
+    deadline: Optional[float] = None,
+) -> Tuple[List[AnimalRecord], Dict[str, Dict[str, Any]]]:
+    """
+    Run image lookup and download for one shard on the worker's own event loop.
+
+    With a ``deadline`` (wall-clock ``time.time()`` value), work still running at
+    the deadline is cancelled and the shard's partial records are returned.
+
+    Returns the shard's records and the metrics recorded while processing it.
+    """
+    # Imported here to avoid a circular import with src.core.scraper
+    from src.core.scraper import AnimalScraper
+
+    scraper = AnimalScraper(config.copy(update={"worker_processes": 1}), request_limiter=_worker_limiter)
+
+    async def run() -> List[AnimalRecord]:
+        time_budget = None if deadline is None else max(0.0, deadline - time.time())
+        try:
+            async with asyncio.timeout(time_budget) as timeout:
+                # Lets the blocking fallback lookup cap its request timeout at the deadline
+                scraper._deadline = timeout
+                records = await scraper._create_animal_entries(triples)
+                return await scraper._download_images(records)
+        except TimeoutError:
+            if scraper._partial is None:
+                raise
+            return scraper._partial_results()
+        finally:
+            scraper.transport.close()
+
+    # Workers are reused across shards; only report what this shard recorded
+    REGISTRY.reset()
+    records = asyncio.run(run())
+    return records, REGISTRY.snapshot()
+
+
+async def run_sharded(
+    config: ScrapingConfig,
+    triples: List[Tuple[str, str, List[str]]],
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    time_budget: Optional[float] = None,
+) -> List[AnimalRecord]:
+    """
+    Resolve and download images for ``triples`` in ``config.worker_processes`` processes.
+
+    Each worker runs ``_create_animal_entries`` and ``_download_images`` for its
+    shard on its own event loop. All workers share one semaphore sized by
+    ``config.max_concurrent_downloads``, and the records are returned in the
+    order of ``triples``.
+
+    Args:
+        config: Scraping configuration (must be picklable)
+        triples: Parsed (animal_name, adjective, links) triples
+        progress_callback: Optional callable receiving ("shards", done, total)
+        time_budget: Seconds the workers may take; unfinished records come back ``incomplete``
+
+    Returns:
+        List of AnimalRecord objects in input order
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    shards = split_shards(triples, config.worker_processes)
+    context = multiprocessing.get_context("spawn")
+    semaphore = context.BoundedSemaphore(config.max_concurrent_downloads)
+    loop = asyncio.get_running_loop()
+    # Wall clock, since each worker measures the budget on its own event loop
+    deadline = None if time_budget is None else time.time() + time_budget
+
+    done = 0
+    if progress_callback is not None:
+        progress_callback("shards", done, len(shards))
+
+    def shard_finished(_future):
+        nonlocal done
+        done += 1
+        if progress_callback is not None:
+            progress_callback("shards", done, len(shards))
+
+    pool = ProcessPoolExecutor(
+        max_workers=len(shards),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(semaphore, logging.getLogger().getEffectiveLevel()),
+    )
+    # A cancelled run does not wait for the workers to finish their shards
+    with executor_scope(pool):
+        futures = [loop.run_in_executor(pool, _process_shard, config, shard, deadline) for shard in shards]
+        for future in futures:
+            future.add_done_callback(shard_finished)
+        results = await asyncio.gather(*futures)
+
+    records = []
+    for shard_records, shard_metrics in results:
+        records.extend(shard_records)
+        REGISTRY.merge(shard_metrics)
+    logger.info(f"Merged {len(records)} records from {len(shards)} shards")
+    return records
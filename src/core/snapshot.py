@@ -0,0 +1,141 @@
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.core.models import AnimalRecord
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = 1
+
+Triple = Tuple[str, str, List[str]]
+
+
+def row_hashes(triples: Sequence[Triple]) -> Dict[str, str]:
+    """
+    Hash the parsed triples per list-page row.
+
+    A row is an animal name; its hash covers all of its adjectives and links, in
+    page order, so any edit to the row changes the hash.
+
+    Returns:
+        Dict of animal name to row hash, in page order
+    """
+    rows: Dict[str, List] = {}
+    for animal_name, adjective, links in triples:
+        rows.setdefault(animal_name, []).append([adjective, links])
+    return {
+        animal_name: hashlib.sha1(json.dumps(cells, separators=(",", ":")).encode("utf-8")).hexdigest()
+        for animal_name, cells in rows.items()
+    }
+
+
+class RowDiff:
+    """Rows added, removed, changed and unchanged since the previous snapshot."""
+
+    __slots__ = ("added", "removed", "changed", "unchanged")
+
+    def __init__(self, added: List[str], removed: List[str], changed: List[str], unchanged: List[str]):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.unchanged = unchanged
+
+    def counts(self) -> Dict[str, int]:
+        return {name: len(getattr(self, name)) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return "RowDiff(" + ", ".join(f"{name}={count}" for name, count in self.counts().items()) + ")"
+
+
+class Snapshot:
+    """
+    Row hashes and resulting records of a previous run, stored as gzip JSON.
+
+    Only complete rows (every triple produced a finished record) are stored, so
+    rows that failed last time are treated as added and retried.
+    """
+
+    def __init__(self, rows: Dict[str, Tuple[str, List[AnimalRecord]]]):
+        """
+        Args:
+            rows: Animal name to (row hash, records of that row)
+        """
+        self.rows = rows
+
+    @classmethod
+    def from_run(cls, triples: Sequence[Triple], records: Sequence[AnimalRecord]) -> "Snapshot":
+        hashes = row_hashes(triples)
+        expected: Dict[str, int] = {}
+        for animal_name, _, _ in triples:
+            expected[animal_name] = expected.get(animal_name, 0) + 1
+        by_name: Dict[str, List[AnimalRecord]] = {}
+        for record in records:
+            if not record.incomplete:
+                by_name.setdefault(record.animal_name, []).append(record)
+        return cls({
+            animal_name: (row_hash, by_name[animal_name])
+            for animal_name, row_hash in hashes.items()
+            if len(by_name.get(animal_name, ())) == expected[animal_name]
+        })
+
+    @classmethod
+    def load(cls, path: Path, source: str) -> Optional["Snapshot"]:
+        """Read a snapshot; returns None if there is none for ``source`` yet."""
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable snapshot {path}: {str(e)}")
+            return None
+        if payload.get("version") != FORMAT_VERSION or payload.get("source") != source:
+            logger.warning(f"Ignoring snapshot {path}: written for {payload.get('source')}, not {source}")
+            return None
+        return cls({
+            animal_name: (row_hash, [AnimalRecord(*row) for row in rows])
+            for animal_name, (row_hash, rows) in payload["rows"].items()
+        })
+
+    def save(self, path: Path, source: str):
+        rows = {
+            animal_name: [row_hash, [
+                [r.animal_name, r.collateral_adjective, r.image_url, r.local_image_path] for r in records
+            ]]
+            for animal_name, (row_hash, records) in self.rows.items()
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": FORMAT_VERSION, "source": source, "rows": rows}, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        logger.info(f"Snapshot of {len(rows)} rows written to {path}")
+
+    def diff(self, hashes: Dict[str, str]) -> RowDiff:
+        """Compare the current row hashes with this snapshot."""
+        added, changed, unchanged = [], [], []
+        for animal_name, row_hash in hashes.items():
+            previous = self.rows.get(animal_name)
+            if previous is None:
+                added.append(animal_name)
+            elif previous[0] != row_hash:
+                changed.append(animal_name)
+            else:
+                unchanged.append(animal_name)
+        removed = [animal_name for animal_name in self.rows if animal_name not in hashes]
+        return RowDiff(added, removed, changed, unchanged)
+
+    def records(self, animal_name: str) -> List[AnimalRecord]:
+        """Copies of the stored records of a row."""
+        return [AnimalRecord(**record.to_dict()) for record in self.rows[animal_name][1]]
+
+
+def record_diff_metrics(diff: RowDiff):
+    for change, count in diff.counts().items():
+        REGISTRY.gauge("diff_rows", "Rows by change since the previous snapshot", {"change": change}).set(count)
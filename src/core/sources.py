@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.core.models import SourceConfig
+from src.core.parser import AnimalDataParser
+from src.utils.logger import configure_logging, get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+Triple = Tuple[str, str, List[str]]
+
+
+def merge_triples(per_source: Sequence[Sequence[Triple]]) -> List[Triple]:
+    """
+    Merge the triples of several sources into one list.
+
+    Triples with the same animal name and adjective (ignoring case) are kept
+    once, at their first position, with the links of all duplicates appended.
+    """
+    merged: Dict[Tuple[str, str], Triple] = {}
+    for triples in per_source:
+        for animal_name, adjective, links in triples:
+            key = (animal_name.casefold(), adjective.casefold())
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = (animal_name, adjective, list(links))
+            else:
+                existing[2].extend(link for link in links if link not in existing[2])
+    return list(merged.values())
+
+
+def _init_parse_worker(log_level: int):
+    """Process pool initializer: set up logging in the worker."""
+    configure_logging(logging.getLevelName(log_level), background=False)
+
+
+def _parse_source(source: SourceConfig, page: str) -> Tuple[List[Triple], Dict[str, Dict[str, Any]]]:
+    """
+    Parse one source in a worker process.
+
+    Returns the triples and the parser metrics recorded for this source.
+    """
+    REGISTRY.reset()
+    triples = AnimalDataParser.for_source(source).parse(page, source.format)
+    return triples, REGISTRY.snapshot()
+
+
+async def parse_sources(
+    sources: Sequence[SourceConfig],
+    pages: Sequence[str],
+    processes: Optional[int] = None,
+) -> List[Triple]:
+    """
+    Parse every source with its own column rules and merge the results.
+
+    A single source is parsed in-process. Several sources are parsed in parallel
+    in a process pool of ``processes`` workers (default: one per source, up to
+    the CPU count), and their metrics are merged into this process's registry.
+
+    Args:
+        sources: Source configurations
+        pages: HTML or wikitext of each source, in the same order
+        processes: Pool size; 1 parses all sources in-process
+
+    Returns:
+        Merged, deduplicated triples in source order
+    """
+    if len(sources) != len(pages):
+        raise ValueError(f"Got {len(pages)} pages for {len(sources)} sources")
+
+    workers = min(len(sources), processes or os.cpu_count() or 1)
+    if workers <= 1:
+        per_source = [AnimalDataParser.for_source(source).parse(page, source.format) for source, page in zip(sources, pages)]
+    else:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(logging.getLogger().getEffectiveLevel(),),
+        ) as pool:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _parse_source, source, page) for source, page in zip(sources, pages)
+            ))
+        per_source = []
+        for triples, metrics in results:
+            per_source.append(triples)
+            REGISTRY.merge(metrics)
+
+    for source, triples in zip(sources, per_source):
+        logger.info(f"{source.label}: {len(triples)} triples")
+    merged = merge_triples(per_source)
+    if len(sources) > 1:
+        logger.info(f"Merged {sum(map(len, per_source))} triples from {len(sources)} sources into {len(merged)}")
+    return merged
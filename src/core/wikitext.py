@@ -0,0 +1,213 @@
+"""
+Table extraction from raw MediaWiki wikitext.
+
+A line scanner over the ``{| ... |}`` table syntax: it only looks at table
+lines and never builds a document tree, which makes it much cheaper than
+parsing the rendered HTML of the same page. Cell text and links are derived
+from the markup the list pages actually use (links, templates, references,
+inline HTML and bold/italic quotes).
+"""
+
+import html
+import re
+from typing import Iterator, List, Tuple
+from urllib.parse import quote, urlparse
+
+Row = List[Tuple[bool, str]]
+
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_REF = re.compile(r"<ref[^>]*/>|<ref(?:\s[^>]*)?>.*?</ref\s*>", re.S | re.I)
+_TEMPLATE = re.compile(r"\{\{[^{}]*\}\}")
+_LINK = re.compile(r"\[\[([^\[\]|]*)(?:\|((?:[^\[\]]|\[\[[^\[\]]*\]\])*))?\]\]")
+_EXTERNAL_LINK = re.compile(r"\[(?:https?:)?//[^\s\]]+(?:\s+([^\]]*))?\]")
+_TAG = re.compile(r"<[^>]+>")
+_QUOTES = re.compile(r"'{2,}")
+_CLASS = re.compile(r"""class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"']+))""", re.I)
+
+# Bracket pairs and cell separators, for splitting cells outside links and templates
+_TOKENS = {
+    separator: re.compile(r"\[\[|\]\]|\{\{|\}\}|" + re.escape(separator))
+    for separator in ("||", "!!", "|")
+}
+
+# Links rendered without any text or anchor in the cell
+_HIDDEN_NAMESPACES = ("category:",)
+_MEDIA_NAMESPACES = ("file:", "image:")
+
+# Characters MediaWiki leaves unescaped in article paths
+_TITLE_SAFE = ";@$!*(),/~:#"
+
+
+def _split_top(text: str, separator: str) -> List[str]:
+    """Split ``text`` on ``separator`` outside ``[[...]]`` and ``{{...}}``."""
+    if "[[" not in text and "{{" not in text:
+        return text.split(separator)
+    parts = []
+    depth = 0
+    start = 0
+    for match in _TOKENS[separator].finditer(text):
+        token = match.group()
+        if token in ("[[", "{{"):
+            depth += 1
+        elif token in ("]]", "}}"):
+            depth = max(0, depth - 1)
+        elif depth == 0:
+            parts.append(text[start:match.start()])
+            start = match.end()
+    parts.append(text[start:])
+    return parts
+
+
+def _cell_content(cell: str) -> str:
+    """Drop the ``attributes |`` prefix of a cell, if it has one."""
+    if "|" not in cell:
+        return cell
+    parts = _split_top(cell, "|")
+    if len(parts) > 1 and "=" in parts[0] and "[[" not in parts[0]:
+        return "|".join(parts[1:])
+    return cell
+
+
+def iter_tables(wikitext: str) -> Iterator[Tuple[str, List[Row]]]:
+    """
+    Yield every top-level table of a page.
+
+    Nested tables are kept as part of the cell that contains them.
+
+    Args:
+        wikitext: Raw wikitext of the page
+
+    Yields:
+        Tuples of (table attributes, rows), where each row is a list of
+        (is_header, cell wikitext) pairs in column order
+    """
+    depth = 0
+    attributes = ""
+    rows: List[Row] = []
+    row: Row = []
+    for line in wikitext.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("{|"):
+            depth += 1
+            if depth == 1:
+                attributes, rows, row = stripped[2:].strip(), [], []
+                continue
+        elif stripped.startswith("|}") and depth:
+            depth -= 1
+            if depth == 0:
+                if row:
+                    rows.append(row)
+                yield attributes, rows
+                continue
+            if row:
+                # End of a nested table
+                header, content = row[-1]
+                row[-1] = (header, content + "\n" + line)
+            continue
+        if depth == 0:
+            continue
+        if depth > 1:
+            if row:
+                header, content = row[-1]
+                row[-1] = (header, content + "\n" + line)
+            continue
+
+        if stripped.startswith("|-"):
+            if row:
+                rows.append(row)
+            row = []
+        elif stripped.startswith("|+"):
+            continue
+        elif stripped.startswith("!"):
+            cells = [part for chunk in _split_top(stripped[1:], "!!") for part in _split_top(chunk, "||")]
+            row.extend((True, _cell_content(cell)) for cell in cells)
+        elif stripped.startswith("|"):
+            row.extend((False, _cell_content(cell)) for cell in _split_top(stripped[1:], "||"))
+        elif row:
+            # Multi-line cell content
+            header, content = row[-1]
+            row[-1] = (header, content + "\n" + line)
+
+
+def raw_url(page_url: str) -> str:
+    """The ``action=raw`` URL that returns the wikitext of a '/wiki/' page."""
+    parsed_url = urlparse(page_url)
+    if "action=raw" in parsed_url.query:
+        return page_url
+    if parsed_url.path.startswith("/wiki/"):
+        title = parsed_url.path[len("/wiki/"):]
+        return f"{parsed_url.scheme}://{parsed_url.netloc}/w/index.php?title={title}&action=raw"
+    separator = "&" if parsed_url.query else "?"
+    return f"{page_url}{separator}action=raw"
+
+
+def table_classes(attributes: str) -> List[str]:
+    """The CSS classes in a table's attribute string."""
+    match = _CLASS.search(attributes)
+    if match is None:
+        return []
+    return next(group for group in match.groups() if group is not None).split()
+
+
+def _strip_hidden(wikitext: str) -> str:
+    """Remove comments, references and templates, which render no cell text or links."""
+    text = _COMMENT.sub("", wikitext)
+    text = _REF.sub(" ", text)
+    if "{{" in text:
+        count = 1
+        while count:
+            text, count = _TEMPLATE.subn(" ", text)
+    return text
+
+
+def cell_text(wikitext: str) -> str:
+    """
+    The visible text of a cell, with elements separated by spaces as
+    ``get_text(separator=' ')`` does for the rendered HTML.
+    """
+    text = _strip_hidden(wikitext)
+
+    def link_text(match: "re.Match") -> str:
+        target, label = match.group(1).strip(), match.group(2)
+        namespace = target.lower()
+        if namespace.startswith(_HIDDEN_NAMESPACES + _MEDIA_NAMESPACES):
+            return " "
+        if label is None:
+            return target.lstrip(":")
+        return label
+
+    if "[[" in text:
+        text = _LINK.sub(link_text, text)
+    if "[" in text:
+        text = _EXTERNAL_LINK.sub(lambda match: match.group(1) or " ", text)
+    if "<" in text:
+        text = _TAG.sub(" ", text)
+    if "''" in text:
+        text = _QUOTES.sub("", text)
+    return html.unescape(text)
+
+
+def article_url(site_url: str, target: str) -> str:
+    """The '/wiki/' URL of a link target, normalised the way MediaWiki renders it."""
+    title = target.strip().lstrip(":").replace(" ", "_")
+    title = title[:1].upper() + title[1:]
+    return f"{site_url}/wiki/{quote(title, safe=_TITLE_SAFE)}"
+
+
+def cell_links(wikitext: str, site_url: str) -> List[str]:
+    """
+    Article URLs of the ``[[...]]`` links in a cell, in order.
+
+    Category links and same-page ``[[#section]]`` links are skipped, because
+    they render no '/wiki/' anchor in the cell.
+    """
+    text = _strip_hidden(wikitext)
+    if "[[" not in text:
+        return []
+    links = []
+    for match in _LINK.finditer(text):
+        target = match.group(1).strip()
+        if not target or target.startswith("#") or target.lower().startswith(_HIDDEN_NAMESPACES):
+            continue
+        links.append(article_url(site_url, target))
+    return links
@@ -11,30 +11,277 @@
 
 # main.py
 
-import asyncio
-from src.core.scraper import AnimalScraper
-from src.utils.logger import get_logger
+import argparse
+import json
+import sys
+from pathlib import Path
+from src.utils.logger import configure_logging, get_logger
+
+# Heavy modules (aiohttp, requests, BeautifulSoup, pydantic) are imported inside
+# the subcommand that needs them, so e.g. `parse` never loads the network stack.
 
 logger = get_logger(__name__)
 
-def main():
+COMMANDS = ("run", "parse", "report", "serve", "serve-jobs")
+
+
+def parse_args(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--log-level", default="INFO", help="Log level (default: INFO)")
+    common.add_argument("--log-json", action="store_true", help="Write logs as JSON lines")
+    
+    parser = argparse.ArgumentParser(description="Scrape animal names and collateral adjectives from Wikipedia")
+    commands = parser.add_subparsers(dest="command", metavar="{run,parse,report,serve,serve-jobs}")
+    
+    run = commands.add_parser("run", parents=[common], help="Fetch, parse, download images and write the report (default)")
+    run.add_argument(
+        "--profile",
+        action="store_true",
+        help="Sample the event loop per stage, detect slow callbacks and measure loop lag",
+    )
+    run.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path("profile"),
+        help="Directory for collapsed stacks and the profile report (default: ./profile)",
+    )
+    run.add_argument("--save-entries", type=Path, help="Also write the entries as JSON (input for 'report')")
+    run.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        help="Save each stage's output (fetch, parse, lookup, download) as a gzip JSON checkpoint here",
+    )
+    run.add_argument("--resume", action="store_true", help="Continue after the last checkpointed stage")
+    run.add_argument(
+        "--diff",
+        type=Path,
+        metavar="SNAPSHOT",
+        help="Only look up and download rows added or changed since the snapshot, then update it",
+    )
+    run.add_argument(
+        "--source",
+        action="append",
+        dest="sources",
+        metavar="URL_OR_FILE",
+        help="List page URL or saved HTML file to parse; repeat to merge several sources",
+    )
+    run.add_argument(
+        "--sources-file",
+        type=Path,
+        help="YAML list of sources with per-source url/path, site_url and column keywords",
+    )
+    run.add_argument(
+        "--wikitext",
+        action="store_true",
+        help="Fetch list pages as wikitext (action=raw) and parse that instead of the rendered HTML",
+    )
+    run.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process each row end to end (lookup, then download) instead of stage by stage",
+    )
+    run.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Stop outstanding lookups and downloads after this long and report the finished entries",
+    )
+    run.add_argument(
+        "--hedge-percentile",
+        type=float,
+        metavar="P",
+        help="Send a second request when one takes longer than this latency percentile (e.g. 95)",
+    )
+    http = run.add_mutually_exclusive_group()
+    http.add_argument("--record", type=Path, metavar="ARCHIVE", help="Store every HTTP response in this archive file")
+    http.add_argument("--replay", type=Path, metavar="ARCHIVE", help="Serve every HTTP response from this archive file")
+    run.add_argument(
+        "--stage",
+        choices=("fetch", "parse", "lookup", "download"),
+        help="Run only this stage on the previous stage's checkpoint and checkpoint its output",
+    )
+    
+    parse = commands.add_parser("parse", parents=[common], help="Parse a list page into animal/adjective/link triples")
+    source = parse.add_mutually_exclusive_group()
+    source.add_argument("--input", type=Path, help="Saved HTML file to parse")
+    source.add_argument("--url", help="URL to fetch and parse (default: the configured list page)")
+    parse.add_argument("--wikitext", action="store_true", help="The page is wikitext; --url pages are fetched with action=raw")
+    parse.add_argument("--output", type=Path, help="Write JSON here instead of stdout")
+    
+    report = commands.add_parser("report", parents=[common], help="Render the HTML report from saved entries")
+    report.add_argument("--entries", type=Path, required=True, help="Entries JSON written by 'run --save-entries'")
+    report.add_argument("--output", type=Path, default=Path("animal_report.html"), help="Report path")
+    
+    serve = commands.add_parser("serve", parents=[common], help="Serve a generated report and its images over HTTP")
+    serve.add_argument("--report", type=Path, default=Path("animal_report.html"), help="Report to serve")
+    serve.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    serve.add_argument("--port", type=int, default=8000, help="TCP port to bind")
+    
+    commands.add_parser("serve-jobs", add_help=False, help="Run the multi-user job service (see --help)")
+    
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] == "serve-jobs":
+        return argparse.Namespace(command="serve-jobs", service_argv=argv[1:], log_level=None, log_json=False)
+    if not argv or argv[0] not in COMMANDS + ("-h", "--help"):
+        # Without a subcommand, behave like before and run the full scraper
+        argv.insert(0, "run")
+    args = parser.parse_args(argv)
+    if args.command == "run" and (args.resume or args.stage) and args.checkpoint_dir is None:
+        run.error("--resume and --stage require --checkpoint-dir")
+    return args
+
+
+async def run_scraper(scraper, profile_dir: Path = None, resume: bool = False, stream: bool = False):
+    """Run the scraper, wrapped in a Profiler when ``profile_dir`` is given."""
+    if profile_dir is None:
+        return await scraper.scrape_and_generate_report(resume=resume, stream=stream)
+    
+    # Imported only when profiling so normal runs do not load it
+    from src.utils.profiling import Profiler
+    
+    scraper.profiler = Profiler(profile_dir)
+    await scraper.profiler.start()
     try:
-        logger.info("Starting Animal Scraper...")
-        scraper = AnimalScraper()
+        return await scraper.scrape_and_generate_report(resume=resume, stream=stream)
+    finally:
+        await scraper.profiler.stop()
+        report = scraper.profiler.write_report()
+        print(f"🔬 Profile report: {report}")
+
+
+def command_run(args):
+    import asyncio
+    from src.core.models import ScrapingConfig
+    from src.core.scraper import AnimalScraper
+    
+    logger.info("Starting Animal Scraper...")
+    http_mode = "record" if args.record else "replay" if args.replay else "live"
+    sources = [
+        {"url": source} if source.startswith(("http://", "https://")) else {"path": source}
+        for source in args.sources or []
+    ]
+    source_format = "wikitext" if args.wikitext else "html"
+    for source in sources:
+        source["format"] = source_format
+    if args.sources_file:
+        from src.utils.config_loader import load_config
+        
+        sources.extend(load_config(args.sources_file))
+    scraper = AnimalScraper(ScrapingConfig(
+        sources=sources,
+        source_format=source_format,
+        checkpoint_dir=args.checkpoint_dir,
+        http_mode=http_mode,
+        http_archive=args.record or args.replay,
+        snapshot_file=args.diff,
+        deadline_seconds=args.deadline,
+        hedge_percentile=args.hedge_percentile,
+    ))
+    
+    if args.stage:
+        output = asyncio.run(scraper.run_stage(args.stage))
+        print(f"\n💾 Stage '{args.stage}' done ({len(output)} items); checkpoint in {args.checkpoint_dir}\n")
+        return
+    
+    # Run the async scraping process
+    animal_entries, report_path, exec_time = asyncio.run(
+        run_scraper(scraper, args.profile_dir if args.profile else None, resume=args.resume, stream=args.stream)
+    )
+    
+    if args.save_entries:
+        entries = [entry.dict() for entry in animal_entries]
+        args.save_entries.write_text(json.dumps(entries, default=str, indent=2), encoding="utf-8")
+        from src.services.report_generator import precompress
         
-        # Run the async scraping process
-        animal_entries, report_path, exec_time = asyncio.run(
-            scraper.scrape_and_generate_report()
+        precompress(args.save_entries)
+    
+    logger.info(f"✅ Done! Report generated: {report_path}")
+    print(f"\n🦁 Found {len(animal_entries)} animals.")
+    unfinished = sum(1 for entry in animal_entries if entry.incomplete)
+    if unfinished:
+        print(f"⏰ Deadline reached: {unfinished} entries unfinished")
+    if scraper.last_diff is not None:
+        counts = scraper.last_diff.counts()
+        print(
+            f"🔁 Since the last snapshot: {counts['added']} added, {counts['removed']} removed, "
+            f"{counts['changed']} changed, {counts['unchanged']} unchanged"
         )
+    print(f"📄 Report path: {report_path}")
+    print(f"⏱ Execution time: {exec_time:.2f} seconds\n")
+
+
+def command_parse(args):
+    from src.core.parser import AnimalDataParser
+    
+    if args.input:
+        html_content = args.input.read_text(encoding="utf-8")
+        parser = AnimalDataParser()
+    else:
+        import requests
+        from urllib.parse import urlparse
         
-        logger.info(f"✅ Done! Report generated: {report_path}")
-        print(f"\n🦁 Found {len(animal_entries)} animals.")
-        print(f"📄 Report path: {report_path}")
-        print(f"⏱ Execution time: {exec_time:.2f} seconds\n")
+        url = args.url or "https://en.wikipedia.org/wiki/List_of_animal_names"
+        if args.wikitext:
+            from src.core.wikitext import raw_url
+            
+            url = raw_url(url)
+        response = requests.get(url, timeout=30, headers={'User-Agent': 'AnimalScraper/1.0 (Educational Purpose)'})
+        response.raise_for_status()
+        html_content = response.text
+        parsed_url = urlparse(url)
+        parser = AnimalDataParser(f"{parsed_url.scheme}://{parsed_url.netloc}")
     
+    triples = parser.parse(html_content, "wikitext" if args.wikitext else "html")
+    output = json.dumps(
+        [{"animal_name": name, "collateral_adjective": adjective, "links": links} for name, adjective, links in triples],
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+        print(f"📄 Wrote {len(triples)} triples to {args.output}")
+    else:
+        print(output)
+
+
+def command_report(args):
+    from src.core.models import AnimalRecord, ScrapingConfig, validate_records
+    from src.services.report_generator import HTMLReportGenerator
+    
+    data = json.loads(args.entries.read_text(encoding="utf-8"))
+    entries = validate_records(AnimalRecord(**item) for item in data)
+    report_path = HTMLReportGenerator(ScrapingConfig(output_file=args.output)).generate_report(entries, 0.0)
+    print(f"📄 Report path: {report_path}")
+
+
+def command_serve(args):
+    from src.services.report_server import serve_report
+    
+    serve_report(args.report, args.host, args.port)
+
+
+def command_serve_jobs(args):
+    from src.multi_user.job_service import main as job_service_main
+    
+    job_service_main(args.service_argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command != "serve-jobs":
+        configure_logging(args.log_level, json_output=args.log_json)
+    handlers = {
+        "run": command_run,
+        "parse": command_parse,
+        "report": command_report,
+        "serve": command_serve,
+        "serve-jobs": command_serve_jobs,
+    }
+    try:
+        handlers[args.command](args)
     except Exception as e:
         logger.exception("❌ Scraper failed with error")
         print(f"\n❌ Error: {e}\n")
 
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,416 @@
+import argparse
+import asyncio
+import itertools
+import time
+from collections import OrderedDict, deque
+from enum import Enum
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from aiohttp import web
+from pydantic import ValidationError
+
+from src.core.models import ScrapingConfig
+from src.multi_user.session import UserSession
+from src.multi_user.shared_results import SharedResultStore, get_shared_store
+from src.utils.logger import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a scrape job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+ACTIVE_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class QuotaExceededError(Exception):
+    """Raised when a user already has the maximum number of active jobs."""
+
+
+class Job:
+    """A single scrape job submitted by a user."""
+
+    __slots__ = (
+        "job_id", "user_id", "base_url", "status", "stage", "done", "total",
+        "submitted_at", "started_at", "finished_at", "error", "report_path",
+        "entry_count", "task",
+    )
+
+    def __init__(self, job_id: str, user_id: str, base_url: str):
+        self.job_id = job_id
+        self.user_id = user_id
+        self.base_url = base_url
+        self.status = JobStatus.QUEUED
+        self.stage: Optional[str] = None
+        self.done = 0
+        self.total = 0
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.report_path: Optional[str] = None
+        self.entry_count: Optional[int] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def update_progress(self, stage: str, done: int, total: int):
+        """Progress callback handed to the scraper."""
+        self.stage = stage
+        self.done = done
+        self.total = total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable view of the job."""
+        return {
+            "job_id": self.job_id,
+            "user_id": self.user_id,
+            "base_url": self.base_url,
+            "status": self.status.value,
+            "progress": {"stage": self.stage, "done": self.done, "total": self.total},
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "report_path": self.report_path,
+            "entry_count": self.entry_count,
+        }
+
+
+class FairScheduler:
+    """
+    Queue of pending jobs that hands them out round-robin across users, so a
+    user with many queued jobs cannot starve the others.
+    """
+
+    def __init__(self):
+        self._queues: "OrderedDict[str, Deque[Job]]" = OrderedDict()
+
+    def push(self, job: Job):
+        """Append a job to its user's queue."""
+        self._queues.setdefault(job.user_id, deque()).append(job)
+
+    def pop(self) -> Optional[Job]:
+        """Take the next job from the user whose turn it is, or None if idle."""
+        if not self._queues:
+            return None
+        user_id, queue = next(iter(self._queues.items()))
+        job = queue.popleft()
+        del self._queues[user_id]
+        if queue:
+            # Move the user to the back of the rotation
+            self._queues[user_id] = queue
+        return job
+
+    def remove(self, job: Job) -> bool:
+        """Remove a queued job; returns False if it was not queued."""
+        queue = self._queues.get(job.user_id)
+        if not queue or job not in queue:
+            return False
+        queue.remove(job)
+        if not queue:
+            del self._queues[job.user_id]
+        return True
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+
+class JobService:
+    """
+    Runs scrape jobs from many users on a bounded pool of worker tasks.
+
+    Jobs are scheduled round-robin per user, each user may have at most
+    ``per_user_quota`` queued or running jobs, and all jobs share one semaphore
+    that caps outbound requests across the whole service.
+
+    Finished, failed and cancelled jobs stay queryable for ``job_ttl_seconds``
+    and at most ``max_finished_per_user`` of them are kept per user; older ones
+    are forgotten so a long-running service does not grow without bound.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        per_user_quota: int = 3,
+        max_outbound: int = 20,
+        config: Optional[ScrapingConfig] = None,
+        shared_store: Optional[SharedResultStore] = None,
+        root_dir: Path = Path("/tmp"),
+        job_ttl_seconds: float = 3600.0,
+        max_finished_per_user: int = 50,
+    ):
+        if workers < 1 or per_user_quota < 1 or max_outbound < 1:
+            raise ValueError("workers, per_user_quota and max_outbound must be at least 1")
+        if job_ttl_seconds < 0 or max_finished_per_user < 0:
+            raise ValueError("job_ttl_seconds and max_finished_per_user must not be negative")
+        self.workers = workers
+        self.per_user_quota = per_user_quota
+        self.max_outbound = max_outbound
+        self.config = config or ScrapingConfig()
+        self.shared_store = shared_store or get_shared_store()
+        self.root_dir = Path(root_dir)
+        self.job_ttl_seconds = job_ttl_seconds
+        self.max_finished_per_user = max_finished_per_user
+
+        self.jobs: Dict[str, Job] = {}
+        # Terminal jobs per user, oldest first, for retention
+        self._finished: Dict[str, Deque[Job]] = {}
+        self._notify_tasks: Set[asyncio.Task] = set()
+        self._scheduler = FairScheduler()
+        self._job_ids = itertools.count(1)
+        self._outbound: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Condition] = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start the worker pool on the running event loop."""
+        self._outbound = asyncio.Semaphore(self.max_outbound)
+        self._wakeup = asyncio.Condition()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Job service started with {self.workers} workers")
+
+    async def stop(self):
+        """Cancel queued and running jobs and their scrapes, and stop the worker pool."""
+        running = [job.task for job in self.jobs.values() if job.task is not None]
+        for job in list(self.jobs.values()):
+            if job.status in ACTIVE_STATUSES:
+                self.cancel(job.job_id)
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*running, *self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        await self.shared_store.cancel_inflight()
+
+    def submit(self, user_id: str, base_url: Optional[str] = None) -> Job:
+        """
+        Queue a scrape job for a user.
+
+        Args:
+            user_id: Identifier of the submitting user
+            base_url: Page to scrape (defaults to the service configuration)
+
+        Returns:
+            The queued Job
+
+        Raises:
+            QuotaExceededError: If the user has reached ``per_user_quota`` active jobs
+            ValidationError: If ``base_url`` is not a valid URL
+        """
+        if self._wakeup is None:
+            raise RuntimeError("JobService.start() must be called before submitting jobs")
+
+        active = sum(
+            1 for job in self.jobs.values()
+            if job.user_id == user_id and job.status in ACTIVE_STATUSES
+        )
+        if active >= self.per_user_quota:
+            raise QuotaExceededError(f"User {user_id} already has {active} active jobs")
+
+        if base_url is not None:
+            # Validate the URL up front so bad submissions fail synchronously
+            ScrapingConfig(**{**self.config.dict(), "base_url": base_url})
+
+        self._evict_expired()
+        job = Job(str(next(self._job_ids)), user_id, base_url or str(self.config.base_url))
+        self.jobs[job.job_id] = job
+        self._scheduler.push(job)
+        # Keep a reference so the task is not garbage-collected before it runs
+        task = asyncio.create_task(self._notify())
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+        logger.info(f"Queued job {job.job_id} for user {user_id}")
+        return job
+
+    def get(self, job_id: str) -> Job:
+        """Return a job by id (raises KeyError if unknown or no longer retained)."""
+        self._evict_expired()
+        return self.jobs[job_id]
+
+    def list_jobs(self, user_id: Optional[str] = None) -> List[Job]:
+        """Return all retained jobs, optionally restricted to one user."""
+        self._evict_expired()
+        return [job for job in self.jobs.values() if user_id is None or job.user_id == user_id]
+
+    def cancel(self, job_id: str) -> Job:
+        """
+        Cancel a queued or running job; finished jobs are returned unchanged.
+
+        Raises:
+            KeyError: If the job id is unknown
+        """
+        job = self.jobs[job_id]
+        if job.status == JobStatus.QUEUED and self._scheduler.remove(job):
+            self._finish(job, JobStatus.CANCELLED)
+        elif job.status == JobStatus.RUNNING and job.task is not None:
+            job.task.cancel()
+        return job
+
+    async def _notify(self):
+        async with self._wakeup:
+            self._wakeup.notify()
+
+    async def _worker(self):
+        """Pull jobs from the fair scheduler and run them one at a time."""
+        while True:
+            async with self._wakeup:
+                job = self._scheduler.pop()
+                while job is None:
+                    await self._wakeup.wait()
+                    job = self._scheduler.pop()
+
+            job.status = JobStatus.RUNNING
+            job.started_at = time.time()
+            job.task = asyncio.create_task(self._run(job))
+            # Waiting (rather than awaiting the task directly) keeps the worker
+            # alive when only the job's task is cancelled.
+            await asyncio.wait([job.task])
+
+    async def _run(self, job: Job):
+        """Execute one job through a UserSession backed by the shared store."""
+        try:
+            config = self.config.copy(update={"base_url": job.base_url})
+            session = UserSession(
+                job.user_id,
+                config,
+                shared_store=self.shared_store,
+                root_dir=self.root_dir,
+                request_limiter=self._outbound,
+            )
+            entries, report_path, _ = await session.run_scraping_session(job.update_progress)
+            job.entry_count = len(entries)
+            job.report_path = str(report_path)
+            self._finish(job, JobStatus.SUCCEEDED)
+        except asyncio.CancelledError:
+            self._finish(job, JobStatus.CANCELLED)
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {str(e)}")
+            job.error = str(e)
+            self._finish(job, JobStatus.FAILED)
+
+    def _finish(self, job: Job, status: JobStatus):
+        job.status = status
+        job.finished_at = time.time()
+        job.task = None
+        logger.info(f"Job {job.job_id} for user {job.user_id} {status.value}")
+
+        finished = self._finished.setdefault(job.user_id, deque())
+        finished.append(job)
+        while len(finished) > self.max_finished_per_user:
+            self._forget(finished.popleft())
+        self._evict_expired()
+
+    def _evict_expired(self):
+        """Forget terminal jobs that finished more than ``job_ttl_seconds`` ago."""
+        cutoff = time.time() - self.job_ttl_seconds
+        for user_id, finished in list(self._finished.items()):
+            while finished and finished[0].finished_at <= cutoff:
+                self._forget(finished.popleft())
+            if not finished:
+                del self._finished[user_id]
+
+    def _forget(self, job: Job):
+        self.jobs.pop(job.job_id, None)
+
+
+def create_app(service: JobService) -> web.Application:
+    """
+    Build the HTTP API for a JobService.
+
+    Routes:
+        POST   /jobs            submit {"user_id": ..., "base_url": optional}
+        GET    /jobs            list jobs (optional ?user_id=)
+        GET    /jobs/{job_id}   job status and progress
+        DELETE /jobs/{job_id}   cancel a job
+    """
+    routes = web.RouteTableDef()
+
+    def job_or_404(request: web.Request) -> Job:
+        try:
+            return service.get(request.match_info["job_id"])
+        except KeyError:
+            raise web.HTTPNotFound(text="Unknown job id")
+
+    @routes.post("/jobs")
+    async def submit_job(request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise web.HTTPBadRequest(text="Request body must be JSON")
+        user_id = payload.get("user_id") if isinstance(payload, dict) else None
+        if not isinstance(user_id, str) or not user_id:
+            raise web.HTTPBadRequest(text="'user_id' is required")
+        try:
+            job = service.submit(user_id, payload.get("base_url"))
+        except QuotaExceededError as e:
+            raise web.HTTPTooManyRequests(text=str(e))
+        except ValidationError as e:
+            raise web.HTTPBadRequest(text=str(e))
+        return web.json_response(job.to_dict(), status=202)
+
+    @routes.get("/jobs")
+    async def list_jobs(request: web.Request) -> web.Response:
+        jobs = service.list_jobs(request.query.get("user_id"))
+        return web.json_response([job.to_dict() for job in jobs])
+
+    @routes.get("/jobs/{job_id}")
+    async def get_job(request: web.Request) -> web.Response:
+        return web.json_response(job_or_404(request).to_dict())
+
+    @routes.delete("/jobs/{job_id}")
+    async def cancel_job(request: web.Request) -> web.Response:
+        job = job_or_404(request)
+        return web.json_response(service.cancel(job.job_id).to_dict())
+
+    async def on_startup(app: web.Application):
+        await service.start()
+
+    async def on_cleanup(app: web.Application):
+        await service.stop()
+
+    app = web.Application()
+    app.add_routes(routes)
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+
+def main(argv: Optional[List[str]] = None):
+    arg_parser = argparse.ArgumentParser(description="Run the multi-user scrape job service")
+    arg_parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    arg_parser.add_argument("--port", type=int, default=8080, help="TCP port to bind")
+    arg_parser.add_argument("--unix-socket", help="Serve on this Unix socket instead of TCP")
+    arg_parser.add_argument("--workers", type=int, default=4, help="Concurrent jobs")
+    arg_parser.add_argument("--per-user-quota", type=int, default=3, help="Active jobs allowed per user")
+    arg_parser.add_argument("--max-outbound", type=int, default=20, help="Outbound requests across all jobs")
+    arg_parser.add_argument("--job-ttl", type=float, default=3600.0, help="Seconds finished jobs stay queryable")
+    arg_parser.add_argument("--max-finished-per-user", type=int, default=50, help="Finished jobs kept per user")
+    arg_parser.add_argument("--log-level", default="INFO", help="Log level (default: INFO)")
+    arg_parser.add_argument("--log-json", action="store_true", help="Write logs as JSON lines")
+    args = arg_parser.parse_args(argv)
+    configure_logging(args.log_level, json_output=args.log_json)
+
+    service = JobService(
+        workers=args.workers,
+        per_user_quota=args.per_user_quota,
+        max_outbound=args.max_outbound,
+        job_ttl_seconds=args.job_ttl,
+        max_finished_per_user=args.max_finished_per_user,
+    )
+    app = create_app(service)
+    if args.unix_socket:
+        web.run_app(app, path=args.unix_socket)
+    else:
+        web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,68 @@
-from core.models import AnimalEntry, ScrapingConfig
+import time
+from src.core.models import AnimalEntry, ScrapingConfig, validate_records
 from typing import Optional, Tuple, List
-from core.scraper import AnimalScraper
 from pathlib import Path
-from utils.logger import get_logger
+from src.core.scraper import ProgressCallback
+from src.multi_user.shared_results import SharedResultStore, get_shared_store
+from src.services.report_generator import HTMLReportGenerator
+from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 # Multi-user support (if needed for production deployment)
 class UserSession:
-    """Handles user-specific scraping sessions for multi-user support."""
+    """
+    Handles user-specific scraping sessions for multi-user support.
     
-    def __init__(self, user_id: str, config: Optional[ScrapingConfig] = None):
+    Scrape results and images come from a process-wide SharedResultStore; only
+    the image links and the HTML report are produced per user.
+    """
+    
+    def __init__(
+        self,
+        user_id: str,
+        config: Optional[ScrapingConfig] = None,
+        shared_store: Optional[SharedResultStore] = None,
+        root_dir: Path = Path("/tmp"),
+        request_limiter=None,
+    ):
         self.user_id = user_id
-        self.config = config or ScrapingConfig()
+        self.request_limiter = request_limiter
+        self.config = config.copy() if config else ScrapingConfig()
+        self.shared_store = shared_store or get_shared_store()
         
         # Create user-specific directories
-        user_dir = Path(f"/tmp/animal_scraper_user_{user_id}")
+        user_dir = Path(root_dir) / f"animal_scraper_user_{user_id}"
         self.config.image_dir = user_dir / "images"
         self.config.output_file = user_dir / "report.html"
         
         user_dir.mkdir(parents=True, exist_ok=True)
         self.config.image_dir.mkdir(parents=True, exist_ok=True)
         
-        self.scraper = AnimalScraper(self.config)
+        self.report_generator = HTMLReportGenerator(self.config)
     
-    async def run_scraping_session(self) -> Tuple[List[AnimalEntry], Path, float]:
-        """Run a scraping session for this user."""
+    async def run_scraping_session(
+        self,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Tuple[List[AnimalEntry], Path, float]:
+        """
+        Run a scraping session for this user.
+        
+        Args:
+            progress_callback: Optional callable receiving (stage, done, total)
+        """
         logger.info(f"Starting scraping session for user {self.user_id}")
-        return await self.scraper.scrape_and_generate_report()
\ No newline at end of file
+        start_time = time.time()
+        
+        records = await self.shared_store.get_records(
+            self.config,
+            request_limiter=self.request_limiter,
+            progress_callback=progress_callback,
+        )
+        records = self.shared_store.link_images(records, self.config.image_dir)
+        animal_entries = validate_records(records)
+        
+        execution_time = time.time() - start_time
+        report_path = self.report_generator.generate_report(animal_entries, execution_time)
+        return animal_entries, report_path, execution_time
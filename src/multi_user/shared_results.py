@@ -0,0 +1,221 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core.models import AnimalRecord, ScrapingConfig
+from src.core.scraper import AnimalScraper, ProgressCallback
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Per-session output locations; every other config field can change the records
+_SESSION_FIELDS = {"base_url", "sources", "image_dir", "output_file", "metrics_file"}
+
+
+def result_key(config: ScrapingConfig) -> Tuple[str, str]:
+    """
+    Key of the shared results a config may reuse: its sources plus every setting
+    that affects the records (HTTP mode and archive, snapshot, deadline, hedging,
+    executors, ...), so sessions only share scrapes that would give the same result.
+    """
+    return config.source_id(), config.json(exclude=_SESSION_FIELDS, sort_keys=True)
+
+
+def get_default_shared_dir() -> Path:
+    """
+    Returns the default directory for the process-wide image store.
+    
+    Returns:
+        Path: 'animal_scraper_shared' inside the system temp folder.
+    """
+    return Path(tempfile.gettempdir()) / "animal_scraper_shared"
+
+
+class SharedResultStore:
+    """
+    Process-wide scrape result layer shared by all UserSession instances.
+    
+    Concurrent requests for the same sources and result-affecting settings (see
+    ``result_key``) share a single in-flight scrape,
+    finished results are reused for ``freshness_seconds`` (results cut short by a
+    run deadline are only shared with the sessions that joined that scrape, never
+    cached), and images are
+    downloaded once into a shared directory and hard-linked into each user's
+    image directory (copied when hard links are not supported).
+    """
+    
+    def __init__(
+        self,
+        store_dir: Optional[Path] = None,
+        freshness_seconds: float = 300.0,
+        scraper_factory: Callable[..., AnimalScraper] = AnimalScraper,
+    ):
+        self.store_dir = Path(store_dir) if store_dir else get_default_shared_dir()
+        self.image_dir = self.store_dir / "images"
+        self.freshness_seconds = freshness_seconds
+        self.scraper_factory = scraper_factory
+        
+        self._lock = threading.Lock()
+        self._results: Dict[Tuple[str, str], Tuple[float, List[AnimalRecord]]] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._listeners: Dict[Tuple[str, str], List[ProgressCallback]] = {}
+        # Callers currently awaiting each in-flight scrape
+        self._waiters: Dict[Tuple[str, str], int] = {}
+        
+        self.image_dir.mkdir(parents=True, exist_ok=True)
+    
+    async def get_records(
+        self,
+        config: ScrapingConfig,
+        request_limiter=None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[AnimalRecord]:
+        """
+        Return scrape results for the sources of ``config``, scraping only when needed.
+        
+        Args:
+            config: The requesting session's configuration
+            request_limiter: Limiter handed to the scraper if a new scrape is started
+            progress_callback: Receives (stage, done, total) updates from the shared
+                scrape, whether it was started by this call or joined in flight
+            
+        Returns:
+            Records whose local image paths point into the shared image store.
+            The list is shared between callers and must not be modified.
+        """
+        key = result_key(config)
+        loop = asyncio.get_running_loop()
+        
+        with self._lock:
+            cached = self._results.get(key)
+            if cached and time.monotonic() - cached[0] < self.freshness_seconds:
+                logger.info(f"Reusing cached results for {key[0]}")
+                return cached[1]
+            
+            task = self._inflight.get(key)
+            if task is None or task.get_loop() is not loop:
+                self._listeners[key] = []
+                task = loop.create_task(self._scrape(key, config, request_limiter))
+                self._inflight[key] = task
+            else:
+                logger.info(f"Joining in-flight scrape for {key[0]}")
+            if progress_callback is not None:
+                self._listeners[key].append(progress_callback)
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+        
+        abandoned = False
+        try:
+            # Shield so that one cancelled session does not cancel the scrape for the others
+            return await asyncio.shield(task)
+        finally:
+            with self._lock:
+                listeners = self._listeners.get(key, [])
+                if progress_callback in listeners:
+                    listeners.remove(progress_callback)
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    del self._waiters[key]
+                    # The last waiter was cancelled: nobody needs the scrape any more
+                    abandoned = not task.done()
+            if abandoned:
+                logger.info(f"Cancelling abandoned scrape for {key[0]}")
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+    
+    async def cancel_inflight(self):
+        """Cancel the scrapes running on the current event loop and wait for them to finish."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tasks = [task for task in self._inflight.values() if task.get_loop() is loop]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _scrape(self, key: Tuple[str, str], config: ScrapingConfig, request_limiter) -> List[AnimalRecord]:
+        """Run one shared scrape and publish its results."""
+        def notify(stage: str, done: int, total: int):
+            for listener in list(self._listeners.get(key, [])):
+                listener(stage, done, total)
+        
+        try:
+            shared_config = config.copy(update={"image_dir": self.image_dir})
+            scraper = self.scraper_factory(
+                shared_config,
+                request_limiter=request_limiter,
+                progress_callback=notify,
+            )
+            records = await scraper.collect_records()
+            if any(record.incomplete for record in records):
+                # The next session's deadline may allow a full run
+                logger.info(f"Not caching results for {key[0]}: the deadline cut the scrape short")
+            else:
+                with self._lock:
+                    self._results[key] = (time.monotonic(), records)
+            return records
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is asyncio.current_task():
+                    del self._inflight[key]
+    
+    def link_images(self, records: List[AnimalRecord], image_dir: Path) -> List[AnimalRecord]:
+        """
+        Link shared images into a per-user directory.
+        
+        Args:
+            records: Records returned by ``get_records``
+            image_dir: The user's image directory
+            
+        Returns:
+            New records whose local image paths point into ``image_dir``
+        """
+        image_dir.mkdir(parents=True, exist_ok=True)
+        linked = []
+        for record in records:
+            local_path = record.local_image_path
+            if local_path:
+                local_path = str(self._link(Path(local_path), image_dir))
+            linked.append(AnimalRecord(
+                record.animal_name,
+                record.collateral_adjective,
+                record.image_url,
+                local_path,
+                record.incomplete,
+            ))
+        return linked
+    
+    def _link(self, source: Path, image_dir: Path) -> Path:
+        """Hard-link ``source`` into ``image_dir``, falling back to a copy."""
+        target = image_dir / source.name
+        if target.exists():
+            return target
+        try:
+            os.link(source, target)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copy2(source, target)
+        return target
+    
+    def clear(self):
+        """Forget all cached results (in-flight scrapes are left running)."""
+        with self._lock:
+            self._results.clear()
+
+
+_shared_store: Optional[SharedResultStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_shared_store() -> SharedResultStore:
+    """Return the process-wide SharedResultStore, creating it on first use."""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SharedResultStore()
+        return _shared_store
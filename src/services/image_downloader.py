@@ -1,58 +1,91 @@
+import os
 import re
-import aiohttp
-from src.core.models import AnimalEntry, ScrapingConfig
-from typing import Set
+import time
+from src.core.models import AnimalRecord, ScrapingConfig
+from typing import TYPE_CHECKING, Optional, Set
 from urllib.parse import urlparse
 import hashlib
+from src.utils.hedging import Hedger, send
 from src.utils.logger import get_logger
+from src.utils.metrics import BYTE_BUCKETS, REGISTRY
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = get_logger(__name__)
 
+DOWNLOAD_DURATION = REGISTRY.histogram("image_download_duration_seconds", "Image download latency")
+DOWNLOAD_BYTES = REGISTRY.histogram("image_download_bytes", "Downloaded image size", buckets=BYTE_BUCKETS)
+DOWNLOADS_OK = REGISTRY.counter("image_downloads_total", "Images downloaded")
+DOWNLOAD_CACHE_HITS = REGISTRY.counter("image_download_cache_hits_total", "Downloads skipped because the file was already fetched")
+DOWNLOAD_HTTP_ERRORS = REGISTRY.counter("image_download_http_errors_total", "Downloads answered with a non-200 status")
+DOWNLOAD_FAILURES = REGISTRY.counter("image_download_failures_total", "Downloads that raised an error")
+
 class ImageDownloader:
     """Handles asynchronous downloading of animal images."""
     
-    def __init__(self, config: ScrapingConfig):
+    def __init__(self, config: ScrapingConfig, hedger: Optional[Hedger] = None):
+        """
+        Args:
+            config: Scraping configuration
+            hedger: Optional Hedger that re-sends slow image requests
+        """
         self.config = config
+        self.hedger = hedger
         self.downloaded_files: Set[str] = set()
     
-    async def download_image(self, session: aiohttp.ClientSession, animal_entry: AnimalEntry) -> AnimalEntry:
+    async def download_image(self, session: "aiohttp.ClientSession", animal_entry: AnimalRecord) -> AnimalRecord:
         """
-        Download an image for an animal entry.
+        Download an image for an animal record.
         
         Args:
             session: aiohttp session for downloading
-            animal_entry: AnimalEntry to download image for
+            animal_entry: AnimalRecord to download image for (updated in place)
             
         Returns:
-            Updated AnimalEntry with local image path
+            The same AnimalRecord with its local image path set
         """
-        if not animal_entry.image_url:
+        if not animal_entry.has_image:
             return animal_entry
         
         try:
             # Create a safe filename
             safe_name = re.sub(r'[^\w\-_.]', '_', animal_entry.animal_name)
-            file_extension = self._get_file_extension(str(animal_entry.image_url))
-            filename = f"{safe_name}_{hashlib.md5(str(animal_entry.image_url).encode()).hexdigest()[:8]}{file_extension}"
+            file_extension = self._get_file_extension(animal_entry.image_url)
+            filename = f"{safe_name}_{hashlib.md5(animal_entry.image_url.encode()).hexdigest()[:8]}{file_extension}"
             file_path = self.config.image_dir / filename
             
             # Skip if already downloaded
             if filename in self.downloaded_files:
+                DOWNLOAD_CACHE_HITS.inc()
                 animal_entry.local_image_path = str(file_path)
                 return animal_entry
             
-            async with session.get(str(animal_entry.image_url), timeout=self.config.request_timeout) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    file_path.write_bytes(content)
-                    self.downloaded_files.add(filename)
-                    animal_entry.local_image_path = str(file_path)
-                    logger.debug(f"Downloaded image for {animal_entry.animal_name}")
-                else:
-                    logger.warning(f"Failed to download image for {animal_entry.animal_name}: HTTP {response.status}")
+            async def fetch():
+                async with session.get(animal_entry.image_url, timeout=self.config.request_timeout) as response:
+                    return response.status, (await response.read() if response.status == 200 else None)
+            
+            start_time = time.perf_counter()
+            status, content = await send(self.hedger, "download", fetch)
+            if status == 200:
+                DOWNLOAD_DURATION.observe(time.perf_counter() - start_time)
+                DOWNLOAD_BYTES.observe(len(content))
+                DOWNLOADS_OK.inc()
+                # Replaced, never rewritten: published reports and other users'
+                # image directories hard-link the previous file
+                tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(content)
+                os.replace(tmp_path, file_path)
+                self.downloaded_files.add(filename)
+                animal_entry.local_image_path = str(file_path)
+                logger.debug("Downloaded image for %s", animal_entry.animal_name)
+            else:
+                DOWNLOAD_HTTP_ERRORS.inc()
+                logger.warning("Failed to download image for %s: HTTP %s", animal_entry.animal_name, status)
         
         except Exception as e:
-            logger.warning(f"Error downloading image for {animal_entry.animal_name}: {str(e)}")
+            DOWNLOAD_FAILURES.inc()
+            logger.warning("Error downloading image for %s: %s", animal_entry.animal_name, e)
         
         return animal_entry
     
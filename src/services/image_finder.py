@@ -1,88 +1,246 @@
-import requests
 import asyncio
-import aiohttp
-from bs4 import BeautifulSoup
-from typing import Optional
+import contextlib
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 from src.utils.logger import get_logger
 from src.utils.decorators import retry_decorator, error_handler_decorator, timing_decorator
+from src.utils.hedging import Hedger, send
+from src.utils.metrics import BYTE_BUCKETS, REGISTRY
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+    from src.services.transport import HttpTransport
 
 logger = get_logger(__name__)
 
+
+class _LookupMetrics:
+    """Pre-registered lookup metrics for one lookup source ('article' or 'fallback')."""
+    
+    def __init__(self, source: str):
+        labels = {"source": source}
+        self.duration = REGISTRY.histogram("image_lookup_duration_seconds", "Image lookup latency", labels)
+        self.page_bytes = REGISTRY.histogram("image_lookup_page_bytes", "Article page size", labels, BYTE_BUCKETS)
+        self.hits = REGISTRY.counter("image_lookup_hits_total", "Lookups that found an image", labels)
+        self.misses = REGISTRY.counter("image_lookup_misses_total", "Lookups without an image", labels)
+        self.failures = REGISTRY.counter("image_lookup_failures_total", "Lookups that errored", labels)
+    
+    def record(self, start_time: float, image_url: Optional[str]):
+        self.duration.observe(time.perf_counter() - start_time)
+        (self.hits if image_url else self.misses).inc()
+
+
+ARTICLE_LOOKUPS = _LookupMetrics("article")
+FALLBACK_LOOKUPS = _LookupMetrics("fallback")
+
+
+class InlineExecutor(Executor):
+    """Executor that runs each call immediately in the submitting thread."""
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def create_parse_executor(kind: str, workers: int) -> Executor:
+    """
+    Create the pool that article pages are parsed in.
+    
+    Args:
+        kind: "thread", "process" (spawned workers, parsing in parallel with the
+            loop on other cores) or "inline" (parse on the event loop thread)
+        workers: Pool size
+    """
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="article-parse")
+    if kind == "process":
+        import multiprocessing
+        
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    if kind == "inline":
+        return InlineExecutor()
+    raise ValueError(f"Unknown parse executor {kind!r}; expected thread, process or inline")
+
+
+@contextlib.contextmanager
+def executor_scope(executor: Executor):
+    """
+    Shut ``executor`` down when the block exits.
+    
+    Unlike ``with executor:``, a block left by an exception or cancellation
+    does not wait for running calls: queued calls are cancelled and the
+    caller moves on, so a deadline is not held up by blocking work.
+    """
+    try:
+        yield executor
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+
+
+def extract_image_url(content, infobox_only: bool = False) -> Optional[str]:
+    """
+    Return the infobox image of an article, else (unless ``infobox_only``) the
+    first content image hosted on Commons/upload.
+    
+    This is the CPU-bound part of a lookup. It is a module-level function so
+    it can run in a thread or process pool.
+    
+    Args:
+        content: Article HTML (str or bytes)
+        infobox_only: Only consider the infobox image
+        
+    Returns:
+        Image URL if found, None otherwise
+    """
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # Look for the main infobox image
+    infobox = soup.find('table', class_='infobox')
+    if infobox:
+        img_tag = infobox.find('img')
+        if img_tag and img_tag.get('src'):
+            img_url = img_tag['src']
+            if img_url.startswith('//'):
+                img_url = 'https:' + img_url
+            return img_url
+    
+    if infobox_only:
+        return None
+    
+    # Fallback: look for any image in the content
+    content_images = soup.find_all('img', limit=5)
+    for img in content_images:
+        src = img.get('src', '')
+        if any(ext in src.lower() for ext in ['.jpg', '.jpeg', '.png', '.svg']):
+            if 'commons' in src or 'upload' in src:
+                if src.startswith('//'):
+                    src = 'https:' + src
+                return src
+    
+    return None
+
 # Core Classes
 class WikipediaImageFinder:
     """Handles finding and extracting image URLs from Wikipedia pages."""
     
-    def __init__(self, session: Optional[requests.Session] = None):
-        self.session = session or requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'AnimalScraper/1.0 (Educational Purpose)'
-        })
+    def __init__(
+        self,
+        session: Optional["requests.Session"] = None,
+        site_url: str = "https://en.wikipedia.org",
+        transport: Optional["HttpTransport"] = None,
+        hedger: Optional[Hedger] = None,
+    ):
+        """
+        Args:
+            session: Blocking session for the fallback lookup (created on first use if omitted)
+            site_url: Origin that article links and fallback searches are resolved against
+            transport: HttpTransport providing the fallback session (live, record or replay)
+            hedger: Optional Hedger that re-sends slow article requests
+        """
+        self.site_url = site_url.rstrip('/')
+        self._session = session
+        self.transport = transport
+        self.hedger = hedger
+    
+    @property
+    def session(self) -> "requests.Session":
+        """Blocking session for the fallback lookup, created (and requests imported) on first use."""
+        if self._session is None and self.transport is not None:
+            self._session = self.transport.requests_session()
+        elif self._session is None:
+            import requests
+            
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': 'AnimalScraper/1.0 (Educational Purpose)'
+            })
+        return self._session
     
     @retry_decorator(max_retries=2)
     @error_handler_decorator(default_return=None)
-    def find_animal_image(self, animal_name: str) -> Optional[str]:
+    def find_animal_image(self, animal_name: str, timeout: float = 10) -> Optional[str]:
         """
         Find an image URL for a given animal by searching Wikipedia.
         
         Args:
             animal_name: Name of the animal to search for
+            timeout: Request timeout in seconds
             
         Returns:
             Image URL if found, None otherwise
         """
+        start_time = time.perf_counter()
         try:
             # Search for the animal's Wikipedia page
-            search_url = f"https://en.wikipedia.org/wiki/{animal_name.replace(' ', '_')}"
-            response = self.session.get(search_url, timeout=10)
+            search_url = f"{self.site_url}/wiki/{animal_name.replace(' ', '_')}"
+            response = self.session.get(search_url, timeout=timeout)
             
             if response.status_code != 200:
+                FALLBACK_LOOKUPS.record(start_time, None)
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for the main infobox image
-            infobox = soup.find('table', class_='infobox')
-            if infobox:
-                img_tag = infobox.find('img')
-                if img_tag and img_tag.get('src'):
-                    img_url = img_tag['src']
-                    if img_url.startswith('//'):
-                        img_url = 'https:' + img_url
-                    return img_url
-            
-            # Fallback: look for any image in the content
-            content_images = soup.find_all('img', limit=5)
-            for img in content_images:
-                src = img.get('src', '')
-                if any(ext in src.lower() for ext in ['.jpg', '.jpeg', '.png', '.svg']):
-                    if 'commons' in src or 'upload' in src:
-                        if src.startswith('//'):
-                            src = 'https:' + src
-                        return src
-            
-            return None
+            FALLBACK_LOOKUPS.page_bytes.observe(len(response.content))
+            image_url = extract_image_url(response.content)
+            FALLBACK_LOOKUPS.record(start_time, image_url)
+            return image_url
         except Exception as e:
-            logger.debug(f"Error finding image for {animal_name}: {str(e)}")
+            FALLBACK_LOOKUPS.failures.inc()
+            logger.debug("Error finding image for %s: %s", animal_name, e)
             return None
-
+    
     @retry_decorator(max_retries=2)
     @error_handler_decorator(default_return=None)
-    async def find_image_from_url_async(self, url: str, session: aiohttp.ClientSession) -> Optional[str]:
-        try:
+    async def find_image_from_url_async(
+        self,
+        url: str,
+        session: "aiohttp.ClientSession",
+        parse_executor: Optional[Executor] = None,
+        request_limiter=None,
+    ) -> Optional[str]:
+        """
+        Find the infobox image of an article.
+        
+        Only the request (hedged if a Hedger is set) runs on the event loop; the
+        article is parsed in ``parse_executor`` (the loop's default thread pool if None).
+        ``request_limiter`` is held only until the body is read, so parsing does
+        not take up the outbound request budget.
+        
+        Args:
+            url: Article URL
+            session: aiohttp session for the request
+            parse_executor: Thread or process pool for parsing the article
+            request_limiter: Optional async context manager entered around the request
+            
+        Returns:
+            Image URL if found, None otherwise
+        """
+        async def fetch():
             async with session.get(url, timeout=10) as response:
-                if response.status != 200:
-                    return None
-                content = await response.text()
-                soup = BeautifulSoup(content, 'html.parser')
-                infobox = soup.find('table', class_='infobox')
-                if infobox:
-                    img_tag = infobox.find('img')
-                    if img_tag and img_tag.get('src'):
-                        img_url = img_tag['src']
-                        if img_url.startswith('//'):
-                            img_url = 'https:' + img_url
-                        return img_url
+                return response.status, (await response.text() if response.status == 200 else None)
+        
+        start_time = time.perf_counter()
+        try:
+            async with request_limiter if request_limiter is not None else contextlib.nullcontext():
+                status, content = await send(self.hedger, "lookup", fetch)
+            if status != 200:
+                ARTICLE_LOOKUPS.record(start_time, None)
                 return None
+            ARTICLE_LOOKUPS.page_bytes.observe(len(content))
+            loop = asyncio.get_running_loop()
+            image_url = await loop.run_in_executor(parse_executor, extract_image_url, content, True)
+            ARTICLE_LOOKUPS.record(start_time, image_url)
+            return image_url
         except Exception as e:
-            logger.debug(f"Error finding image for url {url}: {str(e)}")
+            ARTICLE_LOOKUPS.failures.inc()
+            logger.debug("Error finding image for url %s: %s", url, e)
             return None
@@ -1,21 +1,66 @@
 
 
 
+import gzip
+import hashlib
+import os
+import shutil
 import time
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pathlib import Path
 from src.core.models import AnimalEntry, ScrapingConfig
 from src.utils.logger import get_logger
 from src.utils.decorators import timing_decorator
+from src.utils.metrics import REGISTRY
 
 logger = get_logger(__name__)
 
+REPORT_BYTES = REGISTRY.gauge("report_bytes", "Size of the last generated report")
+REPORT_ENTRIES = REGISTRY.gauge("report_entries", "Entries in the last generated report")
+REPORT_IMAGES = REGISTRY.gauge("report_images", "Entries with a local image in the last generated report")
+
+# Directory next to the report that holds its content-addressed images; not
+# "images", which is where UserSession keeps each user's downloaded images
+ASSETS_DIR = "assets"
+
+
+def precompress(path: Path) -> List[Path]:
+    """
+    Write ``<path>.gz``, and ``<path>.br`` when the brotli module is installed,
+    so a static server can send them without compressing per request.
+    
+    Returns:
+        The compressed files written
+    """
+    data = path.read_bytes()
+    gz_path = path.with_name(path.name + ".gz")
+    # mtime=0 keeps the output identical for identical input; level 6 is
+    # within a few percent of 9 on HTML at a fraction of the time
+    gz_path.write_bytes(gzip.compress(data, compresslevel=6, mtime=0))
+    written = [gz_path]
+    try:
+        import brotli
+    except ImportError:
+        return written
+    br_path = path.with_name(path.name + ".br")
+    br_path.write_bytes(brotli.compress(data, mode=brotli.MODE_TEXT))
+    written.append(br_path)
+    return written
+
 
 class HTMLReportGenerator:
-    """Generates HTML reports for the scraped data."""
+    """
+    Generates HTML reports for the scraped data.
+    
+    Images are copied to ``assets/<hash>.<ext>``
+    next to the report and referenced by relative URLs, so the report directory
+    can be moved or served as is. The name changes whenever the content does,
+    which lets a server cache the images indefinitely.
+    """
     
     def __init__(self, config: ScrapingConfig):
         self.config = config
+        self._published: Dict[tuple, str] = {}
     
     @timing_decorator
     def generate_report(self, animal_entries: List[AnimalEntry], execution_time: float) -> Path:
@@ -31,7 +76,11 @@ class HTMLReportGenerator:
         """
         html_content = self._build_html_content(animal_entries, execution_time)
         
-        self.config.output_file.write_text(html_content, encoding='utf-8')
+        encoded = html_content.encode('utf-8')
+        self.config.output_file.write_bytes(encoded)
+        precompress(self.config.output_file)
+        REPORT_BYTES.set(len(encoded))
+        REPORT_ENTRIES.set(len(animal_entries))
         logger.info(f"HTML report generated: {self.config.output_file}")
         
         return self.config.output_file
@@ -39,6 +88,13 @@ class HTMLReportGenerator:
     def _build_html_content(self, animal_entries: List[AnimalEntry], execution_time: float) -> str:
         """Build the complete HTML content."""
         stats = self._calculate_statistics(animal_entries)
+        unfinished_html = ""
+        if stats['unfinished']:
+            unfinished_html = f"""
+                <div class="stat-card">
+                    <h3>Unfinished</h3>
+                    <p class="stat-number">{stats['unfinished']}</p>
+                </div>"""
         
         html = f"""
         <!DOCTYPE html>
@@ -77,7 +133,7 @@ class HTMLReportGenerator:
                 <div class="stat-card">
                     <h3>Execution Time</h3>
                     <p class="stat-number">{execution_time:.1f}s</p>
-                </div>
+                </div>{unfinished_html}
             </div>
             
             <div class="content">
@@ -100,26 +156,42 @@ class HTMLReportGenerator:
         unique_animals = set(entry.animal_name for entry in animal_entries)
         unique_adjectives = set(entry.collateral_adjective for entry in animal_entries)
         images_downloaded = sum(1 for entry in animal_entries if entry.local_image_path)
+        REPORT_IMAGES.set(images_downloaded)
         
         return {
             'total_entries': len(animal_entries),
             'unique_animals': len(unique_animals),
             'unique_adjectives': len(unique_adjectives),
             'images_downloaded': images_downloaded,
+            'unfinished': sum(1 for entry in animal_entries if entry.incomplete),
         }
     
     def _build_animal_cards(self, animal_entries: List[AnimalEntry]) -> str:
         """Build HTML cards for animal entries."""
         cards = []
+        # Image URLs of this report, so a file shared by several entries is looked at once
+        image_urls: Dict[str, Optional[str]] = {}
         for entry in animal_entries:
             image_html = ""
-            if entry.local_image_path and Path(entry.local_image_path).exists():
-                image_html = f'<img src="file://{entry.local_image_path}" alt="{entry.animal_name}" class="animal-image">'
+            image_url = None
+            if entry.local_image_path:
+                if entry.local_image_path not in image_urls:
+                    image_urls[entry.local_image_path] = self._publish_image(entry.local_image_path)
+                image_url = image_urls[entry.local_image_path]
+            if image_url:
+                image_html = f'<img src="{image_url}" alt="{entry.animal_name}" class="animal-image" loading="lazy">'
+            
+            card_class = "animal-card"
+            badge_html = ""
+            if entry.incomplete:
+                card_class += " incomplete"
+                badge_html = '<span class="badge">Unfinished (deadline)</span>'
             
             card = f"""
-            <div class="animal-card">
+            <div class="{card_class}">
                 {image_html}
                 <div class="animal-info">
+                    {badge_html}
                     <h3 class="animal-name">{entry.animal_name}</h3>
                     <p class="adjective">Collateral adjective: <em>{entry.collateral_adjective}</em></p>
                 </div>
@@ -129,6 +201,47 @@ class HTMLReportGenerator:
         
         return ''.join(cards)
     
+    def _publish_image(self, local_image_path: str) -> Optional[str]:
+        """
+        Place an image under the report's assets directory by content hash.
+        
+        Returns:
+            The image URL relative to the report, or None if the file is missing
+        """
+        try:
+            stat = os.stat(local_image_path)
+        except OSError:
+            return None
+        # Hash each file version once per generator (sessions reuse their generator)
+        key = (local_image_path, stat.st_mtime_ns, stat.st_size)
+        published = self._published.get(key)
+        if published is not None:
+            return published
+        source = Path(local_image_path)
+        assets_dir = self.config.output_file.parent / ASSETS_DIR
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        # Hard-linked, falling back to a copy. Downloads replace their file rather
+        # than rewrite it, so the linked content is hashed and can never change
+        tmp_path = assets_dir / f"{source.name}.{os.getpid()}.tmp"
+        try:
+            tmp_path.unlink(missing_ok=True)
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                shutil.copyfile(source, tmp_path)
+            digest = hashlib.sha256(tmp_path.read_bytes()).hexdigest()[:20]
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return None
+        name = f"{digest}{source.suffix.lower()}"
+        target = assets_dir / name
+        if target.exists():
+            tmp_path.unlink()
+        else:
+            os.replace(tmp_path, target)
+        published = self._published[key] = f"{ASSETS_DIR}/{name}"
+        return published
+    
     def _get_css_styles(self) -> str:
         """Return CSS styles for the HTML report."""
         return """
@@ -225,6 +338,22 @@ class HTMLReportGenerator:
             box-shadow: 0 8px 25px rgba(0,0,0,0.15);
         }
         
+        .animal-card.incomplete {
+            opacity: 0.7;
+            border: 2px dashed #e0a030;
+        }
+        
+        .badge {
+            display: inline-block;
+            background: #fff3dc;
+            color: #a06a00;
+            font-size: 0.8rem;
+            font-weight: 600;
+            padding: 0.1rem 0.5rem;
+            border-radius: 4px;
+            margin-bottom: 0.5rem;
+        }
+        
         .animal-image {
             width: 100%;
             height: 200px;
@@ -0,0 +1,110 @@
+import re
+from pathlib import Path
+
+from aiohttp import hdrs, web
+
+from src.services.report_generator import ASSETS_DIR, precompress
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+# Content-addressed names never change content, so browsers may keep them forever
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Pages keep their name across runs; browsers revalidate them with the ETag
+REVALIDATE = "no-cache"
+
+PRECOMPRESSED_SUFFIXES = (".html", ".json")
+
+_ASSET_NAME = re.compile(r"^[0-9a-f]{20}\.[A-Za-z0-9]{1,8}$")
+_PAGE_NAME = re.compile(r"^[\w.-]+$")
+
+
+def precompress_stale(directory: Path) -> int:
+    """
+    Precompress the HTML and JSON files in ``directory`` whose ``.gz`` copy is
+    missing or older than the file (e.g. entries or metrics JSON written after
+    the report).
+
+    Returns:
+        Number of files compressed
+    """
+    count = 0
+    for path in directory.iterdir():
+        if path.suffix not in PRECOMPRESSED_SUFFIXES or not path.is_file():
+            continue
+        compressed = path.with_name(path.name + ".gz")
+        if compressed.exists() and compressed.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            continue
+        precompress(path)
+        count += 1
+    return count
+
+
+def create_report_app(report_path: Path) -> web.Application:
+    """
+    Build a static server for a generated report.
+
+    Files are sent by ``web.FileResponse``, which answers conditional requests
+    (ETag / If-None-Match, Last-Modified) and byte ranges, and sends the
+    precompressed ``.br`` / ``.gz`` copy of a file when the client accepts it.
+
+    Routes:
+        GET /                the report
+        GET /{name}          HTML and JSON files next to the report
+        GET /assets/{hash}   content-addressed images, cached as immutable
+    """
+    report_path = Path(report_path).resolve()
+    root = report_path.parent
+    assets_dir = root / ASSETS_DIR
+    routes = web.RouteTableDef()
+    requests_total = {
+        kind: REGISTRY.counter("report_server_requests_total", "Requests served by the report server", {"kind": kind})
+        for kind in ("page", "image")
+    }
+
+    def page_response(path: Path) -> web.FileResponse:
+        requests_total["page"].inc()
+        response = web.FileResponse(path)
+        response.headers[hdrs.CACHE_CONTROL] = REVALIDATE
+        response.headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        return response
+
+    @routes.get("/")
+    async def report(request: web.Request) -> web.FileResponse:
+        return page_response(report_path)
+
+    @routes.get("/" + ASSETS_DIR + "/{name}")
+    async def image(request: web.Request) -> web.FileResponse:
+        name = request.match_info["name"]
+        path = assets_dir / name
+        if not _ASSET_NAME.match(name) or not path.is_file():
+            raise web.HTTPNotFound()
+        requests_total["image"].inc()
+        response = web.FileResponse(path)
+        response.headers[hdrs.CACHE_CONTROL] = IMMUTABLE
+        return response
+
+    @routes.get("/{name}")
+    async def page(request: web.Request) -> web.FileResponse:
+        name = request.match_info["name"]
+        path = root / name
+        if not _PAGE_NAME.match(name) or path.suffix not in PRECOMPRESSED_SUFFIXES or not path.is_file():
+            raise web.HTTPNotFound()
+        return page_response(path)
+
+    app = web.Application()
+    app.add_routes(routes)
+    return app
+
+
+def serve_report(report_path: Path, host: str = "127.0.0.1", port: int = 8000):
+    """Precompress what is stale and serve the report until interrupted."""
+    report_path = Path(report_path)
+    if not report_path.is_file():
+        raise FileNotFoundError(f"No report at {report_path}; generate one with 'run' or 'report' first")
+    compressed = precompress_stale(report_path.parent)
+    if compressed:
+        logger.info(f"Precompressed {compressed} files in {report_path.parent}")
+    print(f"🌐 Serving {report_path} at http://{host}:{port}/")
+    web.run_app(create_report_app(report_path), host=host, port=port, print=None)
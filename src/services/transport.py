@@ -0,0 +1,404 @@
+import json
+import mmap
+import struct
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+    from src.core.models import ScrapingConfig
+
+logger = get_logger(__name__)
+
+ARCHIVE_MAGIC = b"ANIMALSCRAPER-HTTP-ARCHIVE-1\n"
+# Trailer: index offset and index length, followed by the magic again
+_TRAILER = struct.Struct(">QQ")
+
+USER_AGENT = 'AnimalScraper/1.0 (Educational Purpose)'
+
+RECORDED = REGISTRY.counter("http_archive_recorded_total", "Responses written to the HTTP archive")
+REPLAY_HITS = REGISTRY.counter("http_archive_replay_hits_total", "Requests served from the HTTP archive")
+REPLAY_MISSES = REGISTRY.counter("http_archive_replay_misses_total", "Requests missing from the HTTP archive")
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode for a request that is not in the archive."""
+
+
+def _request_key(method: str, url: str) -> str:
+    return f"{method.upper()} {url}"
+
+
+class HttpArchive:
+    """
+    Indexed archive of HTTP responses in a single file.
+
+    Layout: a magic line, the response bodies back to back, then a JSON index
+    mapping ``"<METHOD> <url>"`` to status, headers and the body's offset and
+    length, then a fixed-size trailer locating the index.
+
+    In record mode bodies are appended as they arrive and ``flush`` rewrites the
+    index after the last body, so the file is complete after every flush; append
+    mode does the same on an existing archive, keeping what it holds. In
+    replay mode the file is memory-mapped and the index is loaded once; each
+    response body is a slice of the mapping, so replaying does no read syscalls.
+    """
+
+    def __init__(self, path: Path, mode: str):
+        """
+        Args:
+            path: Archive file
+            mode: "record" (truncate and write), "append" (continue recording
+                into an existing archive) or "replay" (read-only)
+        """
+        if mode not in ("record", "append", "replay"):
+            raise ValueError(f"Unknown archive mode {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = {}
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w+b")
+            self._file.write(ARCHIVE_MAGIC)
+            self._data_end = len(ARCHIVE_MAGIC)
+            self._dirty = True
+            self.flush()
+        elif mode == "append":
+            self._file = open(self.path, "r+b")
+            try:
+                with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    # New bodies overwrite the old index, which flush writes again
+                    self._data_end, self._index = self._read_index(data)
+            except Exception:
+                self._file.close()
+                raise
+            self._dirty = False
+        else:
+            self._open_for_replay()
+
+    def _read_index(self, data: mmap.mmap) -> Tuple[int, Dict[str, Dict]]:
+        """Check the magic markers and return the index offset and the index."""
+        trailer_size = _TRAILER.size + len(ARCHIVE_MAGIC)
+        if (
+            len(data) < len(ARCHIVE_MAGIC) + trailer_size
+            or data[:len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC
+            or data[-len(ARCHIVE_MAGIC):] != ARCHIVE_MAGIC
+        ):
+            raise ValueError(f"{self.path} is not an HTTP archive")
+        index_offset, index_length = _TRAILER.unpack_from(data, len(data) - trailer_size)
+        return index_offset, json.loads(data[index_offset:index_offset + index_length])
+
+    def _open_for_replay(self):
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            _, self._index = self._read_index(self._map)
+        except ValueError:
+            self._map.close()
+            raise
+        logger.info(f"Replaying {len(self._index)} recorded responses from {self.path}")
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, method: str, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """Append a response; a later response for the same request replaces the earlier one."""
+        with self._lock:
+            self._file.seek(self._data_end)
+            self._file.write(body)
+            self._index[_request_key(method, url)] = {
+                "status": status,
+                "headers": headers,
+                "offset": self._data_end,
+                "length": len(body),
+            }
+            self._data_end += len(body)
+            self._dirty = True
+        RECORDED.inc()
+
+    def get(self, method: str, url: str) -> "ArchivedResponse":
+        """
+        Look up a recorded response.
+
+        Raises:
+            ReplayMissError: If the request was not recorded
+        """
+        entry = self._index.get(_request_key(method, url))
+        if entry is None:
+            REPLAY_MISSES.inc()
+            raise ReplayMissError(f"No recorded response for {method.upper()} {url} in {self.path}")
+        REPLAY_HITS.inc()
+        offset = entry["offset"]
+        return ArchivedResponse(url, entry["status"], entry["headers"], self._map[offset:offset + entry["length"]])
+
+    def flush(self):
+        """Write the index and trailer after the bodies recorded so far."""
+        if self._file is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            index = json.dumps(self._index, separators=(",", ":")).encode("utf-8")
+            self._file.seek(self._data_end)
+            self._file.write(index)
+            self._file.write(_TRAILER.pack(self._data_end, len(index)))
+            self._file.write(ARCHIVE_MAGIC)
+            self._file.truncate()
+            self._file.flush()
+            self._dirty = False
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None and self._map is None
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class ArchivedResponse:
+    """
+    Recorded response exposing the subset of the aiohttp response API the
+    scraper uses (``status``, ``headers``, ``read()``, ``text()``).
+    """
+
+    __slots__ = ("url", "status", "headers", "body")
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def charset(self) -> Optional[str]:
+        content_type = self.headers.get("content-type", "")
+        for part in content_type.split(";")[1:]:
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset":
+                return value.strip('"') or None
+        return None
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        return self.body.decode(encoding or self.charset or "utf-8", errors)
+
+    def release(self):
+        pass
+
+    async def __aenter__(self) -> "ArchivedResponse":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _ArchivedRequest:
+    """Awaitable / async context manager returned by the archive sessions' ``get``."""
+
+    def __init__(self, coro):
+        self._coro = coro
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> ArchivedResponse:
+        return await self._coro
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class ReplayClientSession:
+    """Drop-in for ``aiohttp.ClientSession.get`` that serves responses from an archive."""
+
+    def __init__(self, archive: HttpArchive):
+        self.archive = archive
+
+    def get(self, url, **kwargs) -> _ArchivedRequest:
+        async def replay() -> ArchivedResponse:
+            return self.archive.get("GET", str(url))
+        return _ArchivedRequest(replay())
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self) -> "ReplayClientSession":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class RecordingClientSession:
+    """Wraps an ``aiohttp.ClientSession`` and archives every response it receives."""
+
+    def __init__(self, session: "aiohttp.ClientSession", archive: HttpArchive):
+        self.session = session
+        self.archive = archive
+
+    def get(self, url, **kwargs) -> _ArchivedRequest:
+        async def record() -> ArchivedResponse:
+            async with self.session.get(url, **kwargs) as response:
+                body = await response.read()
+                headers = {name.lower(): value for name, value in response.headers.items()}
+            self.archive.add("GET", str(url), response.status, headers, body)
+            return ArchivedResponse(str(url), response.status, headers, body)
+        return _ArchivedRequest(record())
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self) -> "RecordingClientSession":
+        await self.session.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self.session.__aexit__(*exc_info)
+
+
+def _archive_adapter(archive: HttpArchive, mode: str):
+    """Build a requests transport adapter that records to or replays from ``archive``."""
+    from requests.adapters import HTTPAdapter
+    from requests.models import Response
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+
+    class ArchiveAdapter(HTTPAdapter):
+        def send(self, request, **kwargs):
+            if mode == "record":
+                response = super().send(request, **kwargs)
+                headers = {name.lower(): value for name, value in response.headers.items()}
+                archive.add(request.method, request.url, response.status_code, headers, response.content)
+                return response
+
+            recorded = archive.get(request.method, request.url)
+            response = Response()
+            response.status_code = recorded.status
+            response.headers = CaseInsensitiveDict(recorded.headers)
+            response._content = recorded.body
+            response.encoding = get_encoding_from_headers(response.headers)
+            response.url = request.url
+            response.request = request
+            return response
+
+    return ArchiveAdapter()
+
+
+class HttpTransport:
+    """
+    Creates the HTTP clients used by the scraper: plain aiohttp and requests
+    sessions in "live" mode, or sessions that record every response to, or
+    replay every response from, an ``HttpArchive``.
+
+    Replayed runs never open a socket, so they run as fast as parsing and
+    report generation allow.
+
+    ``close`` releases the archive and the requests session; they are opened
+    again on next use. A record-mode archive reopened after ``close`` keeps
+    the responses recorded before it.
+    """
+
+    def __init__(self, mode: str = "live", archive_path: Optional[Path] = None):
+        """
+        Args:
+            mode: "live", "record" or "replay"
+            archive_path: Archive file (required unless mode is "live")
+        """
+        if mode not in ("live", "record", "replay"):
+            raise ValueError(f"Unknown HTTP mode {mode!r}; expected live, record or replay")
+        if mode != "live" and archive_path is None:
+            raise ValueError(f"HTTP mode '{mode}' requires an archive path")
+        self.mode = mode
+        self.archive_path = archive_path
+        self._archive: Optional[HttpArchive] = None
+        # Set once the record-mode archive has been created, so reopening appends
+        self._recorded = False
+        self._requests_session: Optional["requests.Session"] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: "ScrapingConfig") -> "HttpTransport":
+        return cls(config.http_mode, config.http_archive)
+
+    @property
+    def archive(self) -> Optional[HttpArchive]:
+        """The archive, opened on first use (None in live mode)."""
+        if self.mode == "live":
+            return None
+        with self._lock:
+            if self._archive is None:
+                mode = "append" if self._recorded else self.mode
+                self._archive = HttpArchive(self.archive_path, mode)
+                self._recorded = self.mode == "record"
+        return self._archive
+
+    def client_session(self, timeout: float, limit_per_host: int, headers: Optional[Dict[str, str]] = None):
+        """
+        Create an aiohttp-compatible session; use it as an async context manager.
+
+        Args:
+            timeout: Total request timeout in seconds
+            limit_per_host: Connection limit per host
+            headers: Default request headers
+        """
+        if self.mode == "replay":
+            return ReplayClientSession(self.archive)
+
+        import aiohttp
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=limit_per_host),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            headers=headers or {'User-Agent': USER_AGENT},
+        )
+        if self.mode == "record":
+            return RecordingClientSession(session, self.archive)
+        return session
+
+    def requests_session(self) -> "requests.Session":
+        """Shared blocking session, created (and requests imported) on first use."""
+        archive = self.archive
+        with self._lock:
+            if self._requests_session is None:
+                import requests
+
+                session = requests.Session()
+                session.headers.update({'User-Agent': USER_AGENT})
+                if archive is not None:
+                    adapter = _archive_adapter(archive, self.mode)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                self._requests_session = session
+        return self._requests_session
+
+    def flush(self):
+        """Make everything recorded so far readable from the archive file."""
+        if self._archive is not None:
+            self._archive.flush()
+
+    def close(self):
+        """Close the archive and the requests session (aiohttp sessions are closed by their users)."""
+        with self._lock:
+            archive, self._archive = self._archive, None
+            requests_session, self._requests_session = self._requests_session, None
+        if archive is not None:
+            archive.close()
+        if requests_session is not None:
+            requests_session.close()
@@ -1,17 +1,39 @@
-import yaml
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, Pattern
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config" / "settings.yaml"
+
+
+def load_config(path: Path = DEFAULT_CONFIG_PATH):
+    # Imported here so that modules which never read the config do not pay for yaml
+    import yaml
 
-def load_config(path: Path = Path(__file__).parent.parent / "config" / "settings.yaml"):
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
 
-def clean_text_with_config(text: str) -> str:
-    config = load_config()
-    patterns = [r["pattern"] for r in config.get("text_cleanup_regex", [])]
+@lru_cache(maxsize=None)
+def get_config() -> Dict[str, Any]:
+    """
+    Return the default settings, reading settings.yaml on first use only.
+
+    The returned dictionary is shared; callers must not modify it.
+    """
+    return load_config()
 
-    for pattern in patterns:
-        text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _cleanup_patterns() -> List[Pattern]:
+    return [
+        re.compile(r["pattern"], flags=re.IGNORECASE)
+        for r in get_config().get("text_cleanup_regex", [])
+    ]
+
+
+def clean_text_with_config(text: str) -> str:
+    for pattern in _cleanup_patterns():
+        text = pattern.sub(' ', text)
     
     return text.strip()
@@ -1,23 +1,57 @@
 
 import time
+import functools
+import inspect
 from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
 
 logger = get_logger(__name__)
 
 # Decorators
 def timing_decorator(func):
-    """Decorator to measure execution time of functions."""
+    """
+    Decorator to measure execution time of functions and coroutine functions.
+    
+    Besides logging, each call is recorded in the
+    ``function_duration_seconds{function=...}`` histogram and failures in
+    ``function_failures_total{function=...}``.
+    """
+    labels = {"function": func.__qualname__}
+    histogram = REGISTRY.histogram("function_duration_seconds", "Duration of timed functions", labels)
+    failures = REGISTRY.counter("function_failures_total", "Failed calls of timed functions", labels)
+
+    def record(start_time, error=None):
+        execution_time = time.perf_counter() - start_time
+        histogram.observe(execution_time)
+        if error is None:
+            logger.info("%s completed in %.2f seconds", func.__name__, execution_time)
+        else:
+            failures.inc()
+            logger.error("%s failed after %.2f seconds: %s", func.__name__, execution_time, error)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                record(start_time, e)
+                raise
+            record(start_time)
+            return result
+        return async_wrapper
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.info(f"{func.__name__} completed in {execution_time:.2f} seconds")
-            return result
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"{func.__name__} failed after {execution_time:.2f} seconds: {str(e)}")
+            record(start_time, e)
             raise
+        record(start_time)
+        return result
     return wrapper
 
 
@@ -32,10 +66,10 @@ def retry_decorator(max_retries: int = 3, delay: float = 1.0):
                 except Exception as e:
                     last_exception = e
                     if attempt < max_retries - 1:
-                        logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. Retrying in {delay}s...")
+                        logger.warning("Attempt %d failed for %s: %s. Retrying in %ss...", attempt + 1, func.__name__, e, delay)
                         time.sleep(delay)
                     else:
-                        logger.error(f"All {max_retries} attempts failed for {func.__name__}")
+                        logger.error("All %d attempts failed for %s", max_retries, func.__name__)
             raise last_exception
         return wrapper
     return decorator
@@ -48,7 +82,7 @@ def error_handler_decorator(default_return=None):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Error in {func.__name__}: {str(e)}")
+                logger.error("Error in %s: %s", func.__name__, e)
                 return default_return
         return wrapper
     return decorator
\ No newline at end of file
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, TypeVar
+
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Exact percentiles over a sliding window of recent latencies."""
+
+    def __init__(self, window: int = 256):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """The ``q``-th percentile (0-100) of the window, or None while it is empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+async def try_acquire(limiter: Any) -> bool:
+    """
+    Take a slot of ``limiter`` only if one is free right now.
+
+    ``limiter`` is an ``asyncio.Semaphore`` or any limiter with a synchronous
+    ``try_acquire()`` (e.g. ``ProcessLimiter``); release it with ``release()``.
+    """
+    if hasattr(limiter, "try_acquire"):
+        return limiter.try_acquire()
+    if limiter.locked():
+        return False
+    # Does not wait: the semaphore has a free slot
+    await limiter.acquire()
+    return True
+
+
+class Hedger:
+    """
+    Hedged requests: if an attempt has not completed after the ``percentile``
+    latency of recent requests of the same kind, a second identical attempt is
+    started and whichever completes first wins. The other attempt is cancelled.
+
+    Hedging starts once ``min_samples`` latencies of that kind have been seen,
+    so the delay reflects the hosts actually being contacted.
+
+    The first attempt runs in the request slots its caller holds. The hedge
+    needs slots of its own: ``slots(kind)`` returns the limiters a request of
+    that kind counts against, and the hedge is skipped unless each of them has
+    a free slot, so hedging never exceeds the configured concurrency caps.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        min_samples: int = 20,
+        window: int = 256,
+        slots: Optional[Callable[[str], Sequence[Any]]] = None,
+    ):
+        """
+        Args:
+            percentile: Latency percentile (0-100) after which a request is hedged
+            min_samples: Latencies of a kind to observe before hedging it
+            window: Recent latencies per kind used for the percentile
+            slots: Limiters a request of a kind counts against (default: none)
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.slots = slots
+        self._window = window
+        self._trackers: Dict[str, LatencyTracker] = {}
+
+    def tracker(self, kind: str) -> LatencyTracker:
+        tracker = self._trackers.get(kind)
+        if tracker is None:
+            tracker = self._trackers[kind] = LatencyTracker(self._window)
+        return tracker
+
+    def delay(self, kind: str) -> Optional[float]:
+        """Seconds to wait before hedging a request of ``kind`` (None: do not hedge yet)."""
+        tracker = self.tracker(kind)
+        if len(tracker) < self.min_samples:
+            return None
+        return tracker.percentile(self.percentile)
+
+    async def run(self, kind: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``attempt()``, hedging it with a second call if it is slow.
+
+        Args:
+            kind: Request kind whose latencies set the hedge delay (e.g. "lookup")
+            attempt: Zero-argument coroutine function performing the whole request
+
+        Returns:
+            The result of the first attempt to succeed
+
+        Raises:
+            The last attempt's exception if every attempt failed
+        """
+        labels = {"kind": kind}
+        start = time.perf_counter()
+        tasks = [asyncio.ensure_future(attempt())]
+        try:
+            delay = self.delay(kind)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    held = await self._acquire_slots(kind)
+                    if held is None:
+                        REGISTRY.counter(
+                            "hedges_skipped_total", "Hedges skipped because no request slot was free", labels
+                        ).inc()
+                    else:
+                        REGISTRY.counter("hedged_requests_total", "Requests sent a second time", labels).inc()
+                        tasks.append(asyncio.ensure_future(self._hedge(attempt, held)))
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.tracker(kind).observe(time.perf_counter() - start)
+                        if task is not tasks[0]:
+                            REGISTRY.counter("hedge_wins_total", "Hedged requests answered first", labels).inc()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _acquire_slots(self, kind: str) -> Optional[List[Any]]:
+        """Take a free slot of every limiter for ``kind``, or none of them (None)."""
+        held = []
+        for limiter in self.slots(kind) if self.slots is not None else ():
+            if not await try_acquire(limiter):
+                for taken in held:
+                    taken.release()
+                return None
+            held.append(limiter)
+        return held
+
+    @staticmethod
+    async def _hedge(attempt: Callable[[], Awaitable[T]], held: List[Any]) -> T:
+        try:
+            return await attempt()
+        finally:
+            for limiter in held:
+                limiter.release()
+
+
+async def send(hedger: Optional[Hedger], kind: str, attempt: Callable[[], Awaitable[T]]) -> T:
+    """Run ``attempt`` through ``hedger``, or directly when hedging is disabled."""
+    if hedger is None:
+        return await attempt()
+    return await hedger.run(kind, attempt)
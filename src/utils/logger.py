@@ -1,11 +1,189 @@
-
-
 # logger.py
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from typing import Dict, List, Optional, TextIO, Tuple
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_root_handler: Optional[logging.Handler] = None
+
 
 def get_logger(name: str = "animal_scraper"):
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    """
+    Return a module logger.
+
+    Handlers are installed once by ``configure_logging`` at startup; getting a
+    logger has no side effects.
+    """
     return logging.getLogger(name)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Passes at most ``burst`` records per message template and logger in each
+    ``interval`` seconds.
+
+    Records are keyed by their unformatted message, so per-entry messages must
+    use %-style arguments (``logger.warning("Failed for %s", name)``) for their
+    repeats to be grouped. The first record after a window closes reports how
+    many repeats were dropped: the count is stored in ``record.suppressed_repeats``
+    (the record's message is left untouched, since other handlers share it) and
+    appended to the message by the queue handler's copy. Records at ERROR and
+    above are never dropped.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 10.0):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._lock = threading.Lock()
+        # (logger name, template) -> [window start, passed in window, suppressed in window]
+        self._windows: Dict[Tuple[str, object], List] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed_repeats = suppressed
+                return True
+            if window[1] < self.burst:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+    def suppressed_counts(self) -> Dict[str, int]:
+        """Repeats dropped in the current windows, keyed by message template."""
+        with self._lock:
+            return {str(template): window[2] for (_, template), window in self._windows.items() if window[2]}
+
+
+# Immutable argument types that are safe to format later on the listener thread
+_LAZY_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted when that is safe.
+
+    The stock handler formats every record in the calling thread before
+    enqueueing it; since the queue never leaves the process, message and
+    exception formatting can be left to the listener thread instead. That
+    only holds for immutable arguments: a record whose message or arguments
+    include other objects (e.g. an ``AnimalRecord`` updated after the call)
+    is formatted here, so it logs the state at the time of the call.
+
+    The enqueued record is a copy, so the caller's record (shared with any
+    other handlers) is never modified.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        args = record.args
+        values = args.values() if isinstance(args, Mapping) else (args or ())
+        if type(record.msg) is not str or any(type(value) not in _LAZY_ARG_TYPES for value in values):
+            record.msg = record.getMessage()
+            record.args = None
+        suppressed = getattr(record, "suppressed_repeats", 0)
+        if suppressed:
+            record.msg = f"{record.msg} [{suppressed} similar messages suppressed]"
+        return record
+
+
+def configure_logging(
+    level: str = "INFO",
+    json_output: bool = False,
+    rate_limit_burst: int = 5,
+    rate_limit_interval: float = 10.0,
+    stream: Optional[TextIO] = None,
+    background: bool = True,
+):
+    """
+    Configure process-wide logging once at startup.
+
+    Records from all loggers go through a ``QueueHandler`` on the root logger to
+    a ``QueueListener`` thread, which formats them and writes them to ``stream``.
+    The event loop thread never blocks on handler I/O. Repetitive messages
+    are rate-limited before they are enqueued.
+
+    Pool worker processes pass ``background=False`` to write directly to
+    ``stream`` instead: ``atexit`` does not run in multiprocessing children, so
+    a listener thread there would never be stopped and could drop the last
+    queued records.
+
+    Calling it again replaces the previous configuration.
+
+    Args:
+        level: Root log level name (e.g. "INFO", "DEBUG")
+        json_output: Emit one JSON object per line instead of plain text
+        rate_limit_burst: Records allowed per message template per interval (0 disables)
+        rate_limit_interval: Rate-limit window in seconds
+        stream: Output stream (defaults to stderr)
+        background: Format and write records on a listener thread
+    """
+    global _listener, _root_handler
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if json_output else logging.Formatter(DEFAULT_FORMAT))
+
+    if background:
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _root_handler = _LazyQueueHandler(records)
+        _listener = logging.handlers.QueueListener(records, output, respect_handler_level=True)
+    else:
+        _root_handler = output
+    if rate_limit_burst > 0:
+        _root_handler.addFilter(RateLimitFilter(rate_limit_burst, rate_limit_interval))
+
+    root = logging.getLogger()
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    root.addHandler(_root_handler)
+
+    if _listener is not None:
+        _listener.start()
+
+
+def shutdown_logging():
+    """Flush queued records, stop the listener thread and detach the root handler."""
+    global _listener, _root_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _root_handler is not None:
+        logging.getLogger().removeHandler(_root_handler)
+        _root_handler = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,275 @@
+import json
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, tuned for HTTP lookups and downloads
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Size buckets in bytes for payload histograms
+BYTE_BUCKETS: Tuple[float, ...] = (
+    1_000, 10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _format_key(name: str, labels: LabelKey) -> str:
+    """Render a metric name and labels in Prometheus notation."""
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{value}"' for key, value in labels)
+    return f"{name}{{{rendered}}}"
+
+
+class Counter:
+    """Monotonically increasing value."""
+
+    __slots__ = ("name", "labels", "help", "value")
+    kind = "counter"
+
+    def __init__(self, name: str, labels: LabelKey, help: str):
+        self.name = name
+        self.labels = labels
+        self.help = help
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": self.kind, "name": self.name, "labels": dict(self.labels), "value": self.value}
+
+    def merge(self, data: Dict[str, Any]):
+        self.value += data["value"]
+
+    def reset(self):
+        self.value = 0.0
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    __slots__ = ()
+    kind = "gauge"
+
+    def set(self, value: float):
+        self.value = value
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def merge(self, data: Dict[str, Any]):
+        self.value = data["value"]
+
+
+class Histogram:
+    """
+    Bucketed distribution of observed values.
+
+    Observation costs one ``bisect`` and a few additions; percentiles are
+    estimated from the buckets when a snapshot is taken.
+    """
+
+    __slots__ = ("name", "labels", "help", "buckets", "counts", "count", "sum", "min", "max")
+    kind = "histogram"
+
+    def __init__(self, name: str, labels: LabelKey, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.labels = labels
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self.reset()
+
+    def reset(self):
+        # One extra slot for observations above the largest bucket (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall time spent inside the ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate the ``q``-th percentile (0-100) by interpolating within buckets.
+
+        Returns:
+            The estimate, or None if nothing has been observed.
+        """
+        if not self.count:
+            return None
+        rank = q / 100.0 * self.count
+        cumulative = 0
+        lower = self.min
+        for index, bucket_count in enumerate(self.counts):
+            upper = self.buckets[index] if index < len(self.buckets) else self.max
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = max(lower, self.min)
+                upper = min(upper, self.max)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+            lower = upper
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = []
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += bucket_count
+            buckets.append(["+Inf" if bound == float("inf") else bound, cumulative])
+        return {
+            "type": self.kind,
+            "name": self.name,
+            "labels": dict(self.labels),
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": buckets,
+        }
+
+    def merge(self, data: Dict[str, Any]):
+        previous = 0
+        for index, (_, cumulative) in enumerate(data["buckets"]):
+            self.counts[index] += cumulative - previous
+            previous = cumulative
+        self.count += data["count"]
+        self.sum += data["sum"]
+        if data["count"]:
+            self.min = min(self.min, data["min"])
+            self.max = max(self.max, data["max"])
+
+
+class MetricsRegistry:
+    """
+    Process-wide collection of counters, gauges and histograms.
+
+    Metrics are created on first use and looked up by name and labels. Updates
+    are plain attribute arithmetic without locking, which is safe for the
+    asyncio event loop thread and accurate enough for the occasional worker
+    thread.
+    """
+
+    def __init__(self, prefix: str = "animal_scraper"):
+        self.prefix = prefix
+        self._metrics: Dict[Tuple[str, LabelKey], Any] = {}
+
+    def _get(self, cls, name: str, help: str, labels: Optional[Dict[str, str]], **kwargs):
+        label_key: LabelKey = tuple(sorted(labels.items())) if labels else ()
+        key = (name, label_key)
+        metric = self._metrics.get(key)
+        if metric is None:
+            metric = self._metrics[key] = cls(name, label_key, help, **kwargs)
+        elif type(metric) is not cls:
+            raise ValueError(f"Metric {name} already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None) -> Counter:
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None) -> Gauge:
+        return self._get(Gauge, name, help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str = "",
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get(Histogram, name, help, labels, buckets=buckets)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return every metric's current state, keyed by its Prometheus-style name."""
+        return {
+            _format_key(name, labels): metric.snapshot()
+            for (name, labels), metric in sorted(self._metrics.items())
+        }
+
+    def merge(self, snapshot: Dict[str, Dict[str, Any]]):
+        """Fold a snapshot taken in another process into this registry."""
+        factories = {"counter": self.counter, "gauge": self.gauge}
+        for data in snapshot.values():
+            if data["type"] == "histogram":
+                bounds = [bound for bound, _ in data["buckets"] if bound != "+Inf"]
+                metric = self.histogram(data["name"], labels=data["labels"], buckets=bounds)
+            else:
+                metric = factories[data["type"]](data["name"], labels=data["labels"])
+            metric.merge(data)
+
+    def reset(self):
+        """Zero every metric; modules keep their references to the metric objects."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def to_json(self) -> str:
+        return json.dumps({"timestamp": time.time(), "metrics": self.snapshot()}, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        lines = []
+        described = set()
+        for (name, labels), metric in sorted(self._metrics.items()):
+            full_name = f"{self.prefix}_{name}" if self.prefix else name
+            if full_name not in described:
+                described.add(full_name)
+                if metric.help:
+                    lines.append(f"# HELP {full_name} {metric.help}")
+                lines.append(f"# TYPE {full_name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                cumulative = 0
+                for bound, bucket_count in zip(metric.buckets + (float("inf"),), metric.counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f"{_format_key(full_name + '_bucket', labels + (('le', le),))} {cumulative}")
+                lines.append(f"{_format_key(full_name + '_sum', labels)} {metric.sum}")
+                lines.append(f"{_format_key(full_name + '_count', labels)} {metric.count}")
+            else:
+                lines.append(f"{_format_key(full_name, labels)} {metric.value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, base_path: Path) -> Tuple[Path, Path]:
+        """
+        Write JSON and Prometheus snapshots next to ``base_path``.
+
+        Args:
+            base_path: Path whose suffix is replaced by '.metrics.json' / '.metrics.prom'
+
+        Returns:
+            Tuple of (json_path, prometheus_path)
+        """
+        base_path = Path(base_path)
+        json_path = base_path.with_suffix(".metrics.json")
+        prom_path = base_path.with_suffix(".metrics.prom")
+        json_path.write_text(self.to_json(), encoding="utf-8")
+        prom_path.write_text(self.to_prometheus(), encoding="utf-8")
+        return json_path, prom_path
+
+
+REGISTRY = MetricsRegistry()
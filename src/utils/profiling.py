@@ -0,0 +1,292 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from src.utils.logger import get_logger
+from src.utils.metrics import Histogram
+
+logger = get_logger(__name__)
+
+IDLE_STAGE = "idle"
+
+# Leaf frames (function, file) of a thread waiting for work rather than running:
+# the event loop blocked in its selector, or a pool thread waiting for a job
+IDLE_FRAMES = {("select", "selectors.py"), ("_worker", "thread.py")}
+
+# Name prefixes of the executor threads sampled besides the loop thread: the
+# loop's default executor (asyncio.to_thread) and the article parse pool
+EXECUTOR_THREAD_PREFIXES = ("asyncio_", "article-parse")
+
+# Event-loop lag buckets in seconds
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """
+    Collects the 'Executing ... took N seconds' warnings asyncio emits in debug mode.
+
+    When the configured log level would drop those warnings, the profiler
+    lowers the asyncio logger to WARNING and turns off its propagation; the
+    handler then passes records at or above ``forward_level`` on to the parent
+    handlers itself, so normal output still follows the configured level.
+    """
+
+    def __init__(self, profiler: "Profiler"):
+        super().__init__(logging.WARNING)
+        self.profiler = profiler
+        self.forward_level: Optional[int] = None
+
+    def emit(self, record: logging.LogRecord):
+        message = record.getMessage()
+        if message.startswith("Executing "):
+            self.profiler.slow_callbacks.append({
+                "stage": self.profiler.current_stage,
+                "message": message,
+            })
+        if self.forward_level is not None and record.levelno >= self.forward_level:
+            logging.getLogger("asyncio").parent.handle(record)
+
+
+class Profiler:
+    """
+    Sampling profiler for the event-loop thread.
+
+    While running it:
+
+    - samples the Python stacks of the loop thread and of the executor threads
+      (``asyncio.to_thread`` and the article parse pool) every
+      ``sample_interval`` seconds and aggregates collapsed stacks per pipeline
+      stage (the ``frame;frame;frame count`` format read by flamegraph.pl and
+      speedscope); executor stacks start with ``[<pool>]``. Samples of a
+      thread waiting for work (the loop in its selector, an idle pool thread)
+      are only counted as idle, so the stacks show where time is spent
+      running. Process pool workers are not sampled.
+    - enables asyncio debug mode so callbacks slower than
+      ``slow_callback_duration`` are reported
+    - measures event-loop lag by scheduling a timer every ``lag_interval``
+      seconds and recording how late it fires
+
+    Nothing is created unless a Profiler is constructed, so runs without
+    ``--profile`` pay no cost.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        sample_interval: float = 0.005,
+        lag_interval: float = 0.05,
+        slow_callback_duration: float = 0.1,
+    ):
+        self.output_dir = Path(output_dir)
+        self.sample_interval = sample_interval
+        self.lag_interval = lag_interval
+        self.slow_callback_duration = slow_callback_duration
+
+        self.current_stage = IDLE_STAGE
+        self.stacks: Dict[str, Counter] = defaultdict(Counter)
+        self.idle_samples: Counter = Counter()
+        self.stage_times: Dict[str, float] = defaultdict(float)
+        self.lag = Histogram("event_loop_lag_seconds", (), "Event loop lag", LAG_BUCKETS)
+        self.lag_by_stage: Dict[str, Histogram] = {}
+        self.slow_callbacks: List[Dict[str, str]] = []
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._lag_task: Optional[asyncio.Task] = None
+        self._slow_handler = _SlowCallbackHandler(self)
+        self._saved_debug = False
+        self._saved_slow_duration = 0.1
+        self._saved_asyncio_level = logging.NOTSET
+        self._saved_asyncio_propagate = True
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Attribute samples, lag and wall time inside the block to ``name``."""
+        previous = self.current_stage
+        self.current_stage = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_times[name] += time.perf_counter() - start
+            self.current_stage = previous
+
+    async def start(self):
+        """Start sampling the running loop's thread and measuring its lag."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+
+        self._saved_debug = self._loop.get_debug()
+        self._saved_slow_duration = self._loop.slow_callback_duration
+        self._loop.set_debug(True)
+        self._loop.slow_callback_duration = self.slow_callback_duration
+        asyncio_logger = logging.getLogger("asyncio")
+        self._saved_asyncio_level = asyncio_logger.level
+        self._saved_asyncio_propagate = asyncio_logger.propagate
+        effective_level = asyncio_logger.getEffectiveLevel()
+        if effective_level > logging.WARNING:
+            # e.g. --log-level ERROR would drop the slow-callback warnings
+            asyncio_logger.setLevel(logging.WARNING)
+            asyncio_logger.propagate = False
+            self._slow_handler.forward_level = effective_level
+        asyncio_logger.addHandler(self._slow_handler)
+
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+        self._lag_task = asyncio.create_task(self._measure_lag())
+
+    async def stop(self):
+        """Stop sampling and restore the loop's debug and asyncio logger settings."""
+        self._stop.set()
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            await asyncio.gather(self._lag_task, return_exceptions=True)
+        if self._sampler is not None:
+            self._sampler.join()
+        asyncio_logger = logging.getLogger("asyncio")
+        asyncio_logger.removeHandler(self._slow_handler)
+        asyncio_logger.setLevel(self._saved_asyncio_level)
+        asyncio_logger.propagate = self._saved_asyncio_propagate
+        self._slow_handler.forward_level = None
+        if self._loop is not None:
+            self._loop.set_debug(self._saved_debug)
+            self._loop.slow_callback_duration = self._saved_slow_duration
+
+    def _sample(self):
+        """Sampler thread: record the current stacks of the loop and executor threads."""
+        while not self._stop.wait(self.sample_interval):
+            stage = self.current_stage
+            frames = sys._current_frames()
+            threads = [(self._loop_thread_id, None)] + [
+                (thread.ident, thread.name.rsplit("_", 1)[0])
+                for thread in threading.enumerate()
+                if thread.name.startswith(EXECUTOR_THREAD_PREFIXES)
+            ]
+            for thread_id, pool in threads:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                if (frame.f_code.co_name, os.path.basename(frame.f_code.co_filename)) in IDLE_FRAMES:
+                    self.idle_samples[stage] += 1
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                if pool is not None:
+                    labels.append(f"[{pool}]")
+                self.stacks[stage][";".join(reversed(labels))] += 1
+
+    async def _measure_lag(self):
+        """Timer task: how late does a sleep of ``lag_interval`` wake up?"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            lag = max(0.0, loop.time() - expected)
+            self.lag.observe(lag)
+            stage_lag = self.lag_by_stage.get(self.current_stage)
+            if stage_lag is None:
+                stage_lag = self.lag_by_stage[self.current_stage] = Histogram(
+                    "event_loop_lag_seconds", (("stage", self.current_stage),), "Event loop lag", LAG_BUCKETS
+                )
+            stage_lag.observe(lag)
+
+    def _top_frames(self, stage: str, limit: int = 10) -> List[Dict[str, object]]:
+        """Leaf frames with the most samples in a stage (self time)."""
+        leaves: Counter = Counter()
+        for stack, count in self.stacks[stage].items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return [{"frame": frame, "samples": count} for frame, count in leaves.most_common(limit)]
+
+    def write_report(self) -> Path:
+        """
+        Write collapsed stacks per stage and a summary report to ``output_dir``.
+
+        Files:
+            <stage>.collapsed   collapsed stacks for one stage
+            all.collapsed       all stages, each stack prefixed with its stage name
+            profile_report.json stage times, samples, top frames, loop lag and slow callbacks
+            profile_report.txt  the same summary in readable form
+
+        Returns:
+            Path to profile_report.json
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        all_lines = []
+        for stage, stacks in self.stacks.items():
+            lines = [f"{stack} {count}" for stack, count in stacks.most_common()]
+            (self.output_dir / f"{stage}.collapsed").write_text("\n".join(lines) + "\n", encoding="utf-8")
+            all_lines.extend(f"{stage};{line}" for line in lines)
+        (self.output_dir / "all.collapsed").write_text("\n".join(all_lines) + "\n", encoding="utf-8")
+
+        stages = sorted(set(self.stage_times) | set(self.stacks) | set(self.idle_samples))
+        report = {
+            "sample_interval": self.sample_interval,
+            "stages": {
+                stage: {
+                    "wall_seconds": self.stage_times.get(stage, 0.0),
+                    "samples": sum(self.stacks[stage].values()),
+                    "idle_samples": self.idle_samples[stage],
+                    "top_frames": self._top_frames(stage),
+                    "loop_lag": self._lag_summary(self.lag_by_stage.get(stage)),
+                }
+                for stage in stages
+            },
+            "loop_lag": self._lag_summary(self.lag),
+            "slow_callbacks": self.slow_callbacks,
+        }
+        json_path = self.output_dir / "profile_report.json"
+        json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        (self.output_dir / "profile_report.txt").write_text(self._format_text(report), encoding="utf-8")
+        logger.info(f"Profile written to {self.output_dir}")
+        return json_path
+
+    @staticmethod
+    def _lag_summary(histogram: Optional[Histogram]) -> Dict[str, Optional[float]]:
+        if histogram is None or not histogram.count:
+            return {"samples": 0, "p50": None, "p99": None, "max": None}
+        return {
+            "samples": histogram.count,
+            "p50": histogram.percentile(50),
+            "p99": histogram.percentile(99),
+            "max": histogram.max,
+        }
+
+    @staticmethod
+    def _format_text(report: Dict) -> str:
+        def ms(value: Optional[float]) -> str:
+            return "-" if value is None else f"{value * 1000:.1f}ms"
+
+        lag = report["loop_lag"]
+        lines = [
+            f"Event loop lag: p50 {ms(lag['p50'])}, p99 {ms(lag['p99'])}, max {ms(lag['max'])}",
+            f"Slow callbacks: {len(report['slow_callbacks'])}",
+            "",
+        ]
+        for stage, data in report["stages"].items():
+            stage_lag = data["loop_lag"]
+            lines.append(
+                f"[{stage}] {data['wall_seconds']:.2f}s wall, {data['samples']} samples "
+                f"({data['idle_samples']} idle), "
+                f"lag p99 {ms(stage_lag['p99'])}, max {ms(stage_lag['max'])}"
+            )
+            for frame in data["top_frames"]:
+                lines.append(f"    {frame['samples']:>6}  {frame['frame']}")
+        return "\n".join(lines) + "\n"
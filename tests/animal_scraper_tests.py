@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from src.core.parser import AnimalDataParser
 from src.core.models import AnimalEntry, ScrapingConfig, get_default_tmp_dir
@@ -6,8 +7,34 @@ from pathlib import Path
 from unittest.mock import AsyncMock
 
 from src.core.scraper import AnimalScraper
-from src.core.models import AnimalEntry
+from src.core.models import AnimalEntry, AnimalRecord, validate_records
 from src.utils.config_loader import load_config
+from src.multi_user.session import UserSession
+from src.multi_user.shared_results import SharedResultStore
+from src.multi_user.job_service import FairScheduler, Job, JobService, JobStatus, create_app
+from src.core.sharding import split_shards
+from src.core.checkpoint import CheckpointError, CheckpointStore
+from src.services.transport import HttpArchive, ReplayMissError
+from src.core.snapshot import row_hashes
+from src.core.sources import merge_triples
+from src.core.models import SourceConfig
+from src.utils.metrics import MetricsRegistry
+from src.utils.profiling import Profiler
+from src.utils.hedging import Hedger
+from src.services.report_server import create_report_app
+from src.initialization.main import run_scraper
+from benchmarks import run as benchmark_suite
+from src.utils.logger import configure_logging, get_logger, shutdown_logging
+import gzip
+import io
+import logging
+import re
+import subprocess
+import sys
+import time
+import json
+from tests.fake_upstream import FakeUpstream
+from aiohttp.test_utils import TestClient, TestServer
 
 @pytest.fixture
 def parser():
@@ -67,7 +94,7 @@ def test_model_validation_and_config_defaults():
 @pytest.mark.asyncio
 async def test_create_animal_entries_basic():
     """
-    Test async creation of AnimalEntry objects, mocking image fetching methods.
+    Test async creation of AnimalRecord objects, mocking image fetching methods.
     Ensures that entries are correctly created with expected values.
     """
     scraper = AnimalScraper()
@@ -85,7 +112,7 @@ async def test_create_animal_entries_basic():
     
     assert len(entries) == 2
     for entry in entries:
-        assert isinstance(entry, AnimalEntry)
+        assert isinstance(entry, AnimalRecord)
         assert entry.animal_name in ["Cat", "Dog"]
         assert entry.collateral_adjective in ["feline", "canine"]
         assert entry.image_url == "https://example.com/image.jpg"
@@ -100,3 +127,929 @@ def test_config_keywords():
     assert "trivial_name_keywords" in config
     assert isinstance(config["collateral_keywords"], list)
     assert isinstance(config["trivial_name_keywords"], list)
+
+
+def test_validate_records_at_boundary():
+    """
+    Test that pipeline records are validated in bulk, that a missing image is
+    represented by None, and that invalid records are dropped.
+    """
+    records = [
+        AnimalRecord("Cat", "feline", "https://example.com/cat.jpg", "/tmp/cat.jpg"),
+        AnimalRecord("Dog", "canine"),
+        AnimalRecord("Bee", "apian", "not a url"),
+        AnimalRecord("  ", "blank"),
+    ]
+    assert not records[1].has_image
+
+    entries = validate_records(records)
+
+    assert [e.animal_name for e in entries] == ["Cat", "Dog", "Bee"]
+    assert all(isinstance(e, AnimalEntry) for e in entries)
+    assert entries[0].image_url == "https://example.com/cat.jpg"
+    assert entries[1].image_url is None and not entries[1].has_image
+    assert entries[2].image_url is None
+    assert AnimalRecord.from_entry(entries[0]) == records[0]
+
+
+@pytest.mark.asyncio
+async def test_user_sessions_share_one_scrape(tmp_path):
+    """
+    Test that concurrent UserSessions share a single in-flight scrape, that the
+    shared image is linked into every user's directory, and that each user gets
+    their own report.
+    """
+    calls = []
+
+    class FakeScraper:
+        def __init__(self, config, **kwargs):
+            self.config = config
+
+        async def collect_records(self):
+            calls.append(self.config.image_dir)
+            await asyncio.sleep(0.05)
+            image = self.config.image_dir / "Cat_1234.jpg"
+            image.write_bytes(b"jpeg")
+            return [AnimalRecord("Cat", "feline", "https://example.com/cat.jpg", str(image))]
+
+    store = SharedResultStore(tmp_path / "shared", freshness_seconds=60, scraper_factory=FakeScraper)
+    sessions = [UserSession(user, shared_store=store, root_dir=tmp_path) for user in ("a", "b")]
+
+    results = await asyncio.gather(*(session.run_scraping_session() for session in sessions))
+    await UserSession("c", shared_store=store, root_dir=tmp_path).run_scraping_session()
+
+    assert calls == [tmp_path / "shared" / "images"]
+    for user, (entries, report_path, _) in zip("ab", results):
+        linked = tmp_path / f"animal_scraper_user_{user}" / "images" / "Cat_1234.jpg"
+        assert entries[0].local_image_path == str(linked)
+        assert linked.read_bytes() == b"jpeg"
+        assert report_path == tmp_path / f"animal_scraper_user_{user}" / "report.html"
+        assert report_path.exists()
+
+
+def test_fair_scheduler_round_robin():
+    """
+    Test that queued jobs are handed out round-robin across users.
+    """
+    scheduler = FairScheduler()
+    for job_id, user in enumerate(["a", "a", "a", "b", "c", "b"]):
+        scheduler.push(Job(str(job_id), user, "https://example.com"))
+
+    order = [scheduler.pop().user_id for _ in range(6)]
+
+    assert order == ["a", "b", "c", "a", "b", "a"]
+    assert scheduler.pop() is None
+
+
+async def _wait_for_jobs(client, statuses, timeout=20.0):
+    """Poll the job service until every job has one of ``statuses``."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        jobs = await (await client.get("/jobs")).json()
+        if all(job["status"] in statuses for job in jobs) or loop.time() > deadline:
+            return jobs
+        await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_job_service_runs_jobs_offline(tmp_path):
+    """
+    Test the job service HTTP API end to end against a local stand-in upstream:
+    quotas, progress reporting and the global outbound concurrency cap.
+    """
+    with FakeUpstream(latency=0.02) as upstream:
+        config = ScrapingConfig(base_url=upstream.list_url, image_dir=tmp_path / "default")
+        service = JobService(
+            workers=2,
+            per_user_quota=2,
+            max_outbound=2,
+            config=config,
+            shared_store=SharedResultStore(tmp_path / "shared", freshness_seconds=0),
+            root_dir=tmp_path,
+        )
+        async with TestClient(TestServer(create_app(service))) as client:
+            for user in ("a", "a", "b"):
+                response = await client.post("/jobs", json={"user_id": user})
+                assert response.status == 202
+            assert (await client.post("/jobs", json={"user_id": "a"})).status == 429
+            assert (await client.post("/jobs", json={})).status == 400
+
+            jobs = await _wait_for_jobs(client, {"succeeded", "failed"})
+
+            assert [job["status"] for job in jobs] == ["succeeded"] * 3
+            for job in jobs:
+                assert job["entry_count"] == 4
+                assert job["progress"] == {"stage": "download", "done": 4, "total": 4}
+            assert (await client.get("/jobs/999")).status == 404
+        assert upstream.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_job_service_cancellation(tmp_path):
+    """
+    Test that queued and running jobs can be cancelled through the HTTP API, and
+    that cancelling the only job waiting on a shared scrape stops that scrape.
+    """
+    with FakeUpstream(latency=0.5) as upstream:
+        config = ScrapingConfig(base_url=upstream.list_url, image_dir=tmp_path / "default")
+        store = SharedResultStore(tmp_path / "shared", freshness_seconds=0)
+        service = JobService(
+            workers=1,
+            config=config,
+            shared_store=store,
+            root_dir=tmp_path,
+        )
+        async with TestClient(TestServer(create_app(service))) as client:
+            running = await (await client.post("/jobs", json={"user_id": "a"})).json()
+            queued = await (await client.post("/jobs", json={"user_id": "b"})).json()
+            await asyncio.sleep(0.1)
+
+            for job in (queued, running):
+                response = await client.delete(f"/jobs/{job['job_id']}")
+                assert response.status == 200
+
+            jobs = await _wait_for_jobs(client, {"cancelled"}, timeout=5.0)
+            assert [job["status"] for job in jobs] == ["cancelled", "cancelled"]
+            served = upstream.requests_served
+            await asyncio.sleep(1.0)
+            assert upstream.requests_served == served
+            assert not store._inflight
+
+
+def test_job_service_forgets_old_finished_jobs(tmp_path, monkeypatch):
+    """
+    Test that terminal jobs are evicted beyond the per-user cap and after the TTL.
+    """
+    service = JobService(root_dir=tmp_path, job_ttl_seconds=60, max_finished_per_user=2)
+    jobs = [Job(str(i), "a", "https://example.com") for i in range(3)] + [Job("3", "b", "https://example.com")]
+    for job in jobs:
+        service.jobs[job.job_id] = job
+        service._finish(job, JobStatus.SUCCEEDED)
+
+    assert [job.job_id for job in service.list_jobs()] == ["1", "2", "3"]
+    with pytest.raises(KeyError):
+        service.get("0")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert service.list_jobs() == []
+
+
+@pytest.mark.asyncio
+async def test_sharded_mode_preserves_order(tmp_path):
+    """
+    Test that the multi-process mode splits work into contiguous shards and
+    merges the records back in the original order.
+    """
+    assert split_shards(list(range(5)), 2) == [[0, 1, 2], [3, 4]]
+    assert split_shards([1], 4) == [[1]]
+
+    animals = [(f"Animal {i}", f"adjective{i}") for i in range(6)]
+    with FakeUpstream(animals) as upstream:
+        config = ScrapingConfig(base_url=upstream.list_url, image_dir=tmp_path, worker_processes=2)
+        records = await AnimalScraper(config).collect_records()
+
+    assert [(r.animal_name, r.collateral_adjective) for r in records] == animals
+    assert all(Path(r.local_image_path).exists() for r in records)
+
+
+def test_metrics_registry_snapshot_and_merge():
+    """
+    Test counters, histograms and label handling in the metrics registry, the
+    Prometheus rendering, and merging snapshots from another process.
+    """
+    registry = MetricsRegistry(prefix="test")
+    registry.counter("lookups_total", "Lookups", {"source": "article"}).inc(3)
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 2.0):
+        histogram.observe(value)
+
+    snapshot = registry.snapshot()
+    assert snapshot['lookups_total{source="article"}']["value"] == 3
+    assert snapshot["latency_seconds"]["count"] == 4
+    assert snapshot["latency_seconds"]["buckets"] == [[0.1, 1], [1.0, 3], ["+Inf", 4]]
+    assert 0.1 <= snapshot["latency_seconds"]["p50"] <= 1.0
+
+    prometheus = registry.to_prometheus()
+    assert "# TYPE test_latency_seconds histogram" in prometheus
+    assert 'test_latency_seconds_bucket{le="+Inf"} 4' in prometheus
+    assert 'test_lookups_total{source="article"} 3.0' in prometheus
+
+    registry.merge(snapshot)
+    assert registry.counter("lookups_total", labels={"source": "article"}).value == 6
+    assert histogram.count == 8 and histogram.max == 2.0
+
+
+@pytest.mark.asyncio
+async def test_scrape_writes_metrics_snapshots(tmp_path):
+    """
+    Test that a full run writes JSON and Prometheus metrics snapshots that
+    include the instrumented lookup and download metrics.
+    """
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+        )
+        await AnimalScraper(config).scrape_and_generate_report()
+
+    metrics = json.loads((tmp_path / "report.metrics.json").read_text())["metrics"]
+    assert metrics['image_lookup_hits_total{source="article"}']["value"] >= 4
+    assert metrics["image_downloads_total"]["value"] >= 4
+    assert metrics['stage_duration_seconds{stage="download"}']["count"] >= 1
+    assert metrics["report_entries"]["value"] == 4
+    assert "animal_scraper_image_download_duration_seconds_count" in (tmp_path / "report.metrics.prom").read_text()
+
+
+def _busy_wait(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_profiler_detects_blocking_work(tmp_path):
+    """
+    Test that the profiler attributes samples to stages, reports slow callbacks
+    (even when the log level hides warnings) and loop lag caused by blocking
+    work, samples executor threads, counts the idle loop separately and writes
+    collapsed stacks.
+    """
+    # As with --log-level ERROR, which would otherwise drop asyncio's warnings
+    asyncio_logger = logging.getLogger("asyncio")
+    asyncio_logger.setLevel(logging.ERROR)
+    try:
+        profiler = Profiler(tmp_path, sample_interval=0.002, lag_interval=0.01, slow_callback_duration=0.05)
+        await profiler.start()
+        await asyncio.sleep(0.03)
+        with profiler.stage("parse"):
+            time.sleep(0.2)
+            await asyncio.sleep(0.03)
+        with profiler.stage("lookup"):
+            await asyncio.to_thread(_busy_wait, 0.1)
+        await profiler.stop()
+        assert asyncio_logger.level == logging.ERROR and asyncio_logger.propagate
+    finally:
+        asyncio_logger.setLevel(logging.NOTSET)
+    report = json.loads(profiler.write_report().read_text())
+
+    assert report["stages"]["parse"]["samples"] > 0
+    # The loop waiting in its selector is idle, not a hot frame
+    assert report["stages"]["lookup"]["idle_samples"] > 0
+    assert all("selectors.py" not in frame["frame"] for frame in report["stages"]["lookup"]["top_frames"])
+    lookup = (tmp_path / "lookup.collapsed").read_text()
+    assert any(line.startswith("[asyncio];") and "_busy_wait" in line for line in lookup.splitlines())
+    assert report["stages"]["parse"]["loop_lag"]["max"] >= 0.1
+    assert any(callback["stage"] == "parse" for callback in report["slow_callbacks"])
+    collapsed = (tmp_path / "parse.collapsed").read_text()
+    assert "test_profiler_detects_blocking_work" in collapsed
+    assert (tmp_path / "all.collapsed").exists()
+
+
+@pytest.mark.asyncio
+async def test_profile_mode_runs_pipeline(tmp_path):
+    """
+    Test that the --profile code path profiles every pipeline stage of a run.
+    """
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+        )
+        entries, _, _ = await run_scraper(AnimalScraper(config), tmp_path / "profile")
+
+    report = json.loads((tmp_path / "profile" / "profile_report.json").read_text())
+    assert len(entries) == 4
+    assert {"fetch", "parse", "lookup", "download", "report"} <= set(report["stages"])
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_resume_after_last_stage(tmp_path):
+    """
+    Test that single stages write checkpoints, that resuming skips the
+    checkpointed stages, and that checkpoints of another source are rejected.
+    """
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        scraper = AnimalScraper(config)
+        await scraper.run_stage("fetch")
+        triples = await scraper.run_stage("parse")
+        store = CheckpointStore(tmp_path / "checkpoints", str(config.base_url))
+        assert store.last_completed() == "parse"
+        assert store.load("parse") == triples
+
+        served = upstream.requests_served
+        entries, _, _ = await scraper.scrape_and_generate_report(resume=True)
+
+    # Four article lookups and four image downloads; the list page is not fetched again
+    assert upstream.requests_served - served == 8
+    assert len(entries) == 4 and all(entry.local_image_path for entry in entries)
+    assert store.last_completed() == "download"
+    assert [record.animal_name for record in store.load("download")] == [entry.animal_name for entry in entries]
+    with pytest.raises(CheckpointError):
+        CheckpointStore(tmp_path / "checkpoints", "https://example.org/other").load("fetch")
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_offline(tmp_path):
+    """
+    Test that a recorded run can be replayed from the archive with the upstream
+    gone, producing the same entries and image bytes, and that the archive is
+    closed after each run and appended to by the next.
+    """
+    archive = tmp_path / "run.archive"
+    with FakeUpstream(image_size=256) as upstream:
+        recorded_config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "recorded",
+            output_file=tmp_path / "recorded.html",
+            http_mode="record",
+            http_archive=archive,
+        )
+        scraper = AnimalScraper(recorded_config.copy(update={"checkpoint_dir": tmp_path / "checkpoints"}))
+        await scraper.run_stage("fetch")
+        recording = scraper.transport.archive
+        recorded, _, _ = await scraper.scrape_and_generate_report(resume=True)
+        served = upstream.requests_served
+    # Each run closes the archive; the second one appended to the first
+    assert recording.closed and scraper.transport._archive is None
+
+    replay_config = recorded_config.copy(update={
+        "image_dir": tmp_path / "replayed",
+        "output_file": tmp_path / "replayed.html",
+        "http_mode": "replay",
+    })
+    replayed, _, _ = await AnimalScraper(replay_config).scrape_and_generate_report()
+
+    replay_archive = HttpArchive(archive, "replay")
+    assert len(replay_archive) == served
+    assert [(e.animal_name, e.image_url) for e in replayed] == [(e.animal_name, e.image_url) for e in recorded]
+    for before, after in zip(recorded, replayed):
+        assert Path(after.local_image_path).read_bytes() == Path(before.local_image_path).read_bytes()
+    with pytest.raises(ReplayMissError):
+        replay_archive.get("GET", "http://127.0.0.1:1/missing")
+    replay_archive.close()
+    with pytest.raises(ValidationError):
+        ScrapingConfig(http_mode="replay")
+
+
+def test_row_hashes_group_triples_by_row():
+    """
+    Test that a row's hash covers all of its adjectives and links.
+    """
+    triples = [("Cat", "feline", ["/wiki/Cat"]), ("Ant", "formic", []), ("Ant", "myrmecine", [])]
+    hashes = row_hashes(triples)
+    assert list(hashes) == ["Cat", "Ant"]
+    assert row_hashes(triples[:2])["Ant"] != hashes["Ant"]
+    assert row_hashes([("Cat", "feline", ["/wiki/Felis"])])["Cat"] != hashes["Cat"]
+
+
+@pytest.mark.asyncio
+async def test_diff_mode_only_fetches_changed_rows(tmp_path):
+    """
+    Test that a diff run looks up and downloads only added and changed rows,
+    reuses unchanged entries and reports the row counts.
+    """
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+            snapshot_file=tmp_path / "snapshot.json.gz",
+        )
+        first, _, _ = await AnimalScraper(config).scrape_and_generate_report()
+
+        # Bear is removed, Wolf changes its adjective and Fox is added
+        upstream.animals = [("Cat", "feline"), ("Dog", "canine"), ("Wolf", "wolfish"), ("Fox", "vulpine")]
+        upstream.titles = {name for name, _ in upstream.animals}
+        served = upstream.requests_served
+        scraper = AnimalScraper(config)
+        second, _, _ = await scraper.scrape_and_generate_report()
+
+    # List page, then one article lookup and one image for Wolf and Fox each
+    assert upstream.requests_served - served == 5
+    assert scraper.last_diff.counts() == {"added": 1, "removed": 1, "changed": 1, "unchanged": 2}
+    assert [(e.animal_name, e.collateral_adjective) for e in second] == upstream.animals
+    assert second[0] == first[0] and all(entry.local_image_path for entry in second)
+
+
+def test_merge_triples_dedupes_across_sources():
+    """
+    Test that duplicates across sources are kept once with their links combined.
+    """
+    merged = merge_triples([
+        [("Cat", "feline", ["/wiki/Cat"]), ("Dog", "canine", [])],
+        [("cat", "Feline", ["/wiki/Felis"]), ("Fox", "vulpine", [])],
+    ])
+    assert merged == [("Cat", "feline", ["/wiki/Cat", "/wiki/Felis"]), ("Dog", "canine", []), ("Fox", "vulpine", [])]
+
+
+@pytest.mark.asyncio
+async def test_multiple_sources_parsed_in_pool_and_merged(tmp_path):
+    """
+    Test that a URL source and a saved dump with its own column keywords are
+    parsed in worker processes and merged into one deduplicated entry set.
+    """
+    dump = tmp_path / "dump.html"
+    dump.write_text(
+        '<table class="wikitable"><tr><th>Creature</th><th>Adjective form</th></tr>'
+        '<tr><td><a href="/wiki/Cat">Cat</a></td><td>feline</td></tr>'
+        '<tr><td><a href="/wiki/Fox">Fox</a></td><td>vulpine</td></tr></table>',
+        encoding="utf-8",
+    )
+    with FakeUpstream(animals=[("Cat", "feline"), ("Dog", "canine"), ("Fox", "vulpine")]) as upstream:
+        config = ScrapingConfig(
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+            sources=[
+                SourceConfig(url=upstream.list_url),
+                SourceConfig(
+                    path=dump,
+                    site_url=upstream.base_url,
+                    collateral_keywords=["adjective form"],
+                    trivial_name_keywords=["creature"],
+                ),
+            ],
+            parse_processes=2,
+        )
+        entries, _, _ = await AnimalScraper(config).scrape_and_generate_report()
+
+    assert [entry.animal_name for entry in entries] == ["Cat", "Dog", "Fox"]
+    assert all(entry.local_image_path for entry in entries)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_article_parsing_runs_in_pool(tmp_path, executor):
+    """
+    Test that image lookups give the same results with article pages parsed in
+    a thread or process pool.
+    """
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            article_parse_executor=executor,
+            article_parse_workers=2,
+        )
+        triples = [(name, adjective, [f"{upstream.base_url}/wiki/{name}"]) for name, adjective in upstream.animals]
+        records = await AnimalScraper(config)._create_animal_entries(triples)
+
+    assert [record.image_url for record in records] == [
+        f"{upstream.base_url}/images/{name}.jpg" for name, _ in upstream.animals
+    ]
+
+
+
+@pytest.mark.asyncio
+async def test_hedger_sends_second_attempt_when_slow():
+    """
+    Test that a request slower than the latency percentile is sent again and
+    the faster second attempt wins while the first is cancelled, and that a
+    hedge is only sent when a limiter slot is free.
+    """
+    hedger = Hedger(percentile=90, min_samples=3)
+    for _ in range(3):
+        hedger.tracker("lookup").observe(0.01)
+
+    attempts = []
+    cancelled = []
+
+    async def attempt():
+        attempts.append(len(attempts))
+        try:
+            await asyncio.sleep(5 if len(attempts) == 1 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return len(attempts)
+
+    start = time.perf_counter()
+    assert await hedger.run("lookup", attempt) == 2
+    assert time.perf_counter() - start < 1
+    assert cancelled == [True]
+
+    # The caller holds the only slot of the limiter, so the hedge is skipped
+    limiter = asyncio.Semaphore(1)
+    hedger.slots = lambda kind: [limiter]
+    attempts.clear()
+
+    async def single_attempt():
+        attempts.append(len(attempts))
+        await asyncio.sleep(0.05)
+        return len(attempts)
+
+    async with limiter:
+        assert await hedger.run("lookup", single_attempt) == 1
+    assert attempts == [0]
+    # With a free slot the hedge takes it and gives it back
+    attempts.clear()
+    assert await hedger.run("lookup", attempt) == 2
+    assert cancelled == [True, True]
+    assert not limiter.locked()
+
+
+@pytest.mark.asyncio
+async def test_article_lookup_releases_limiter_before_parsing(tmp_path):
+    """
+    Test that the outbound request limiter is released once the article body
+    is read, before the page is handed to the parse executor.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    limiter = asyncio.Semaphore(1)
+    held_while_parsing = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            held_while_parsing.append(limiter.locked())
+            return super().submit(fn, *args, **kwargs)
+
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(base_url=upstream.list_url, image_dir=tmp_path)
+        scraper = AnimalScraper(config, request_limiter=limiter)
+        with RecordingExecutor(max_workers=1) as executor:
+            async with scraper.transport.client_session(10, limit_per_host=2) as session:
+                image_url = await scraper._lookup_image(session, executor, "Cat", [f"{upstream.base_url}/wiki/Cat"])
+
+    assert image_url == f"{upstream.base_url}/images/Cat.jpg"
+    assert held_while_parsing == [False]
+
+
+@pytest.mark.asyncio
+async def test_deadline_reports_partial_results(tmp_path):
+    """
+    Test that a run past its deadline still writes a report, with the entries
+    whose lookup or download was cut short marked as unfinished.
+    """
+    with FakeUpstream(latency=0.3) as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+            max_concurrent_downloads=1,
+            deadline_seconds=2.0,
+        )
+        start = time.perf_counter()
+        entries, report_path, _ = await AnimalScraper(config).scrape_and_generate_report()
+
+    assert time.perf_counter() - start < 3
+    assert [entry.animal_name for entry in entries] == [name for name, _ in upstream.animals]
+    unfinished = [entry for entry in entries if entry.incomplete]
+    assert 0 < len(unfinished) < len(entries)
+    assert all(not entry.local_image_path for entry in unfinished)
+    assert "Unfinished (deadline)" in report_path.read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_blocking_fallback_in_workers(tmp_path):
+    """
+    Test that a sharded run returns shortly after its deadline even when the
+    workers are stuck in blocking fallback lookups.
+    """
+    # Rows without links go straight to the blocking fallback lookup
+    list_html = (
+        '<html><body><table class="wikitable"><tr><th>Animal</th><th>Collateral adjective</th></tr>'
+        "<tr><td>Cat</td><td>feline</td></tr><tr><td>Dog</td><td>canine</td></tr></table></body></html>"
+    )
+    with FakeUpstream(list_html=list_html) as upstream:
+
+        def slow_down_after_parse(stage, done, total):
+            if stage == "parse" and done == total:
+                upstream.latency = 6.0
+
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path,
+            worker_processes=2,
+            deadline_seconds=1.0,
+        )
+        start = time.perf_counter()
+        records = await AnimalScraper(config, progress_callback=slow_down_after_parse).collect_records()
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 4
+    assert [record.animal_name for record in records] == ["Cat", "Dog"]
+    assert all(record.incomplete for record in records)
+
+
+@pytest.mark.asyncio
+async def test_shared_store_does_not_cache_partial_results(tmp_path):
+    """
+    Test that results cut short by a deadline are not reused by the next session,
+    and that sessions whose result-affecting settings differ do not share results.
+    """
+    store = SharedResultStore(tmp_path / "shared", freshness_seconds=300)
+    with FakeUpstream(latency=0.2) as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            max_concurrent_downloads=1,
+            deadline_seconds=0.5,
+        )
+        partial = await store.get_records(config)
+        assert any(record.incomplete for record in partial)
+        served = upstream.requests_served
+        await store.get_records(config)
+        assert upstream.requests_served > served
+
+        full_config = config.copy(update={"deadline_seconds": None, "max_concurrent_downloads": 10})
+        full = await store.get_records(full_config)
+        assert not any(record.incomplete for record in full)
+        other_user = full_config.copy(update={"image_dir": tmp_path / "other", "output_file": tmp_path / "other.html"})
+        assert await store.get_records(other_user) is full
+
+        replay_config = full_config.copy(update={"http_mode": "replay", "http_archive": tmp_path / "missing.archive"})
+        with pytest.raises(FileNotFoundError):
+            await store.get_records(replay_config)
+
+
+@pytest.mark.asyncio
+async def test_iter_entries_streams_and_report_consumes_stream(tmp_path):
+    """
+    Test that iter_entries yields every entry with its image downloaded, and
+    that the streamed report lists the entries in page order.
+    """
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+        )
+        streamed = [entry async for entry in AnimalScraper(config).iter_entries()]
+        entries, report_path, _ = await AnimalScraper(config).scrape_and_generate_report(stream=True)
+
+    assert sorted(entry.animal_name for entry in streamed) == sorted(name for name, _ in upstream.animals)
+    assert all(entry.local_image_path and Path(entry.local_image_path).exists() for entry in streamed)
+    assert [(entry.animal_name, entry.collateral_adjective) for entry in entries] == upstream.animals
+    assert report_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_iter_entries_applies_backpressure_and_cancels(tmp_path):
+    """
+    Test that a stalled consumer stops the workers from starting new rows and
+    that leaving the loop early cancels the outstanding work.
+    """
+    animals = [(f"Animal{i}", f"adjective{i}") for i in range(40)]
+    with FakeUpstream(animals=animals) as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            max_concurrent_downloads=2,
+        )
+        stream = AnimalScraper(config).iter_entries(buffer_size=1)
+        await stream.__anext__()
+        await asyncio.sleep(0.5)
+        # List page plus two requests per row: the consumed one, the buffered
+        # one and one blocked in each worker
+        assert upstream.requests_served <= 1 + 2 * 4
+        await stream.aclose()
+        served = upstream.requests_served
+        await asyncio.sleep(0.2)
+
+    assert upstream.requests_served == served
+    assert served < 1 + 2 * len(animals)
+
+
+@pytest.mark.asyncio
+async def test_iter_entries_failure_stops_other_workers(tmp_path):
+    """
+    Test that when one worker fails, the stream raises its error and the other
+    workers are stopped before the sessions they use are closed.
+    """
+    sessions_closed = []
+
+    async def download_image(session, record):
+        if record.animal_name == "Cat":
+            raise RuntimeError("disk full")
+        await asyncio.sleep(0.2)
+        sessions_closed.append(session.closed)
+
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(base_url=upstream.list_url, image_dir=tmp_path / "images")
+        scraper = AnimalScraper(config)
+        scraper.image_downloader.download_image = download_image
+        with pytest.raises(RuntimeError, match="disk full"):
+            async for _ in scraper.iter_entries():
+                pass
+        await asyncio.sleep(0.4)
+
+    assert sessions_closed == []
+
+WIKITEXT_PARITY_CASES = [
+    (
+        # Attributes, references, templates, piped links and link trails
+        '<table class="wikitable sortable"><tr><th>Animal</th><th style="width:20%">Collateral adjective</th></tr>'
+        '<tr><td><a href="/wiki/Domestic_cat" title="Domestic cat">Cats</a><sup class="reference">'
+        '<a href="#cite_note-1">[1]</a></sup></td><td><i>feline</i>, <b>felid</b></td></tr>'
+        '<tr><td style="background:#eee"><a href="/wiki/Wolf">Grey wolf</a> (<a href="/wiki/Canis">Canis</a>)</td>'
+        '<td>lupine</td></tr></table>',
+        '{| class="wikitable sortable"\n'
+        '! Animal !! style="width:20%" | Collateral adjective\n'
+        '|-\n'
+        "| [[Domestic cat|Cat]]s<ref>{{cite book |title=Cats}}</ref> || ''feline'', '''felid'''\n"
+        '|-\n'
+        '| style="background:#eee" | [[wolf|Grey wolf]] ([[Canis]]) <!-- genus -->\n'
+        '| lupine\n'
+        '|}',
+    ),
+    (
+        # Multi-line cells, line breaks, entities and a table without the adjective column
+        '<table class="wikitable"><tr><th>Term</th></tr><tr><td>Young</td></tr></table>'
+        '<table class="wikitable"><tr><th>Common name</th><th>Collateral adjective</th></tr>'
+        '<tr><td><a href="/wiki/Red_fox">Red&nbsp;fox</a></td><td>vulpine<br>alopecoid</td></tr></table>',
+        '{| class="wikitable"\n! Term\n|-\n| Young\n|}\n'
+        'Text between the tables.\n'
+        '{| class="wikitable"\n'
+        '|-\n'
+        '! Common name\n'
+        '! Collateral adjective\n'
+        '|-\n'
+        '|\n[[red fox|Red&nbsp;fox]]\n'
+        '| vulpine<br>alopecoid\n'
+        '|}',
+    ),
+]
+
+
+@pytest.mark.parametrize("html, wikitext", WIKITEXT_PARITY_CASES)
+def test_wikitext_parser_matches_html_parser(parser, html, wikitext):
+    """
+    Test that parsing the wikitext of a page gives the same triples as parsing
+    its rendered HTML.
+    """
+    expected = parser.parse_wikipedia_page(html)
+    assert expected
+    assert parser.parse_wikitext(wikitext) == expected
+
+
+def test_wikitext_parser_matches_html_parser_on_fixture(parser):
+    """
+    Test parity on the benchmark fixture pair of the full list page.
+    """
+    fixtures = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+    expected = parser.parse_wikipedia_page((fixtures / "list_of_animal_names.html").read_text(encoding="utf-8"))
+    assert len(expected) > 80
+    assert parser.parse_wikitext((fixtures / "list_of_animal_names.wikitext").read_text(encoding="utf-8")) == expected
+
+
+@pytest.mark.asyncio
+async def test_wikitext_source_fetches_raw_page(tmp_path):
+    """
+    Test that a wikitext source is fetched with action=raw and gives the same
+    entries as the rendered page.
+    """
+    with FakeUpstream() as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            image_dir=tmp_path / "images",
+            output_file=tmp_path / "report.html",
+            source_format="wikitext",
+        )
+        assert config.source_id() == f"{upstream.base_url}/w/index.php?title=List_of_animal_names&action=raw"
+        entries, _, _ = await AnimalScraper(config).scrape_and_generate_report()
+
+    assert [(entry.animal_name, entry.collateral_adjective) for entry in entries] == upstream.animals
+    assert all(entry.local_image_path for entry in entries)
+
+@pytest.mark.asyncio
+async def test_report_server_serves_precompressed_report_and_cached_images(tmp_path):
+    """
+    Test that the report links images relatively by content hash and that the
+    server sends the precompressed report, immutable images with ETags, and
+    byte ranges.
+    """
+    with FakeUpstream(image_size=1000) as upstream:
+        config = ScrapingConfig(
+            base_url=upstream.list_url,
+            # Downloads next to the report, as UserSession lays them out
+            image_dir=tmp_path / "site" / "images",
+            output_file=tmp_path / "site" / "report.html",
+        )
+        await AnimalScraper(config).scrape_and_generate_report()
+        assets = list((tmp_path / "site" / "assets").iterdir())
+        # Published as hard links of the downloads
+        assert all(any(asset.samefile(image) for image in config.image_dir.iterdir()) for asset in assets)
+        # Downloading again replaces the files instead of rewriting the published content
+        upstream.image_size = 2000
+        await AnimalScraper(config).collect_records()
+        assert all(image.stat().st_size == 2000 for image in config.image_dir.iterdir())
+        assert all(asset.stat().st_size == 1000 for asset in assets)
+
+    html = config.output_file.read_text(encoding="utf-8")
+    assert "file://" not in html
+    image_urls = re.findall(r'src="(assets/[0-9a-f]{20}\.jpg)"', html)
+    assert len(image_urls) == len(upstream.animals)
+    # Published files live apart from the downloads
+    assert sorted(f"assets/{path.name}" for path in assets) == sorted(image_urls)
+    assert len(list(config.image_dir.iterdir())) == len(upstream.animals)
+    assert config.output_file.with_name("report.html.gz").exists()
+
+    async with TestClient(TestServer(create_report_app(config.output_file))) as client:
+        response = await client.get("/", headers={"Accept-Encoding": "gzip"}, auto_decompress=False)
+        assert response.status == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert gzip.decompress(await response.read()).decode("utf-8") == html
+
+        response = await client.get("/" + image_urls[0])
+        assert response.status == 200
+        assert "immutable" in response.headers["Cache-Control"]
+        etag = response.headers["ETag"]
+        body = await response.read()
+        assert len(body) == 1000
+
+        response = await client.get("/" + image_urls[0], headers={"If-None-Match": etag})
+        assert response.status == 304
+
+        response = await client.get("/" + image_urls[0], headers={"Range": "bytes=0-3"})
+        assert response.status == 206
+        assert await response.read() == body[:4]
+
+        assert (await client.get("/assets/..%2Freport.html")).status == 404
+        assert (await client.get("/report.html.gz")).status == 404
+
+def test_benchmark_suite_flags_regressions(tmp_path):
+    """
+    Test a tiny offline benchmark run and the regression check against a baseline.
+    """
+    results = benchmark_suite.run_suite(["parse", "resolve", "download", "report"], [20], error_rate=0.1)
+    assert set(results["results"]) == {"parse", "resolve", "download", "report"}
+    assert results["results"]["parse"]["20"]["seconds"] > 0
+
+    baseline = {"results": {"parse": {"20": {"seconds": results["results"]["parse"]["20"]["seconds"] / 2}}}}
+    regressions = benchmark_suite.compare(results, baseline, tolerance=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("parse @ 20")
+    assert benchmark_suite.compare(results, results, tolerance=0.25) == []
+
+
+def test_logging_pipeline_rate_limits_and_formats_json():
+    """
+    Test that get_logger has no side effects and that configured logging
+    writes JSON lines through the background listener while rate-limiting
+    repetitive per-entry warnings, and that mutable arguments are logged with
+    their state at the time of the call.
+    """
+    root_handlers = list(logging.getLogger().handlers)
+    logger = get_logger("tests.logging")
+    assert logging.getLogger().handlers == root_handlers
+
+    stream = io.StringIO()
+    configure_logging("INFO", json_output=True, rate_limit_burst=3, rate_limit_interval=60, stream=stream)
+    try:
+        for i in range(50):
+            logger.warning("Error downloading image for %s: %s", f"Animal {i}", "timeout")
+        logger.debug("filtered %s", "debug")
+        record = AnimalRecord("Cat", "feline")
+        logger.error("Scrape failed for %r", record)
+        record.image_url = "https://example.com/cat.jpg"
+    finally:
+        shutdown_logging()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["level"] for line in lines] == ["WARNING"] * 3 + ["ERROR"]
+    assert lines[0]["message"] == "Error downloading image for Animal 0: timeout"
+    assert "image_url=None" in lines[-1]["message"]
+    assert lines[0]["logger"] == "tests.logging"
+    assert logging.getLogger().handlers == root_handlers
+
+    # Pool workers write directly, with no listener thread left to flush
+    stream = io.StringIO()
+    configure_logging("INFO", stream=stream, background=False)
+    try:
+        logger.warning("Worker %s done", 1)
+        assert stream.getvalue().endswith("Worker 1 done\n")
+    finally:
+        shutdown_logging()
+    assert logging.getLogger().handlers == root_handlers
+
+
+def test_parse_only_path_skips_network_stack():
+    """
+    Test that importing the CLI and the parser, and even parsing a page, loads
+    neither the network stack nor pydantic, and that settings.yaml is read lazily.
+    """
+    code = (
+        "import sys\n"
+        "import src.initialization.main, src.core.parser\n"
+        "assert 'yaml' not in sys.modules\n"
+        "from src.core.parser import AnimalDataParser\n"
+        "html = '<table class=\"wikitable\"><tr><th>Animal</th><th>Collateral adjective</th></tr>"
+        "<tr><td>Cat</td><td>feline</td></tr></table>'\n"
+        "assert AnimalDataParser().parse_wikipedia_page(html) == [('Cat', 'feline', [])]\n"
+        "print(sorted(m for m in ('aiohttp', 'requests', 'pydantic') if m in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=Path(__file__).parent.parent
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "[]"
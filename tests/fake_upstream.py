@@ -0,0 +1,178 @@
+"""
+Local stand-in for the Wikipedia pages and images the scraper talks to.
+
+The server runs on its own event loop in a background thread so that it also
+answers blocking ``requests`` calls made from the code under test.
+"""
+
+import asyncio
+import random
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+
+DEFAULT_ANIMALS: List[Tuple[str, str]] = [
+    ("Cat", "feline"),
+    ("Dog", "canine"),
+    ("Wolf", "lupine"),
+    ("Bear", "ursine"),
+]
+
+
+class FakeUpstream:
+    """
+    Serves a list page (rendered, or as wikitext via ``/w/index.php?action=raw``),
+    one article per animal and one image per article.
+
+    Args:
+        animals: (name, adjective) rows of the generated list page
+        latency: Base delay in seconds added to every response
+        latency_jitter: Extra uniformly distributed delay of up to this many seconds
+        error_rate: Fraction of article and image requests answered with HTTP 503
+        article_paragraphs: Filler paragraphs per article, controlling parse cost
+        image_size: Size in bytes of every served image
+        list_html: Serve this HTML as the list page instead of generating one
+        seed: Seed for the jitter and error decisions
+    """
+
+    def __init__(
+        self,
+        animals: Sequence[Tuple[str, str]] = DEFAULT_ANIMALS,
+        latency: float = 0.0,
+        article_paragraphs: int = 1,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        image_size: int = 0,
+        list_html: Optional[str] = None,
+        seed: int = 0,
+    ):
+        self.animals = list(animals)
+        self.titles = {name.replace(" ", "_") for name, _ in self.animals}
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.article_paragraphs = article_paragraphs
+        self.image_size = image_size
+        self.list_html = list_html
+        self._random = random.Random(seed)
+        self.errors_served = 0
+        self.requests_served = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.port: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def list_url(self) -> str:
+        return f"{self.base_url}/wiki/List_of_animal_names"
+
+    def list_page(self) -> str:
+        if self.list_html is not None:
+            return self.list_html
+        rows = "".join(
+            f'<tr><td><a href="/wiki/{name.replace(" ", "_")}">{name}</a></td><td>{adjective}</td></tr>'
+            for name, adjective in self.animals
+        )
+        return (
+            '<html><body><table class="wikitable">'
+            "<tr><th>Animal</th><th>Collateral adjective</th></tr>"
+            f"{rows}</table></body></html>"
+        )
+
+    def list_wikitext(self) -> str:
+        rows = "".join(f"|-\n| [[{name}]] || {adjective}\n" for name, adjective in self.animals)
+        return '{| class="wikitable"\n! Animal !! Collateral adjective\n' + rows + "|}\n"
+
+    def article_page(self, title: str) -> str:
+        return (
+            f"<html><body><h1>{title}</h1>"
+            f'<table class="infobox"><tr><td><img src="{self.base_url}/images/{title}.jpg"></td></tr></table>'
+            + '<p>Article <a href="/wiki/Body">body</a> text.</p>' * self.article_paragraphs
+            + "</body></html>"
+        )
+
+    def image_bytes(self, name: str) -> bytes:
+        header = b"\xff\xd8\xff\xe0" + name.encode()
+        return header + b"\0" * max(0, self.image_size - len(header))
+
+    @web.middleware
+    async def _track(self, request: web.Request, handler):
+        self.requests_served += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.latency
+            if self.latency_jitter:
+                delay += self._random.uniform(0, self.latency_jitter)
+            if delay:
+                await asyncio.sleep(delay)
+            is_list_page = request.path.endswith("/List_of_animal_names") or request.path == "/w/index.php"
+            if self.error_rate and not is_list_page and self._random.random() < self.error_rate:
+                self.errors_served += 1
+                raise web.HTTPServiceUnavailable()
+            return await handler(request)
+        finally:
+            self.in_flight -= 1
+
+    async def _handle_wiki(self, request: web.Request) -> web.Response:
+        title = request.match_info["title"]
+        if title == "List_of_animal_names":
+            return web.Response(text=self.list_page(), content_type="text/html")
+        if title not in self.titles:
+            raise web.HTTPNotFound()
+        return web.Response(text=self.article_page(title), content_type="text/html")
+
+    async def _handle_raw(self, request: web.Request) -> web.Response:
+        if request.query.get("title") != "List_of_animal_names" or request.query.get("action") != "raw":
+            raise web.HTTPNotFound()
+        return web.Response(text=self.list_wikitext(), content_type="text/x-wiki")
+
+    async def _handle_image(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.image_bytes(request.match_info["name"]), content_type="image/jpeg")
+
+    def start(self) -> "FakeUpstream":
+        started = threading.Event()
+
+        async def serve():
+            app = web.Application(middlewares=[self._track])
+            app.router.add_get("/wiki/{title}", self._handle_wiki)
+            app.router.add_get("/images/{name}", self._handle_image)
+            app.router.add_get("/w/index.php", self._handle_raw)
+            self._runner = web.AppRunner(app, access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            await site.start()
+            self.port = self._runner.addresses[0][1]
+            started.set()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(serve())
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="fake-upstream", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def __enter__(self) -> "FakeUpstream":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()